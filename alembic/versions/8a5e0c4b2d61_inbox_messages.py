@@ -0,0 +1,39 @@
+"""inbox messages
+
+Revision ID: 8a5e0c4b2d61
+Revises: 3f1c2a9d7b4e
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a5e0c4b2d61'
+down_revision: Union[str, Sequence[str], None] = '3f1c2a9d7b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'inbox_messages',
+        sa.Column('consumer', sa.String(length=255), nullable=False),
+        sa.Column('event_id', sa.Uuid(), nullable=False),
+        sa.Column(
+            'processed_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('consumer', 'event_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('inbox_messages')
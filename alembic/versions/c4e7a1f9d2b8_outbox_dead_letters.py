@@ -0,0 +1,32 @@
+"""outbox dead letters
+
+Revision ID: c4e7a1f9d2b8
+Revises: 8a5e0c4b2d61
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7a1f9d2b8'
+down_revision: Union[str, Sequence[str], None] = '8a5e0c4b2d61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'outbox_messages', sa.Column('failed_at', sa.DateTime(timezone=True), nullable=True)
+    )
+    op.add_column('outbox_messages', sa.Column('error', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('outbox_messages', 'error')
+    op.drop_column('outbox_messages', 'failed_at')
@@ -0,0 +1,66 @@
+"""
+Cost of resolving dependencies from DictContainer before and after .freeze().
+
+Resolves a singleton and a sync factory with `await container.resolve()` on a
+mutable and a frozen container, and with `container.resolve_sync()` on a frozen
+one. Resolution runs on every request and every consumed message.
+
+Usage:
+    uv run python -m benchmarks.container_resolve
+"""
+
+import asyncio
+import time
+
+from src.infrastructure.adapters.dict_container import DictContainer
+
+NUMBER = 1_000_000
+
+
+class Clock:
+    pass
+
+
+class UnitOfWork:
+    pass
+
+
+def new_container() -> DictContainer:
+    container = DictContainer()
+    container.register_singleton(Clock, Clock())
+    container.register_sync_factory(UnitOfWork, UnitOfWork)
+    return container
+
+
+async def measure_resolve(container: DictContainer, interface: type[object]) -> float:
+    started = time.perf_counter()
+    for _ in range(NUMBER):
+        await container.resolve(interface)
+    return time.perf_counter() - started
+
+
+def measure_resolve_sync(container: DictContainer, interface: type[object]) -> float:
+    started = time.perf_counter()
+    for _ in range(NUMBER):
+        container.resolve_sync(interface)
+    return time.perf_counter() - started
+
+
+def report(name: str, elapsed: float) -> None:
+    print(f"{name:<40} {elapsed / NUMBER * 1e9:8.1f} ns/resolve")
+
+
+async def main() -> None:
+    container = new_container()
+    frozen = new_container()
+    frozen.freeze()
+
+    for interface in (Clock, UnitOfWork):
+        name = interface.__name__
+        report(f"{name} await resolve()", await measure_resolve(container, interface))
+        report(f"{name} await resolve(), frozen", await measure_resolve(frozen, interface))
+        report(f"{name} resolve_sync(), frozen", measure_resolve_sync(frozen, interface))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
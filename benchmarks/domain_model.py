@@ -0,0 +1,112 @@
+"""
+Memory and speed of the domain model bases over a large number of instances.
+
+Measures the memory of aggregates with and without `__slots__`, compares
+ValueObject equality with the previous `dataclasses.asdict` comparison, and
+times hashing of value objects and entities, e.g. to deduplicate them in sets.
+Batch jobs hold graphs of this size in memory.
+
+Usage:
+    uv run python -m benchmarks.domain_model
+"""
+
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+from src.domain.aggregates.aggregate import Aggregate
+from src.domain.value_objects.value_object import ValueObject
+
+NUMBER = 1_000_000
+
+type Pair = tuple[object, object]
+
+
+class Order(Aggregate):
+    def __init__(self, id: uuid.UUID, total: int) -> None:
+        super().__init__(id, 1)
+        self.total = total
+
+
+class SlottedOrder(Aggregate):
+    __slots__ = ("total",)
+
+    def __init__(self, id: uuid.UUID, total: int) -> None:
+        super().__init__(id, 1)
+        self.total = total
+
+
+@dataclass(frozen=True, slots=True)
+class Money(ValueObject):
+    amount: int
+    currency: str
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LegacyMoney:
+    amount: int
+    currency: str
+
+    def __eq__(self, value: object) -> bool:
+        if not isinstance(value, LegacyMoney):
+            return False
+        return asdict(value) == asdict(self)
+
+    def __hash__(self) -> int:
+        return hash((self.amount, self.currency))
+
+
+def measure_memory(factory: Callable[[uuid.UUID, int], object], ids: list[uuid.UUID]) -> float:
+    tracemalloc.start()
+    instances = [factory(id, i) for i, id in enumerate(ids)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if len(instances) != NUMBER:
+        raise RuntimeError("Instances were not created")
+    return size / NUMBER
+
+
+def measure(operation: Callable[[object, object], object], pairs: list[Pair]) -> float:
+    started = time.perf_counter()
+    for left, right in pairs:
+        operation(left, right)
+    return (time.perf_counter() - started) / len(pairs) * 1e9
+
+
+def equal(left: object, right: object) -> bool:
+    return left == right
+
+
+def hashes(left: object, right: object) -> int:
+    return hash(left) ^ hash(right)
+
+
+def main() -> None:
+    ids = [uuid.uuid4() for _ in range(NUMBER)]
+    print(f"{'Aggregate, __dict__':<40} {measure_memory(Order, ids):8.1f} B/instance")
+    print(f"{'Aggregate, __slots__':<40} {measure_memory(SlottedOrder, ids):8.1f} B/instance")
+
+    money: list[Pair] = [(Money(i, "USD"), Money(i, "USD")) for i in range(NUMBER)]
+    legacy: list[Pair] = [(LegacyMoney(i, "USD"), LegacyMoney(i, "USD")) for i in range(NUMBER)]
+    orders: list[Pair] = [(SlottedOrder(id, 0), SlottedOrder(id, 0)) for id in ids]
+
+    for name, operation, pairs in (
+        ("ValueObject ==, asdict", equal, legacy),
+        ("ValueObject ==, field tuples", equal, money),
+        ("ValueObject hash, first", hashes, money),
+        ("ValueObject hash, cached", hashes, money),
+        ("Aggregate hash, by id", hashes, orders),
+    ):
+        print(f"{name:<40} {measure(operation, pairs):8.1f} ns/pair")
+
+    started = time.perf_counter()
+    unique = {order for pair in orders for order in pair}
+    if len(unique) != NUMBER:
+        raise RuntimeError("Aggregates with the same id were not deduplicated")
+    print(f"{'Aggregate set of 2M, by id':<40} {time.perf_counter() - started:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
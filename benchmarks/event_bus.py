@@ -0,0 +1,64 @@
+"""
+Throughput of the in-process EventBus, a baseline for the broker overhead.
+
+Publishes events to a single subscriber and measures the time until all of them
+are handled, with zero-copy delivery and with an encode/decode round trip per
+event (the serialization part of a broker hop).
+
+Usage:
+    uv run python -m benchmarks.event_bus
+"""
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from src.application.ports.container import Container
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.adapters.dict_container import DictContainer
+from src.infrastructure.in_memory_event_bus import InMemoryEventBus
+
+NUMBER = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class OrderPlaced(DomainEvent):
+    event_name: str = field(init=False, default="order.placed")
+    order_id: uuid.UUID
+    total: int
+
+
+async def measure(zero_copy: bool) -> float:
+    handled = 0
+
+    async def on_order_placed(_: OrderPlaced, __: Container) -> None:
+        nonlocal handled
+        handled += 1
+
+    event_bus = InMemoryEventBus(DictContainer(), zero_copy=zero_copy)
+    event_bus.subscribe(OrderPlaced, on_order_placed)
+    await event_bus.start()
+
+    events = [OrderPlaced(order_id=uuid.uuid4(), total=i) for i in range(NUMBER)]
+    started = time.perf_counter()
+    await event_bus.publish_many(events)
+    await event_bus.stop()
+    elapsed = time.perf_counter() - started
+
+    if handled != NUMBER:
+        raise RuntimeError(f"Only {handled} of {NUMBER} events were handled")
+    return elapsed
+
+
+async def main() -> None:
+    for zero_copy in (True, False):
+        elapsed = await measure(zero_copy)
+        print(
+            f"zero_copy={zero_copy!s:<5} {NUMBER / elapsed:>10,.0f} events/s   "
+            f"{elapsed / NUMBER * 1e6:6.2f} us/event"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
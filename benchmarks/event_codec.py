@@ -0,0 +1,88 @@
+"""
+Micro-benchmark of DomainEvent serialization.
+
+Compares the compiled EventCodec with the previous path:
+`dataclasses.asdict` + JSON on publish, pydantic model validation +
+`model_dump()` + event construction on consume.
+
+Usage:
+    uv run python -m benchmarks.event_codec
+"""
+
+import timeit
+import uuid
+from dataclasses import asdict, dataclass, field, fields
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import create_model
+from pydantic_core import to_json
+
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.event_codecs import EventCodecRegistry
+
+NUMBER = 100_000
+
+
+@dataclass(frozen=True, slots=True)
+class OrderPlaced(DomainEvent):
+    event_name: str = field(init=False, default="order.placed")
+    order_id: uuid.UUID
+    customer_id: uuid.UUID
+    placed_at: datetime
+    total: int
+    currency: str
+    comment: str | None = None
+
+
+def legacy_encode(event: DomainEvent) -> bytes:
+    return to_json(asdict(event))
+
+
+def make_legacy_decode(event_type: type[DomainEvent]) -> Any:
+    annotations: dict[str, Any] = {f.name: (f.type, ...) for f in fields(event_type)}
+    model = create_model(event_type.__name__ + "Model", **annotations)
+    init_fields = [f.name for f in fields(event_type) if f.init]
+
+    def decode(data: bytes) -> DomainEvent:
+        dumped = model.model_validate_json(data).model_dump()
+        return event_type(**{name: dumped[name] for name in init_fields})
+
+    return decode
+
+
+def report(name: str, legacy: float, compiled: float) -> None:
+    legacy_us = legacy / NUMBER * 1e6
+    compiled_us = compiled / NUMBER * 1e6
+    print(
+        f"{name:<8} legacy: {legacy_us:7.2f} us/msg   compiled: {compiled_us:7.2f} us/msg   "
+        f"speedup: x{legacy / compiled:.2f}"
+    )
+
+
+def main() -> None:
+    event = OrderPlaced(
+        order_id=uuid.uuid4(),
+        customer_id=uuid.uuid4(),
+        placed_at=datetime.now(UTC),
+        total=1999,
+        currency="USD",
+    )
+    codec = EventCodecRegistry().get(OrderPlaced)
+    legacy_decode = make_legacy_decode(OrderPlaced)
+    body = codec.encode(event)
+
+    report(
+        "encode",
+        timeit.timeit(lambda: legacy_encode(event), number=NUMBER),
+        timeit.timeit(lambda: codec.encode(event), number=NUMBER),
+    )
+    report(
+        "decode",
+        timeit.timeit(lambda: legacy_decode(body), number=NUMBER),
+        timeit.timeit(lambda: codec.decode(body), number=NUMBER),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Index insert throughput with random (UUIDv4) and time-ordered (UUIDv7) ids.
+
+Inserts ids into a B-tree primary key, as events are inserted into the outbox
+and inbox tables. The page cache is kept much smaller than the index, like a
+buffer pool under a growing table: random ids touch a random page each, while
+time-ordered ids are appended to the rightmost one. SQLite from the standard
+library stands in for Postgres, the B-tree access pattern is the same.
+
+Usage:
+    uv run python -m benchmarks.event_ids
+"""
+
+import sqlite3
+import tempfile
+import time
+import timeit
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+
+from src.shared.uuid7 import uuid7
+
+NUMBER = 1_000_000
+BATCH_SIZE = 10_000
+CACHE_PAGES = 256
+
+
+def measure_generation(generate: Callable[[], uuid.UUID]) -> float:
+    return timeit.timeit(generate, number=NUMBER) / NUMBER * 1e9
+
+
+def measure_inserts(ids: list[uuid.UUID], path: Path) -> float:
+    connection = sqlite3.connect(path)
+    connection.execute(f"PRAGMA cache_size = {CACHE_PAGES}")
+    connection.execute("CREATE TABLE events (id BLOB PRIMARY KEY) WITHOUT ROWID")
+
+    started = time.perf_counter()
+    for start in range(0, len(ids), BATCH_SIZE):
+        with connection:
+            connection.executemany(
+                "INSERT INTO events (id) VALUES (?)",
+                ((id.bytes,) for id in ids[start:start + BATCH_SIZE]),
+            )
+    elapsed = time.perf_counter() - started
+
+    connection.close()
+    return len(ids) / elapsed
+
+
+def main() -> None:
+    print(f"{'uuid4() generation':<40} {measure_generation(uuid.uuid4):10.1f} ns/id")
+    print(f"{'uuid7() generation':<40} {measure_generation(uuid7):10.1f} ns/id")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, generate in (("uuid4", uuid.uuid4), ("uuid7", uuid7)):
+            ids = [generate() for _ in range(NUMBER)]
+            throughput = measure_inserts(ids, Path(directory) / f"{name}.db")
+            print(f"{name + ' index inserts':<40} {throughput:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
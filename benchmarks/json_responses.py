@@ -0,0 +1,95 @@
+"""
+Cost of serving large lists of BaseSchema models.
+
+Compares FastAPI's default paths, jsonable_encoder for endpoints without a
+response model and validation + serialization with one, with SchemaRoute and
+SchemaResponse, which render the models straight to JSON bytes. Each request
+goes through the whole application with the test client.
+
+Usage:
+    uv run python -m benchmarks.json_responses
+"""
+
+import time
+import uuid
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from src.presentation.api.responses import SchemaResponse, SchemaRoute
+from src.presentation.api.schemas.base_schema import BaseSchema
+
+REQUESTS = 20
+ITEMS = 10_000
+
+
+class PriceSchema(BaseSchema):
+    amount: int
+    currency: str
+
+
+class ItemSchema(BaseSchema):
+    id: uuid.UUID
+    name: str
+    price: PriceSchema
+    tags: list[str]
+    created_at: datetime
+
+
+ITEMS_PAYLOAD = [
+    ItemSchema(
+        id=uuid.uuid4(),
+        name=f"Item {i}",
+        price=PriceSchema(amount=i * 100, currency="USD"),
+        tags=["new", "sale"],
+        created_at=datetime.now(UTC),
+    )
+    for i in range(ITEMS)
+]
+
+
+def new_app() -> FastAPI:
+    default = APIRouter()
+
+    @default.get("/encoder")
+    async def encoder():
+        return ITEMS_PAYLOAD
+
+    @default.get("/response-model")
+    async def response_model() -> list[ItemSchema]:
+        return ITEMS_PAYLOAD
+
+    schema = APIRouter(route_class=SchemaRoute, default_response_class=SchemaResponse)
+
+    @schema.get("/schema")
+    async def schema_response() -> list[ItemSchema]:
+        return ITEMS_PAYLOAD
+
+    app = FastAPI()
+    app.include_router(default)
+    app.include_router(schema)
+    return app
+
+
+def main() -> None:
+    client = TestClient(new_app())
+    expected = client.get("/encoder").json()
+
+    for name, path in (
+        ("jsonable_encoder", "/encoder"),
+        ("response_model", "/response-model"),
+        ("SchemaRoute", "/schema"),
+    ):
+        if client.get(path).json() != expected:
+            raise RuntimeError(f"{path} returned a different payload")
+
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            client.get(path)
+        elapsed = (time.perf_counter() - started) / REQUESTS
+        print(f"{name:<40} {elapsed * 1e3:8.1f} ms/request of {ITEMS} items")
+
+
+if __name__ == "__main__":
+    main()
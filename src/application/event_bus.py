@@ -1,20 +1,89 @@
-from collections.abc import Awaitable, Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from typing import Protocol
 
 from src.application.ports.container import Container
 from src.domain.events.domain_event import DomainEvent
 
 
+@dataclass(frozen=True, slots=True)
+class SubscriptionOptions:
+    """
+    Consumer settings of a single subscription. None keeps the broker default.
+    """
+
+    # Number of messages the broker delivers before waiting for acknowledgements.
+    prefetch_count: int | None = None
+    # Number of handler calls allowed to run at the same time.
+    max_in_flight: int | None = None
+    # Number of partitions events are spread over by DomainEvent.partition_key.
+    # Each partition has a single consumer handling its events one by one, in
+    # order, so max_in_flight applies per partition as 1.
+    partitions: int | None = None
+
+
+@dataclass(slots=True)
+class SubscriptionStats:
+    """Live counters of a single subscription."""
+
+    name: str
+    # Handler calls running right now.
+    in_flight: int = 0
+    # Messages received by the worker and waiting for a free handler slot.
+    queued: int = 0
+    processed: int = 0
+    failed: int = 0
+
+
 class EventBus(Protocol):
     async def publish(self, event: DomainEvent) -> None: ...
 
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None: ...
+
     def subscribe[T: DomainEvent](
-            self, 
-            event: type[T], 
-            handler: Callable[[T, Container], Awaitable[None]]
+            self,
+            event: type[T],
+            handler: Callable[[T, Container], Awaitable[None]],
+            options: SubscriptionOptions | None = None
+        ) -> None: ...
+
+    def subscribe_batch[T: DomainEvent](
+            self,
+            event: type[T],
+            handler: Callable[[list[T], Container], Awaitable[None]],
+            max_size: int,
+            max_wait: float,
+            options: SubscriptionOptions | None = None
         ) -> None: ...
 
+    def stats(self) -> tuple[SubscriptionStats, ...]: ...
+
     async def start(self): ...
 
     async def stop(self): ...
-    
\ No newline at end of file
+
+
+def offload[T: DomainEvent](
+        executor: Executor,
+        handler: Callable[[T], None]
+    ) -> Callable[[T, Container], Awaitable[None]]:
+    """
+    Turns a blocking, CPU heavy handler into an event handler running in the
+    executor, so it does not block the event loop of the worker.
+
+    The handler receives only the event. With ProcessPoolExecutor both the handler
+    and the event must be picklable, so define the handler at module level and
+    wrap it at subscription time:
+
+    event_bus.subscribe(ReportRequested, offload(process_pool, build_report))
+    """
+
+    async def offloaded(event: T, _: Container) -> None:
+        await asyncio.get_running_loop().run_in_executor(executor, handler, event)
+
+    # Subscriptions are named after the handler, keep the queue of the original.
+    offloaded.__module__ = handler.__module__
+    offloaded.__qualname__ = handler.__qualname__
+    return offloaded
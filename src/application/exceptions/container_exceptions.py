@@ -17,3 +17,39 @@ class InterfaceAlreadyRegisteredError(ContainerException, SetupError):
     Raised on attempt to register the realization of the same interface twice.
     """
     pass
+
+
+class ScopeNotEnteredError(ContainerException, SetupError):
+    """
+    Raised on attempt to resolve a scoped Interface outside of a container scope.
+    """
+    pass
+
+
+class ContainerFrozenError(ContainerException, SetupError):
+    """
+    Raised on attempt to register an Interface after the container was frozen.
+    """
+    pass
+
+
+class AsyncResolutionRequiredError(ContainerException, SetupError):
+    """
+    Raised on attempt to resolve an async factory or scoped Interface synchronously.
+    """
+    pass
+
+
+class CircularDependencyError(ContainerException, SetupError):
+    """
+    Raised on attempt to freeze a container with classes depending on each other.
+    """
+    pass
+
+
+class UnresolvableParameterError(ContainerException, SetupError):
+    """
+    Raised on attempt to register a class with a constructor parameter that has
+    neither a type annotation nor a default value.
+    """
+    pass
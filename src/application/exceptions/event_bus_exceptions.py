@@ -1,4 +1,4 @@
-from src.shared.exceptions import ApplicationException, SetupError
+from src.shared.exceptions import ApplicationException, ConflictError, SetupError
 
 
 class EventBusException(ApplicationException):
@@ -24,3 +24,27 @@ class EventBusNotStartedError(EventBusException, SetupError):
     Raised on attempt to use event bus before starting it.
     """
     pass
+
+
+class EventNotDefinedError(EventBusException, SetupError):
+    """
+    Raised on attempt to restore an event whose event_name does not belong to
+    any DomainEvent subclass.
+    """
+    pass
+
+
+class EventAlreadyProcessedError(EventBusException, ConflictError):
+    """
+    Raised on attempt to commit the work of a handler for an event that has
+    already been processed by the same consumer.
+    """
+    pass
+
+
+class TooManyPartitionsError(EventBusException, SetupError):
+    """
+    Raised on attempt to subscribe with more partitions than partition buckets
+    events are spread over.
+    """
+    pass
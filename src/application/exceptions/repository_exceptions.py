@@ -30,3 +30,18 @@ class VersionMismatchError(ForbiddenError, RepositoryException):
     Raised on attempt to update an aggregate, but its version is old.
     """
     pass
+
+
+class InvalidCursorError(RepositoryException):
+    """
+    Raised on attempt to get a page with a cursor that is malformed or was
+    produced for another ordering.
+    """
+    pass
+
+
+class InvalidOrderingError(RepositoryException):
+    """
+    Raised on attempt to get a page ordered by a column that is not sortable.
+    """
+    pass
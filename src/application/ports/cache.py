@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+
+
+class Cache(ABC):
+    """
+    Key-value cache of serialized values. `ttl` is in seconds, None keeps the
+    value until it is evicted or deleted.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        """Returns the cached values of the keys, missing keys are left out."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: Mapping[str, bytes], ttl: float | None = None) -> None:
+        pass
+
+    @abstractmethod
+    async def set_many_if_newer(
+            self,
+            items: Mapping[str, tuple[int, bytes]],
+            ttl: float
+        ) -> None:
+        """
+        Sets versioned values, each only if no newer version of its key was set
+        or invalidated within `ttl`. A value read before a concurrent write can
+        thus not replace the written one.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate_versions(self, versions: Mapping[str, int], ttl: float) -> None:
+        """
+        Deletes versioned values and remembers their new versions for `ttl`
+        seconds, so set_many_if_newer does not set older values meanwhile.
+        """
+        pass
+
+    @abstractmethod
+    async def get_or_set(
+            self,
+            key: str,
+            factory: Callable[[], Awaitable[bytes]],
+            ttl: float | None = None
+        ) -> bytes:
+        """
+        Returns the cached value, or caches the value returned by the factory.
+        Concurrent misses of the same key call the factory only once.
+        """
+        pass
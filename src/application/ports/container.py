@@ -1,4 +1,5 @@
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
 from typing import Protocol
 
 
@@ -17,6 +18,28 @@ class Container(Protocol):
 
     def register_singleton[T](self, interface: type[T], singleton: T) -> None: ...
 
+    def register_scoped[T](
+            self,
+            interface: type[T],
+            factory: Callable[[], AsyncGenerator[T, None]]
+        ) -> None: ...
+
+    def register_lazy_singleton[T](
+            self,
+            interface: type[T],
+            factory: Callable[[], AsyncGenerator[T, None]]
+        ) -> None: ...
+
+    def register_class[T](self, interface: type[T], implementation: type[T]) -> None: ...
+
+    def scope(self) -> AbstractAsyncContextManager["Container"]: ...
+
+    def freeze(self) -> None: ...
+
     async def resolve[T](self, interface: type[T]) -> T: ...
+
+    def resolve_sync[T](self, interface: type[T]) -> T: ...
+
+    async def dispose(self) -> None: ...
     
     def _check_not_registered(self, interface: type[object]) -> None: ...
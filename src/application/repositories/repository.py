@@ -1,4 +1,5 @@
 import uuid
+from collections.abc import Sequence
 from typing import Protocol
 
 from src.domain.aggregates.aggregate import Aggregate
@@ -22,6 +23,26 @@ class Repository[T: Aggregate](Protocol):
         """Checks if the AggregateRoot exists"""
         ...
 
+    async def get_many(self, ids: Sequence[uuid.UUID]) -> list[T]:
+        """Returns the existing AggregateRoots with the given IDs"""
+        ...
+
+    async def add_many(self, aggregate_roots: Sequence[T]) -> None:
+        """Creates new AggregateRoots in the storage at once"""
+        ...
+
+    async def edit_many(self, aggregate_roots: Sequence[T]) -> None:
+        """Updates AggregateRoots at once"""
+        ...
+
+    async def exists_many(self, ids: Sequence[uuid.UUID]) -> set[uuid.UUID]:
+        """Returns the IDs of existing AggregateRoots"""
+        ...
+
+    async def get_version(self, id: uuid.UUID) -> int | None:
+        """Returns the stored version of an AggregateRoot without loading it"""
+        ...
+
     async def get(self, id: uuid.UUID) -> T | None:
         """Executes self.get_by_id inside"""
         return await self.get_by_id(id)
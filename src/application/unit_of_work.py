@@ -1,6 +1,8 @@
 from types import TracebackType
 from typing import Protocol, Self
 
+from src.domain.aggregates.aggregate import Aggregate
+
 
 class UnitOfWork(Protocol):
     # Write your repositories right here...
@@ -18,6 +20,31 @@ class UnitOfWork(Protocol):
     ) -> bool | None:
         ...
     
+    def track(self, aggregate: Aggregate) -> None:
+        """
+        Registers the aggregate, so its recorded events are saved on commit.
+        Repositories call it for every aggregate they load or add.
+        """
+        ...
+
     async def commit(self) -> None: ...
 
     async def rollback(self) -> None: ...
+
+
+class ReadOnlyUnitOfWork(Protocol):
+    """
+    Unit of work for queries. Nothing is committed, so there are no commit
+    and rollback methods.
+    """
+    # Write your read-only repositories right here...
+
+    async def __aenter__(self) -> Self: ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None
+    ) -> bool | None:
+        ...
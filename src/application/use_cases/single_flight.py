@@ -0,0 +1,116 @@
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from src.application.data_transfer_objects.data_transfer_object import DataTransferObject
+from src.application.use_cases.use_case import UseCase
+from src.shared.exceptions import ApplicationException
+
+
+@dataclass(slots=True)
+class SingleFlightStats:
+    """
+    Counters of one use case: calls that started an execution and calls that
+    shared the execution already in flight.
+    """
+
+    executions: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """
+    Executions in flight within the process, keyed by their input. Concurrent
+    calls with the same key share one execution and its result or error
+    instead of running it again. Nothing is kept once the execution finishes,
+    so results are never stale.
+
+    One instance is shared by the whole worker, e.g. as a container singleton.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._stats: dict[str, SingleFlightStats] = {}
+
+    async def run[T](
+            self,
+            name: str,
+            key: Hashable,
+            function: Callable[[], Coroutine[Any, Any, T]],
+            share_errors: bool = True
+        ) -> T:
+        """
+        Returns the result of `function`, or of the execution in flight with
+        the same `name` and `key`. If the shared execution fails, its error is
+        raised to every caller, or with `share_errors=False` the callers that
+        joined it run `function` themselves.
+        """
+        stats = self.stats(name)
+        flight_key = (name, key)
+        task = self._in_flight.get(flight_key)
+        if task is None:
+            stats.executions += 1
+            task = asyncio.create_task(function())
+            self._in_flight[flight_key] = task
+            task.add_done_callback(lambda _: self._land(flight_key, task))
+            # A cancelled caller does not cancel the execution the others are waiting for.
+            return await asyncio.shield(task)
+
+        stats.coalesced += 1
+        try:
+            return await asyncio.shield(task)
+        except (Exception, ApplicationException):
+            if share_errors:
+                raise
+        return await function()
+
+    def stats(self, name: str) -> SingleFlightStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = SingleFlightStats()
+        return stats
+
+    def _land(self, flight_key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._in_flight.get(flight_key) is task:
+            del self._in_flight[flight_key]
+
+
+def _data_key(data: DataTransferObject) -> Hashable:
+    return data
+
+
+class CoalescingUseCase[I: DataTransferObject, O: DataTransferObject](UseCase[I, O]):
+    """
+    Use case that shares concurrent executions of the wrapped one with equal
+    inputs through SingleFlight. Meant for reads: callers get the same output
+    instance, which must not be mutated.
+
+    Inputs are keyed by themselves, so they must be hashable, e.g. frozen
+    dataclasses, unless `key` derives a hashable key from them. Stats are named
+    after the qualified class name of the wrapped use case.
+
+    get_user = CoalescingUseCase(GetUser(uow), single_flight, key=lambda data: data.user_id)
+    """
+
+    def __init__(
+            self,
+            use_case: UseCase[I, O],
+            single_flight: SingleFlight,
+            key: Callable[[I], Hashable] = _data_key,
+            share_errors: bool = True
+        ) -> None:
+        self._use_case = use_case
+        self._single_flight = single_flight
+        self._key = key
+        self._share_errors = share_errors
+        # Qualified, use cases of different modules may share a class name.
+        self._name = f"{type(use_case).__module__}.{type(use_case).__qualname__}"
+
+    async def execute(self, data: I) -> O:
+        return await self._single_flight.run(
+            self._name,
+            self._key(data),
+            lambda: self._use_case.execute(data),
+            share_errors=self._share_errors,
+        )
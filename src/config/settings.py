@@ -20,18 +20,47 @@ class Env(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: int
     POSTGRES_DB: str
+    # Read-only units of work use the primary when the replica host is empty.
+    POSTGRES_REPLICA_HOST: str = ""
+    POSTGRES_REPLICA_PORT: int = 5432
+    # With "per_worker" sizing the pool size and overflow are totals for all
+    # WEB_CONCURRENCY workers, each worker gets its share.
+    POSTGRES_POOL_SIZING: Literal["per_process", "per_worker"] = "per_process"
+    POSTGRES_POOL_SIZE: int = 10
+    POSTGRES_MAX_OVERFLOW: int = 40
+    POSTGRES_POOL_TIMEOUT: float = 30.0
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_PREWARM: int = 5
+    WEB_CONCURRENCY: int = 1
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_POLL_INTERVAL: float = 0.5
+
+    # Event bus settings
+    EVENT_BUS: Literal["rabbitmq", "in_memory"] = "rabbitmq"
+    IN_MEMORY_EVENT_BUS_CAPACITY: int = 10_000
+    # Seconds for which domain events reuse the same `occured_at`.
+    EVENT_CLOCK_RESOLUTION: float = 0.001
+    INBOX_ENABLED: bool = True
+    INBOX_CACHE_SIZE: int = 100_000
+    INBOX_CACHE_TTL: float = 3600.0
 
     # Rabbitmq settings
     RABBITMQ_USER: str
     RABBITMQ_PASSWORD: str
     RABBITMQ_HOST: str
     RABBITMQ_PORT: int
+    RABBITMQ_PUBLISH_BATCH_SIZE: int = 100
+    RABBITMQ_PUBLISH_LINGER: float = 0.005
+    RABBITMQ_PARTITION_BUCKETS: int = 64
 
     # Redis settings
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_PASSWORD: str
     REDIS_DB: int
+    REDIS_MAX_CONNECTIONS: int = 50
+    CACHE_LOCAL_MAX_SIZE: int = 10_000
+    CACHE_LOCAL_TTL: float = 5.0
 
     model_config = SettingsConfigDict(
         env_file=ROOT / ".env"
@@ -50,18 +79,43 @@ POSTGRES_PASSWORD = env.POSTGRES_PASSWORD
 POSTGRES_HOST = env.POSTGRES_HOST
 POSTGRES_PORT = env.POSTGRES_PORT
 POSTGRES_DB = env.POSTGRES_DB 
+POSTGRES_REPLICA_HOST = env.POSTGRES_REPLICA_HOST
+POSTGRES_REPLICA_PORT = env.POSTGRES_REPLICA_PORT
+POSTGRES_POOL_SIZING = env.POSTGRES_POOL_SIZING
+POSTGRES_POOL_SIZE = env.POSTGRES_POOL_SIZE
+POSTGRES_MAX_OVERFLOW = env.POSTGRES_MAX_OVERFLOW
+POSTGRES_POOL_TIMEOUT = env.POSTGRES_POOL_TIMEOUT
+POSTGRES_POOL_RECYCLE = env.POSTGRES_POOL_RECYCLE
+POSTGRES_POOL_PREWARM = env.POSTGRES_POOL_PREWARM
+WEB_CONCURRENCY = env.WEB_CONCURRENCY
+OUTBOX_BATCH_SIZE = env.OUTBOX_BATCH_SIZE
+OUTBOX_POLL_INTERVAL = env.OUTBOX_POLL_INTERVAL
+
+# Event bus settings
+EVENT_BUS = env.EVENT_BUS
+IN_MEMORY_EVENT_BUS_CAPACITY = env.IN_MEMORY_EVENT_BUS_CAPACITY
+EVENT_CLOCK_RESOLUTION = env.EVENT_CLOCK_RESOLUTION
+INBOX_ENABLED = env.INBOX_ENABLED
+INBOX_CACHE_SIZE = env.INBOX_CACHE_SIZE
+INBOX_CACHE_TTL = env.INBOX_CACHE_TTL
 
 # Redis settings
 RABBITMQ_USER = env.RABBITMQ_USER 
 RABBITMQ_PASSWORD = env.RABBITMQ_PASSWORD
 RABBITMQ_HOST = env.RABBITMQ_HOST
 RABBITMQ_PORT = env.RABBITMQ_PORT
+RABBITMQ_PUBLISH_BATCH_SIZE = env.RABBITMQ_PUBLISH_BATCH_SIZE
+RABBITMQ_PUBLISH_LINGER = env.RABBITMQ_PUBLISH_LINGER
+RABBITMQ_PARTITION_BUCKETS = env.RABBITMQ_PARTITION_BUCKETS
 
 # Redis settings
 REDIS_HOST = env.REDIS_HOST
 REDIS_PORT = env.REDIS_PORT
 REDIS_PASSWORD = env.REDIS_PASSWORD
 REDIS_DB = env.REDIS_DB
+REDIS_MAX_CONNECTIONS = env.REDIS_MAX_CONNECTIONS
+CACHE_LOCAL_MAX_SIZE = env.CACHE_LOCAL_MAX_SIZE
+CACHE_LOCAL_TTL = env.CACHE_LOCAL_TTL
 
 # Logging settings
 LOG_LEVEL = "DEBUG" if DEBUG else env.LOG_LEVEL 
@@ -6,6 +6,8 @@ from src.domain.events.domain_event import DomainEvent
 
 class Aggregate(DomainEntity):
 
+    __slots__ = ("_domain_events",)
+
     def __init__(self, id: UUID, version: int) -> None:
         super().__init__(id, version)
         self._domain_events: list[DomainEvent] = []
@@ -5,7 +5,16 @@ from src.shared.exceptions import ForbiddenError
 
 
 class DomainEntity:
-    """Base DomainEntity to be used in the application"""
+    """
+    Base DomainEntity to be used in the application.
+
+    Entities are equal and hash alike when their ids are, so they can be kept
+    in sets and used as dict keys. Attributes are stored in slots: subclasses
+    that declare `__slots__` as well have no instance `__dict__`, which keeps
+    large graphs of entities compact.
+    """
+
+    __slots__ = ("_discarded", "_id", "_instance_id", "_version")
 
     # A generator to generate an instance id for each domain object.
     _instance_id_generator = count(0)
@@ -20,7 +29,10 @@ class DomainEntity:
         if not isinstance(value, DomainEntity):
             return False
         return value.id == self._id
-    
+
+    def __hash__(self) -> int:
+        return hash(self._id)
+
     def __repr__(self) -> str:
         return (
             f"<{type(self).__name__} id={self._id} version={self._version} "
@@ -1,6 +1,22 @@
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import ClassVar
+
+from src.shared.uuid7 import uuid7
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+# Source of `occured_at`, set by the composition root from the Clock port.
+_now: Callable[[], datetime] = _utc_now
+
+
+def _occured_at() -> datetime:
+    return _now()
 
 
 @dataclass(frozen=True, slots=True)
@@ -10,9 +26,25 @@ class DomainEvent:
     # Class-level constant - defines event name
     event_name: str = field(init=False, default="undefined")
     
-    # Auto-incrementing event ID (shared counter)
-    event_id: uuid.UUID = field(default_factory=uuid.uuid4, init=False)
-    occured_at: datetime = field(default_factory=lambda: datetime.now(UTC), init=False)
+    # Time-ordered, so events are appended to the end of id indexes.
+    event_id: uuid.UUID = field(default_factory=uuid7, init=False)
+    occured_at: datetime = field(default_factory=_occured_at, init=False)
+
+    # Name of the field events are ordered by, e.g. the aggregate id. Partitioned
+    # subscriptions handle events with the same value one by one, in order.
+    partition_by: ClassVar[str | None] = None
+
+    @staticmethod
+    def use_clock(now: Callable[[], datetime]) -> None:
+        """Makes new events take `occured_at` from `now`, e.g. Clock.now."""
+        global _now
+        _now = now
+
+    @property
+    def partition_key(self) -> str | None:
+        if self.partition_by is None:
+            return None
+        return str(getattr(self, self.partition_by))
 
     def __repr__(self) -> str:
         return (
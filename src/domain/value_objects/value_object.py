@@ -1,9 +1,73 @@
-from dataclasses import asdict, dataclass
+from collections.abc import Callable
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, cast
+
+# Getters of the field values of each value object class, compared and hashed
+# instead of building dictionaries with dataclasses.asdict.
+_field_getters: dict[type, Callable[[Any], object]] = {}
+
+
+def _field_values(value_object: "ValueObject") -> object:
+    cls = type(value_object)
+    getter = _field_getters.get(cls)
+    if getter is None:
+        names = [field.name for field in fields(cast(Any, value_object))]
+        getter = _field_getters[cls] = attrgetter(*names) if names else _no_values
+    return getter(value_object)
+
+
+def _no_values(_: object) -> tuple[()]:
+    return ()
 
 
-@dataclass(frozen=True, slots=True)
 class ValueObject:
+    """
+    Base class for immutable values, declared as frozen dataclasses:
+
+    @dataclass(frozen=True, slots=True)
+    class Money(ValueObject):
+        amount: int
+        currency: str
+
+    Value objects of the same class are equal when their fields are. The hash
+    is computed once and cached in the instance.
+    """
+
+    __slots__ = ("_hash",)
+
+    _hash: int
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # @dataclass keeps methods defined in the class instead of generating its own.
+        if "__eq__" not in cls.__dict__:
+            cls.__eq__ = ValueObject.__eq__
+        if "__hash__" not in cls.__dict__:
+            cls.__hash__ = ValueObject.__hash__
+
     def __eq__(self, value: object) -> bool:
-        if not isinstance(value, ValueObject):
+        if value is self:
+            return True
+        if type(value) is not type(self):
             return False
-        return asdict(value) == asdict(self)
+        return _field_values(self) == _field_values(value)
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            # Instances are frozen, the hash is set bypassing __setattr__.
+            value = hash(_field_values(self))
+            object.__setattr__(self, "_hash", value)
+            return value
+
+    def __getstate__(self) -> object:
+        # The cached hash is left out of pickles and copies: hashes of strings
+        # differ between processes, and frozen instances could not restore it.
+        state = super().__getstate__()
+        if not isinstance(state, tuple):
+            return state
+        state, slots = cast(tuple[object, dict[str, object]], state)
+        slots = {name: value for name, value in slots.items() if name != "_hash"}
+        return (state, slots) if slots else state
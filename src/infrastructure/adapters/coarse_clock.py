@@ -0,0 +1,26 @@
+import time
+from datetime import datetime
+
+from src.application.ports.clock import Clock
+
+
+class CoarseClock(Clock):
+    """
+    Clock that reads the wrapped one at most once per `resolution` seconds and
+    returns the cached time in between, for hot paths where timestamps need
+    not be more precise, e.g. timestamps of domain events.
+    """
+
+    def __init__(self, clock: Clock, resolution: float = 0.001) -> None:
+        self._clock = clock
+        self._resolution = int(resolution * 1_000_000_000)
+        self._expires_at = 0
+        self._now = clock.now()
+
+    def now(self) -> datetime:
+        # Reading the monotonic clock is much cheaper than building a datetime.
+        ticks = time.monotonic_ns()
+        if ticks >= self._expires_at:
+            self._now = self._clock.now()
+            self._expires_at = ticks + self._resolution
+        return self._now
@@ -1,20 +1,121 @@
-from collections.abc import Awaitable, Callable
-from typing import TypeVar, cast
+import asyncio
+import copy
+import inspect
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from types import NoneType, UnionType
+from typing import Any, TypeVar, Union, cast, get_args, get_origin, get_type_hints
 
 from src.application.exceptions.container_exceptions import (
+    AsyncResolutionRequiredError,
+    CircularDependencyError,
+    ContainerFrozenError,
     InterfaceAlreadyRegisteredError,
     InterfaceNotRegisteredError,
+    ScopeNotEnteredError,
+    UnresolvableParameterError,
 )
 
 T = TypeVar("T")
 
 
+@dataclass(frozen=True, slots=True)
+class _Dependency:
+    """A constructor parameter of a class registered with .register_class()."""
+
+    name: str
+    interface: type[object]
+    has_default: bool
+
+
+def _analyse_constructor(implementation: type[object]) -> tuple[_Dependency, ...]:
+    hints = get_type_hints(implementation.__init__)
+    dependencies: list[_Dependency] = []
+
+    for parameter in inspect.signature(implementation).parameters.values():
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+
+        has_default = parameter.default is not parameter.empty
+        hint = hints.get(parameter.name)
+        if hint is None:
+            if has_default:
+                continue
+            raise UnresolvableParameterError(
+                f"Cannot autowire '{implementation.__name__}': parameter "
+                f"'{parameter.name}' has no type annotation."
+            )
+
+        # Optional dependencies `X | None` are resolved as X.
+        if get_origin(hint) in (Union, UnionType):
+            arguments = [argument for argument in get_args(hint) if argument is not NoneType]
+            if len(arguments) == 1:
+                hint = arguments[0]
+
+        # Generic aliases are resolved by their origin, e.g. async_sessionmaker.
+        dependencies.append(_Dependency(parameter.name, get_origin(hint) or hint, has_default))
+
+    return tuple(dependencies)
+
+
+def _constant(value: object) -> Callable[[], object]:
+    return lambda: value
+
+
+def _sync_class_resolver(
+        implementation: type[object],
+        dependencies: tuple[tuple[str, Callable[[], Any]], ...]
+    ) -> Callable[[], object]:
+    return lambda: implementation(**{name: resolver() for name, resolver in dependencies})
+
+
+def _async_class_resolver(
+        implementation: type[object],
+        dependencies: tuple[tuple[str, type[object]], ...]
+    ) -> Callable[["DictContainer"], Awaitable[object]]:
+    async def resolve(container: DictContainer) -> object:
+        return implementation(**{
+            name: await container.resolve(interface) for name, interface in dependencies
+        })
+
+    return resolve
+
+
+def _container_independent(
+        factory: Callable[[], Awaitable[object]]
+    ) -> Callable[["DictContainer"], Awaitable[object]]:
+    return lambda _: factory()
+
+
 class DictContainer:
     
     def __init__(self) -> None:
         self._async_factories: dict[type[object], Callable[[], Awaitable[object]]] = {}
         self._sync_factories: dict[type[object], Callable[[], object]] = {}
         self._singletons: dict[type[object], object] = {}
+        self._scoped_factories: dict[
+            type[object], Callable[[], AbstractAsyncContextManager[object]]
+        ] = {}
+        # Lazy singletons are shared with scopes, so they are created only once.
+        self._lazy_singleton_factories: dict[
+            type[object], Callable[[], AbstractAsyncContextManager[object]]
+        ] = {}
+        self._lazy_singletons: dict[type[object], object] = {}
+        self._lazy_singleton_locks: dict[type[object], asyncio.Lock] = {}
+        self._exit_stack = AsyncExitStack()
+        # Implementation and constructor dependencies of autowired classes.
+        self._classes: dict[type[object], tuple[type[object], tuple[_Dependency, ...]]] = {}
+        # Set only on containers returned by .scope()
+        self._scoped_instances: dict[type[object], object] | None = None
+        self._scope_exit_stack: AsyncExitStack | None = None
+        self._scope_lock: asyncio.Lock | None = None
+        # Compiled by .freeze(), each interface maps to a ready-made resolver.
+        self._is_frozen = False
+        self._sync_resolvers: dict[type[object], Callable[[], Any]] = {}
+        self._async_resolvers: dict[
+            type[object], Callable[[DictContainer], Awaitable[Any]]
+        ] = {}
 
     def register_sync_factory(self, interface: type[T], factory: Callable[[], T]) -> None:
         self._check_not_registered(interface)
@@ -32,7 +133,97 @@ class DictContainer:
         self._check_not_registered(interface)
         self._singletons[interface] = singleton
 
+    def register_scoped(
+            self,
+            interface: type[T],
+            factory: Callable[[], AsyncGenerator[T, None]]
+        ) -> None:
+        """
+        Registers an async generator factory, called at most once per scope.
+        The code after `yield` disposes the instance when the scope is exited.
+        """
+        self._check_not_registered(interface)
+        self._scoped_factories[interface] = asynccontextmanager(factory)
+
+    def register_lazy_singleton(
+            self,
+            interface: type[T],
+            factory: Callable[[], AsyncGenerator[T, None]]
+        ) -> None:
+        """
+        Registers an async generator factory, called once on the first resolve.
+        Concurrent first resolves wait for the same instance. The code after
+        `yield` disposes the instance in .dispose().
+        """
+        self._check_not_registered(interface)
+        self._lazy_singleton_factories[interface] = asynccontextmanager(factory)
+        self._lazy_singleton_locks[interface] = asyncio.Lock()
+
+    def register_class(self, interface: type[T], implementation: type[T]) -> None:
+        """
+        Registers a class built on every resolve, with constructor parameters
+        resolved from the container by their type annotations. The constructor
+        is analysed once here; missing and circular dependencies are detected by
+        .freeze(). Parameters with a default value are optional dependencies.
+        """
+        self._check_not_registered(interface)
+        self._classes[interface] = (implementation, _analyse_constructor(implementation))
+
+    @asynccontextmanager
+    async def scope(self) -> AsyncGenerator["DictContainer", None]:
+        """
+        Returns a container sharing the registrations of this one, which caches
+        scoped instances until the scope is exited.
+        """
+        scope = copy.copy(self)
+        scope._scoped_instances = {}
+        scope._scope_lock = asyncio.Lock()
+        async with AsyncExitStack() as exit_stack:
+            scope._scope_exit_stack = exit_stack
+            yield scope
+
+    def freeze(self) -> None:
+        """
+        Compiles the registrations into lookup tables of resolvers, so resolving
+        costs a single dict lookup. Frozen containers reject new registrations.
+
+        Raises InterfaceNotRegisteredError or CircularDependencyError if a
+        registered class cannot be built.
+        """
+        self._check_dependencies()
+
+        self._sync_resolvers = {
+            **self._sync_factories,
+            **{
+                interface: _constant(singleton)
+                for interface, singleton in self._singletons.items()
+            },
+        }
+        self._async_resolvers = {
+            **{
+                interface: _container_independent(factory)
+                for interface, factory in self._async_factories.items()
+            },
+            **{interface: self._scoped_resolver(interface) for interface in self._scoped_factories},
+            **{
+                interface: self._lazy_singleton_resolver(interface)
+                for interface in self._lazy_singleton_factories
+            },
+        }
+        for interface in self._classes:
+            self._compile_class(interface)
+        self._is_frozen = True
+
     async def resolve(self, interface: type[T]) -> T:
+        if self._is_frozen:
+            resolver = self._sync_resolvers.get(interface)
+            if resolver is not None:
+                return resolver()
+            async_resolver = self._async_resolvers.get(interface)
+            if async_resolver is not None:
+                return await async_resolver(self)
+            raise self._not_registered_error(interface)
+
         if interface in self._async_factories:
             factory = cast(
                 Callable[[], Awaitable[T]], 
@@ -49,15 +240,179 @@ class DictContainer:
         
         if interface in self._singletons:
             return self._singletons[interface]
-        
-        
-        raise InterfaceNotRegisteredError(
+
+        if interface in self._scoped_factories:
+            return cast(T, await self._resolve_scoped(interface))
+
+        if interface in self._lazy_singleton_factories:
+            return cast(T, await self._resolve_lazy_singleton(interface))
+
+        if interface in self._classes:
+            implementation, dependencies = self._classes[interface]
+            return cast(T, implementation(**{
+                dependency.name: await self.resolve(dependency.interface)
+                for dependency in self._required(dependencies)
+            }))
+
+        raise self._not_registered_error(interface)
+
+    def resolve_sync(self, interface: type[T]) -> T:
+        """Resolves a singleton or a sync factory without awaiting."""
+        if self._is_frozen:
+            resolver = self._sync_resolvers.get(interface)
+            if resolver is not None:
+                return resolver()
+        else:
+            if interface in self._sync_factories:
+                return cast(T, self._sync_factories[interface]())
+            if interface in self._singletons:
+                return cast(T, self._singletons[interface])
+
+        # Classes are sync resolvable only when frozen, with sync dependencies.
+        if (
+            interface in self._async_factories
+            or interface in self._scoped_factories
+            or interface in self._lazy_singleton_factories
+            or interface in self._classes
+        ):
+            raise AsyncResolutionRequiredError(
+                f"Dependency resolution error: '{interface.__name__}' can be resolved only "
+                f"with `await container.resolve()`."
+            )
+        raise self._not_registered_error(interface)
+
+    def _is_registered(self, interface: type[object]) -> bool:
+        return (
+            interface in self._async_factories
+            or interface in self._sync_factories
+            or interface in self._singletons
+            or interface in self._scoped_factories
+            or interface in self._lazy_singleton_factories
+            or interface in self._classes
+        )
+
+    def _required(self, dependencies: tuple[_Dependency, ...]) -> list[_Dependency]:
+        # Unregistered optional dependencies are left to their default values.
+        return [
+            dependency for dependency in dependencies
+            if not dependency.has_default or self._is_registered(dependency.interface)
+        ]
+
+    def _check_dependencies(self) -> None:
+        resolved: set[type[object]] = set()
+
+        def visit(interface: type[object], path: tuple[type[object], ...]) -> None:
+            if interface in resolved or interface not in self._classes:
+                return
+            if interface in path:
+                cycle = " -> ".join(i.__name__ for i in (*path[path.index(interface):], interface))
+                raise CircularDependencyError(f"Circular dependency: {cycle}.")
+
+            implementation, dependencies = self._classes[interface]
+            for dependency in self._required(dependencies):
+                if not self._is_registered(dependency.interface):
+                    raise InterfaceNotRegisteredError(
+                        f"Dependency resolution error: '{dependency.interface.__name__}' "
+                        f"required by '{implementation.__name__}' is not registered in "
+                        f"this container."
+                    )
+                visit(dependency.interface, (*path, interface))
+            resolved.add(interface)
+
+        for interface in self._classes:
+            visit(interface, ())
+
+    def _compile_class(self, interface: type[object]) -> None:
+        """
+        Compiles the resolver of a registered class after its dependencies.
+        Classes depending only on sync resolvable interfaces get a sync resolver.
+        """
+        if interface in self._sync_resolvers or interface in self._async_resolvers:
+            return
+
+        implementation, dependencies = self._classes[interface]
+        required = self._required(dependencies)
+        for dependency in required:
+            if dependency.interface in self._classes:
+                self._compile_class(dependency.interface)
+
+        if all(dependency.interface in self._sync_resolvers for dependency in required):
+            self._sync_resolvers[interface] = _sync_class_resolver(
+                implementation,
+                tuple((d.name, self._sync_resolvers[d.interface]) for d in required),
+            )
+        else:
+            self._async_resolvers[interface] = _async_class_resolver(
+                implementation,
+                tuple((d.name, d.interface) for d in required),
+            )
+
+    def _not_registered_error(self, interface: type[object]) -> InterfaceNotRegisteredError:
+        return InterfaceNotRegisteredError(
             f"Dependency resolution error: '{interface.__name__}' is not registered in this "
             f"container. Ensure it is added using `register_singleton()` or "
             f"`register_factory()` before resolving."
         )
     
+    @staticmethod
+    def _scoped_resolver(
+            interface: type[object]
+        ) -> Callable[["DictContainer"], Awaitable[object]]:
+        # Scoped instances are cached on the scope the interface is resolved from.
+        return lambda container: container._resolve_scoped(interface)
+
+    async def _resolve_scoped(self, interface: type[object]) -> object:
+        if (
+            self._scoped_instances is None
+            or self._scope_exit_stack is None
+            or self._scope_lock is None
+        ):
+            raise ScopeNotEnteredError(
+                f"Dependency resolution error: '{interface.__name__}' is scoped and can be "
+                f"resolved only inside `container.scope()`."
+            )
+
+        if interface in self._scoped_instances:
+            return self._scoped_instances[interface]
+
+        # Concurrent resolves within the scope must not build the instance twice.
+        async with self._scope_lock:
+            if interface not in self._scoped_instances:
+                self._scoped_instances[interface] = (
+                    await self._scope_exit_stack.enter_async_context(
+                        self._scoped_factories[interface]()
+                    )
+                )
+            return self._scoped_instances[interface]
+
+    async def dispose(self) -> None:
+        """Disposes lazy singletons in the reverse order of their creation."""
+        await self._exit_stack.aclose()
+        self._lazy_singletons.clear()
+
+    @staticmethod
+    def _lazy_singleton_resolver(
+            interface: type[object]
+        ) -> Callable[["DictContainer"], Awaitable[object]]:
+        return lambda container: container._resolve_lazy_singleton(interface)
+
+    async def _resolve_lazy_singleton(self, interface: type[object]) -> object:
+        if interface in self._lazy_singletons:
+            return self._lazy_singletons[interface]
+
+        async with self._lazy_singleton_locks[interface]:
+            if interface not in self._lazy_singletons:
+                self._lazy_singletons[interface] = await self._exit_stack.enter_async_context(
+                    self._lazy_singleton_factories[interface]()
+                )
+            return self._lazy_singletons[interface]
+
     def _check_not_registered(self, interface: type[object]) -> None:
+        if self._is_frozen:
+            raise ContainerFrozenError(
+                f"Cannot register '{interface.__name__}', the container is frozen."
+            )
+
         error_template = (
             "Interface already has been register to the container as an {name}: {interfacename}"
         )
@@ -76,3 +431,18 @@ class DictContainer:
             raise InterfaceAlreadyRegisteredError(
                 error_template.format(name="Singleton", interfacename=interface.__name__)
             )
+
+        if self._scoped_factories.get(interface):
+            raise InterfaceAlreadyRegisteredError(
+                error_template.format(name="Scoped Factory", interfacename=interface.__name__)
+            )
+
+        if self._lazy_singleton_factories.get(interface):
+            raise InterfaceAlreadyRegisteredError(
+                error_template.format(name="Lazy Singleton", interfacename=interface.__name__)
+            )
+
+        if self._classes.get(interface):
+            raise InterfaceAlreadyRegisteredError(
+                error_template.format(name="Class", interfacename=interface.__name__)
+            )
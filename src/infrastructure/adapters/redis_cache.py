@@ -0,0 +1,275 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import cast, overload
+
+from redis.asyncio import Redis
+
+from src.application.ports.cache import Cache
+
+# Deletes the lock only if it is still held by the caller.
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Sets the value unless a newer version is recorded for it. KEYS: value key,
+# version key. ARGV: version, value, ttl in milliseconds.
+_SET_IF_NEWER_SCRIPT = """
+local current = redis.call("get", KEYS[2])
+if current and tonumber(current) > tonumber(ARGV[1]) then
+    return 0
+end
+redis.call("set", KEYS[1], ARGV[2], "px", ARGV[3])
+redis.call("set", KEYS[2], ARGV[1], "px", ARGV[3])
+return 1
+"""
+
+# Deletes the value and records its new version unless a newer one is recorded.
+# KEYS: value key, version key. ARGV: version, ttl in milliseconds.
+_INVALIDATE_VERSION_SCRIPT = """
+redis.call("del", KEYS[1])
+local current = redis.call("get", KEYS[2])
+if not current or tonumber(current) < tonumber(ARGV[1]) then
+    redis.call("set", KEYS[2], ARGV[1], "px", ARGV[2])
+end
+return 1
+"""
+
+
+class _LocalCache:
+    """
+    Size-bounded LRU of values in process memory, each expiring after its ttl.
+    """
+
+    __slots__ = ("_entries", "_max_size")
+
+    def __init__(self, max_size: int) -> None:
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._max_size = max_size
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+class RedisCache(Cache):
+    """
+    Cache stored in Redis, with a small in-process LRU in front of it.
+
+    Values are kept in process memory for at most `local_ttl` seconds, so reads
+    of hot keys skip the network. Other processes do not invalidate the local
+    layer, so a value deleted or overwritten elsewhere may be seen for up to
+    `local_ttl` seconds. Bulk methods cost a single round trip.
+
+    Versions of versioned values are kept under `{key}:version`, next to the
+    values, and compared by Lua scripts, so checking and setting is atomic.
+    Scripts are registered once and run with EVALSHA, loaded again only if
+    Redis does not know them.
+
+    get_or_set protects against cache stampedes: concurrent misses in one
+    process share one factory call, and processes coordinate through a Redis
+    lock, so only one of them calls the factory while the others poll for the
+    value. A lock holder that runs longer than `lock_timeout` is not waited for.
+
+    The Redis client must be created with `decode_responses=False`.
+    """
+
+    def __init__(
+            self,
+            redis: Redis,
+            local_max_size: int = 10_000,
+            local_ttl: float = 5.0,
+            lock_timeout: float = 10.0,
+            lock_poll_interval: float = 0.05
+        ) -> None:
+        self._redis = redis
+        self._local = _LocalCache(local_max_size)
+        self._local_ttl = local_ttl
+        self._lock_timeout = lock_timeout
+        self._lock_poll_interval = lock_poll_interval
+        self._loading: dict[str, asyncio.Task[bytes]] = {}
+        self._release_lock = redis.register_script(_RELEASE_LOCK_SCRIPT)
+        self._set_if_newer = redis.register_script(_SET_IF_NEWER_SCRIPT)
+        self._invalidate_version = redis.register_script(_INVALIDATE_VERSION_SCRIPT)
+
+    async def get(self, key: str) -> bytes | None:
+        value = self._local.get(key)
+        if value is not None:
+            return value
+
+        # The client does not decode responses, values are bytes.
+        value = cast(bytes | None, await self._redis.get(key))
+        if value is not None:
+            self._local.set(key, value, self._local_ttl)
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        values: dict[str, bytes] = {}
+        missing: list[str] = []
+        for key in keys:
+            value = self._local.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                values[key] = value
+
+        if missing:
+            found = cast(list[bytes | None], await self._redis.mget(missing))
+            for key, value in zip(missing, found, strict=True):
+                if value is not None:
+                    self._local.set(key, value, self._local_ttl)
+                    values[key] = value
+        return values
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        await self._redis.set(key, value, px=self._milliseconds(ttl))
+        self._local.set(key, value, self._local_value_ttl(ttl))
+
+    async def set_many(self, items: Mapping[str, bytes], ttl: float | None = None) -> None:
+        if not items:
+            return
+
+        # MSET does not support expiration, so SETs are pipelined instead.
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for key, value in items.items():
+                pipeline.set(key, value, px=self._milliseconds(ttl))
+            await pipeline.execute()
+
+        for key, value in items.items():
+            self._local.set(key, value, self._local_value_ttl(ttl))
+
+    async def set_many_if_newer(
+            self,
+            items: Mapping[str, tuple[int, bytes]],
+            ttl: float
+        ) -> None:
+        if not items:
+            return
+
+        px = self._milliseconds(ttl)
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for key, (version, value) in items.items():
+                # Queued on the pipeline, which loads missing scripts before executing.
+                await self._set_if_newer(
+                    keys=[key, f"{key}:version"], args=[version, value, px], client=pipeline
+                )
+            results = cast(list[int], await pipeline.execute())
+
+        for (key, (_, value)), is_set in zip(items.items(), results, strict=True):
+            if is_set:
+                self._local.set(key, value, self._local_value_ttl(ttl))
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+
+        await self._redis.delete(*keys)
+        for key in keys:
+            self._local.delete(key)
+
+    async def invalidate_versions(self, versions: Mapping[str, int], ttl: float) -> None:
+        if not versions:
+            return
+
+        px = self._milliseconds(ttl)
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for key, version in versions.items():
+                await self._invalidate_version(
+                    keys=[key, f"{key}:version"], args=[version, px], client=pipeline
+                )
+            await pipeline.execute()
+
+        for key in versions:
+            self._local.delete(key)
+
+    async def get_or_set(
+            self,
+            key: str,
+            factory: Callable[[], Awaitable[bytes]],
+            ttl: float | None = None
+        ) -> bytes:
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        task = self._loading.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, factory, ttl))
+            self._loading[key] = task
+            task.add_done_callback(lambda _: self._loading.pop(key, None))
+        # A cancelled caller does not cancel the load the others are waiting for.
+        return await asyncio.shield(task)
+
+    async def _load(
+            self,
+            key: str,
+            factory: Callable[[], Awaitable[bytes]],
+            ttl: float | None
+        ) -> bytes:
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self._lock_timeout
+
+        while True:
+            if await self._redis.set(
+                lock_key, token, px=self._milliseconds(self._lock_timeout), nx=True
+            ):
+                try:
+                    # The value may have been set just before the lock was released.
+                    value = await self.get(key)
+                    if value is None:
+                        value = await factory()
+                        await self.set(key, value, ttl)
+                    return value
+                finally:
+                    await self._release_lock(keys=[lock_key], args=[token])
+
+            await asyncio.sleep(self._lock_poll_interval)
+            value = await self.get(key)
+            if value is not None:
+                return value
+
+            if time.monotonic() > deadline:
+                value = await factory()
+                await self.set(key, value, ttl)
+                return value
+
+    def _local_value_ttl(self, ttl: float | None) -> float:
+        return self._local_ttl if ttl is None else min(ttl, self._local_ttl)
+
+    @overload
+    @staticmethod
+    def _milliseconds(ttl: float) -> int: ...
+
+    @overload
+    @staticmethod
+    def _milliseconds(ttl: None) -> None: ...
+
+    @overload
+    @staticmethod
+    def _milliseconds(ttl: float | None) -> int | None: ...
+
+    @staticmethod
+    def _milliseconds(ttl: float | None) -> int | None:
+        return None if ttl is None else max(1, int(ttl * 1000))
@@ -0,0 +1,113 @@
+from dataclasses import fields
+from typing import Any, TypedDict, cast, get_type_hints
+
+from pydantic import TypeAdapter
+
+from src.application.exceptions.event_bus_exceptions import EventNotDefinedError
+from src.domain.events.domain_event import DomainEvent
+
+
+def _get_event_name(event_type: type[DomainEvent]) -> str:
+    event_name = "undefined"
+
+    for f in fields(event_type):
+        if f.name == "event_name":
+            event_name = cast(str, f.default)
+            break
+
+    return event_name
+
+
+class EventCodec[T: DomainEvent]:
+    """
+    Encoder/decoder of a single DomainEvent subclass, compiled once from its
+    dataclass fields.
+
+    Events are dumped by pydantic-core straight from the slotted dataclass to JSON
+    bytes. Decoding validates the bytes into a payload dict (UUID, datetime and
+    nested value objects are converted on the way) and sets the fields directly
+    without calling `__init__`, so `init=False` fields like `event_id` and
+    `occured_at` keep the values of the published event.
+    """
+
+    __slots__ = ("_encoder", "_field_names", "_payload", "event_name", "event_type")
+
+    def __init__(self, event_type: type[T]) -> None:
+        self.event_type = event_type
+        self.event_name = _get_event_name(event_type)
+        self._field_names = tuple(f.name for f in fields(event_type))
+
+        type_hints = get_type_hints(event_type)
+        payload_type = cast(Any, TypedDict)(
+            f"{event_type.__name__}Payload",
+            {name: type_hints[name] for name in self._field_names},
+        )
+        self._encoder: TypeAdapter[T] = TypeAdapter(event_type)
+        self._payload: TypeAdapter[dict[str, object]] = TypeAdapter(payload_type)
+
+    def encode(self, event: T) -> bytes:
+        return self._encoder.dump_json(event)
+
+    def decode(self, data: bytes | str) -> T:
+        return self._construct(self._payload.validate_json(data))
+
+    def to_dict(self, event: T) -> dict[str, Any]:
+        """Returns JSON compatible dict of the event."""
+        return self._encoder.dump_python(event, mode="json")
+
+    def from_dict(self, data: dict[str, Any]) -> T:
+        return self._construct(self._payload.validate_python(data))
+
+    def _construct(self, payload: dict[str, object]) -> T:
+        event = object.__new__(self.event_type)
+        for name in self._field_names:
+            # Events are frozen, so attributes are set bypassing __setattr__.
+            object.__setattr__(event, name, payload[name])
+        return event
+
+
+class EventCodecRegistry:
+    """
+    Keeps one compiled EventCodec per DomainEvent subclass. Codecs are compiled
+    lazily on the first use of the event type.
+    """
+
+    def __init__(self) -> None:
+        self._codecs: dict[type[DomainEvent], EventCodec[Any]] = {}
+        self._event_types: dict[str, type[DomainEvent]] = {}
+
+    def get[T: DomainEvent](self, event_type: type[T]) -> EventCodec[T]:
+        codec = self._codecs.get(event_type)
+        if codec is None:
+            codec = self._codecs[event_type] = EventCodec(event_type)
+        return codec
+
+    def get_by_name(self, event_name: str) -> EventCodec[DomainEvent]:
+        """
+        Returns the codec of the DomainEvent subclass declaring `event_name`.
+        Subclasses are indexed again only when the name is not known yet.
+        """
+        if event_name not in self._event_types:
+            self._index_event_types()
+
+        if event_name not in self._event_types:
+            raise EventNotDefinedError(
+                f"DomainEvent with event_name={event_name!r} is not defined."
+            )
+        return self.get(self._event_types[event_name])
+
+    def encode(self, event: DomainEvent) -> bytes:
+        return self.get(type(event)).encode(event)
+
+    def decode[T: DomainEvent](self, event_type: type[T], data: bytes | str) -> T:
+        return self.get(event_type).decode(data)
+
+    def _index_event_types(self) -> None:
+        # Subclasses are popped newest first. `dataclass(slots=True)` replaces the
+        # decorated class with a new one, while the original stays in
+        # `__subclasses__` until collected, so the first class found wins.
+        event_types: list[type[DomainEvent]] = [DomainEvent]
+        while event_types:
+            event_type = event_types.pop()
+            event_types.extend(event_type.__subclasses__())
+            self._event_types.setdefault(_get_event_name(event_type), event_type)
@@ -0,0 +1,97 @@
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any, Protocol, cast
+
+from src.domain.aggregates.aggregate import Aggregate
+
+
+class TrackedRepository[T: Aggregate](Protocol):
+    """
+    Repository whose aggregates are kept in an IdentityMap and written back by
+    SQLAlchemyUnitOfWork on commit when they changed.
+    """
+
+    def snapshot(self, aggregate: T) -> object:
+        """Returns the persisted state of the aggregate, compared to detect changes."""
+        ...
+
+    async def save_changes(self, changes: list[tuple[T, int]]) -> None:
+        """
+        Writes changed aggregates, each paired with the version it was loaded
+        with, checking all versions at once. Raises VersionMismatchError if any
+        of them was changed concurrently.
+        """
+        ...
+
+
+@dataclass(slots=True)
+class _Entry:
+    aggregate: Aggregate
+    repository: TrackedRepository[Any]
+    # Version and state the aggregate has in the database.
+    version: int
+    snapshot: object
+
+
+class IdentityMap:
+    """
+    Aggregates loaded within one unit of work, keyed by aggregate type and id.
+
+    Repositories return the instance already in the map instead of loading the
+    same aggregate twice. The map remembers the persisted version and state of
+    each aggregate, so only changed aggregates are written on commit.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[type[Aggregate], uuid.UUID], _Entry] = {}
+
+    def get[T: Aggregate](self, aggregate_type: type[T], id: uuid.UUID) -> T | None:
+        entry = self._entries.get((aggregate_type, id))
+        if entry is None:
+            return None
+        return cast(T, entry.aggregate)
+
+    def __contains__(self, aggregate: Aggregate) -> bool:
+        return (type(aggregate), aggregate.id) in self._entries
+
+    def __iter__(self) -> Iterator[Aggregate]:
+        return (entry.aggregate for entry in self._entries.values())
+
+    def add[T: Aggregate](self, aggregate: T, repository: TrackedRepository[T]) -> None:
+        """Registers an aggregate as loaded from or written to the database."""
+        self._entries[(type(aggregate), aggregate.id)] = _Entry(
+            aggregate, repository, aggregate.version, repository.snapshot(aggregate)
+        )
+
+    def persisted_version(self, aggregate: Aggregate) -> int | None:
+        """Returns the version the aggregate has in the database, if it is mapped."""
+        entry = self._entries.get((type(aggregate), aggregate.id))
+        if entry is None:
+            return None
+        return entry.version
+
+    def remove(self, aggregate_type: type[Aggregate], id: uuid.UUID) -> None:
+        self._entries.pop((aggregate_type, id), None)
+
+    def changes(self) -> dict[TrackedRepository[Any], list[tuple[Aggregate, int]]]:
+        """
+        Returns the aggregates whose version or state differs from the persisted
+        one, grouped by repository, each with the version it was loaded with.
+        """
+        changes: dict[TrackedRepository[Any], list[tuple[Aggregate, int]]] = {}
+        for entry in self._entries.values():
+            aggregate = entry.aggregate
+            if aggregate.discarded:
+                continue
+            if (
+                aggregate.version != entry.version
+                or entry.repository.snapshot(aggregate) != entry.snapshot
+            ):
+                changes.setdefault(entry.repository, []).append((aggregate, entry.version))
+        return changes
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,267 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import suppress
+from typing import Any
+
+from src.application.event_bus import EventBus, SubscriptionOptions, SubscriptionStats
+from src.application.exceptions.event_bus_exceptions import (
+    EventBusAlreadyClosedError,
+    EventBusAlreadyStartedError,
+    EventBusNotStartedError,
+)
+from src.application.ports.container import Container
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.event_codecs import EventCodecRegistry
+from src.infrastructure.partitioning import bucket_partition, partition_bucket
+from src.shared.exceptions import ApplicationException
+
+logger = logging.getLogger(__name__)
+
+
+class _Subscription:
+    """
+    A bounded queue of a single handler and the worker tasks consuming it.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            handler: Callable[[list[Any]], Awaitable[None]],
+            capacity: int,
+            workers: int,
+            max_batch_size: int = 1,
+            max_wait: float = 0.0
+        ) -> None:
+        self.stats = SubscriptionStats(name)
+        self._handler = handler
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(capacity)
+        self._workers = workers
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._tasks: list[asyncio.Task[None]] = []
+        # Events put and not handled yet, including the ones being handled.
+        self.unfinished = 0
+
+    async def put(self, event: DomainEvent) -> None:
+        # Waits while the queue is full, slowing publishers down to the handler.
+        await self._queue.put(event)
+        self.unfinished += 1
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self._workers)]
+
+    async def join(self) -> None:
+        """Waits until every event put so far is handled."""
+        await self._queue.join()
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+    async def _work(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            self.stats.in_flight += 1
+            try:
+                await self._handler(batch)
+            except (Exception, ApplicationException):
+                self.stats.failed += 1
+                logger.exception(
+                    "Event handler failed", extra={"subscription": self.stats.name}
+                )
+            else:
+                self.stats.processed += 1
+            finally:
+                self.stats.in_flight -= 1
+                self.unfinished -= len(batch)
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _next_batch(self) -> list[Any]:
+        batch = [await self._queue.get()]
+        if self._max_batch_size == 1:
+            return batch
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._max_wait
+        while len(batch) < self._max_batch_size:
+            if self._queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+            else:
+                batch.append(self._queue.get_nowait())
+        return batch
+
+
+class InMemoryEventBus(EventBus):
+    """
+    EventBus delivering events inside the process through asyncio queues.
+
+    Events are routed by `event_name` to every subscribed handler. Each handler
+    has its own bounded queue, or one queue with a single worker per partition
+    for partitioned subscriptions, so a slow handler applies backpressure to
+    publishers instead of growing memory. With `zero_copy` the frozen event
+    objects are delivered as is; otherwise they are encoded and decoded like on a
+    broker, so handlers never share instances with the publisher.
+
+    Events are not persisted: anything still queued when the process dies is lost,
+    and failed handlers are logged, not retried.
+    """
+
+    def __init__(
+            self,
+            container: Container,
+            capacity: int = 10_000,
+            zero_copy: bool = True,
+            event_codecs: EventCodecRegistry | None = None
+        ) -> None:
+        self._container = container
+        self._capacity = capacity
+        self._zero_copy = zero_copy
+        # Shared with the outbox, so codecs are built once per event type.
+        self._codecs = event_codecs if event_codecs is not None else EventCodecRegistry()
+        # Each route holds the partitions of one subscription.
+        self._routes: dict[str, list[list[_Subscription]]] = {}
+        self._subscriptions: list[_Subscription] = []
+        self._is_started = False
+
+    async def start(self):
+        if self._is_started:
+            raise EventBusAlreadyStartedError(
+                "Attempt to call .start method second time without closing."
+            )
+        self._is_started = True
+
+        for subscription in self._subscriptions:
+            subscription.start()
+
+    async def stop(self):
+        if not self._is_started:
+            raise EventBusAlreadyClosedError(
+                "Attempt to call .close method second time without starting."
+            )
+
+        # Handling everything that was published before stopping. Handlers may
+        # publish follow-up events meanwhile, so publishing is allowed until no
+        # subscription has unfinished events.
+        while any(subscription.unfinished for subscription in self._subscriptions):
+            for subscription in self._subscriptions:
+                await subscription.join()
+        self._is_started = False
+
+        for subscription in self._subscriptions:
+            await subscription.stop()
+
+    async def publish(self, event: DomainEvent) -> None:
+        self._check_started()
+
+        for partitions in self._routes.get(event.event_name, ()):
+            if len(partitions) == 1:
+                subscription = partitions[0]
+            else:
+                bucket = partition_bucket(event.partition_key, 1 << 32)
+                subscription = partitions[bucket_partition(bucket, len(partitions))]
+            await subscription.put(self._copy(event))
+
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        for event in events:
+            await self.publish(event)
+
+    def subscribe[T: DomainEvent](
+            self,
+            event: type[T],
+            handler: Callable[[T, Container], Awaitable[None]],
+            options: SubscriptionOptions | None = None
+        ) -> None:
+        options = options or SubscriptionOptions()
+
+        async def handle(events: list[T]) -> None:
+            async with self._container.scope() as container:
+                await handler(events[0], container)
+
+        self._add_subscription(
+            event, f"{handler.__module__}.{handler.__qualname__}", handle, options
+        )
+
+    def subscribe_batch[T: DomainEvent](
+            self,
+            event: type[T],
+            handler: Callable[[list[T], Container], Awaitable[None]],
+            max_size: int,
+            max_wait: float,
+            options: SubscriptionOptions | None = None
+        ) -> None:
+        options = options or SubscriptionOptions()
+
+        async def handle(events: list[T]) -> None:
+            async with self._container.scope() as container:
+                await handler(events, container)
+
+        self._add_subscription(
+            event,
+            f"{handler.__module__}.{handler.__qualname__}",
+            handle,
+            options,
+            max_batch_size=max_size,
+            max_wait=max_wait,
+        )
+
+    def stats(self) -> tuple[SubscriptionStats, ...]:
+        for subscription in self._subscriptions:
+            subscription.stats.queued = subscription.queue_size
+        return tuple(subscription.stats for subscription in self._subscriptions)
+
+    def _add_subscription(
+            self,
+            event: type[DomainEvent],
+            name: str,
+            handler: Callable[[list[Any]], Awaitable[None]],
+            options: SubscriptionOptions,
+            max_batch_size: int = 1,
+            max_wait: float = 0.0
+        ) -> None:
+        capacity = options.prefetch_count or self._capacity
+        if options.partitions:
+            partitions = [
+                _Subscription(f"{name}.{partition}", handler, capacity, 1, max_batch_size, max_wait)
+                for partition in range(options.partitions)
+            ]
+        else:
+            partitions = [
+                _Subscription(
+                    name, handler, capacity, options.max_in_flight or 1, max_batch_size, max_wait
+                )
+            ]
+
+        self._routes.setdefault(self._codecs.get(event).event_name, []).append(partitions)
+        self._subscriptions.extend(partitions)
+
+        if self._is_started:
+            for subscription in partitions:
+                subscription.start()
+
+    def _copy(self, event: DomainEvent) -> DomainEvent:
+        if self._zero_copy:
+            return event
+        codec = self._codecs.get(type(event))
+        return codec.decode(codec.encode(event))
+
+    def _check_started(self) -> None:
+        if not self._is_started:
+            raise EventBusNotStartedError(
+                "Attempt to use event bus before starting it."
+            )
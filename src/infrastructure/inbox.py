@@ -0,0 +1,184 @@
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.exceptions.event_bus_exceptions import EventAlreadyProcessedError
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.sqlalchemy.models import InboxMessageModel
+
+
+@dataclass(slots=True)
+class _Delivery:
+    consumer: str
+    event_ids: tuple[uuid.UUID, ...]
+    recorded: bool = False
+    # Ids another worker recorded first, set when recording the delivery fails.
+    conflicts: frozenset[uuid.UUID] = frozenset()
+
+
+# Delivery being handled in the current task. SQLAlchemyUnitOfWork records it on
+# commit, so the inbox row is saved in the same transaction as the handler work.
+_current_delivery: ContextVar[_Delivery | None] = ContextVar("inbox_delivery", default=None)
+
+
+class _SeenEvents:
+    """
+    Bounded LRU set of processed event ids, where entries expire after `ttl`.
+    """
+
+    __slots__ = ("_entries", "_max_size", "_ttl")
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._entries: OrderedDict[uuid.UUID, float] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def __contains__(self, event_id: uuid.UUID) -> bool:
+        expires_at = self._entries.get(event_id)
+        if expires_at is None:
+            return False
+        if expires_at < time.monotonic():
+            del self._entries[event_id]
+            return False
+        return True
+
+    def add(self, event_id: uuid.UUID) -> None:
+        self._entries[event_id] = time.monotonic() + self._ttl
+        self._entries.move_to_end(event_id)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+class Inbox:
+    """
+    Skips events a consumer has already processed, keyed on DomainEvent.event_id.
+
+    Ids are checked in a bounded in-process LRU/TTL set first, so redeliveries
+    of recently handled events never touch the database. Unknown ids are checked
+    in the inbox table with one query per delivery. Ids of handled events are
+    inserted into the inbox table by the first SQLAlchemyUnitOfWork committed by
+    the handler, or in a separate transaction if the handler did not commit any.
+
+    When another worker has recorded some events of a batch first, the handler
+    transaction is rolled back and the handler runs again without them.
+    """
+
+    def __init__(
+            self,
+            new_session: async_sessionmaker[AsyncSession],
+            cache_size: int = 100_000,
+            cache_ttl: float = 3600.0
+        ) -> None:
+        self._new_session = new_session
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        self._seen: dict[str, _SeenEvents] = {}
+
+    async def handle[T: DomainEvent](
+            self,
+            consumer: str,
+            events: list[T],
+            handler: Callable[[list[T]], Awaitable[None]]
+        ) -> None:
+        seen = self._seen.get(consumer)
+        if seen is None:
+            seen = self._seen[consumer] = _SeenEvents(self._cache_size, self._cache_ttl)
+
+        # Unique by event_id, a batch may contain the same message redelivered.
+        events = list({
+            event.event_id: event for event in events if event.event_id not in seen
+        }.values())
+        if not events:
+            return
+
+        processed_ids = await self._get_processed_ids(consumer, [e.event_id for e in events])
+        for event_id in processed_ids:
+            seen.add(event_id)
+        events = [event for event in events if event.event_id not in processed_ids]
+        if not events:
+            return
+
+        while True:
+            delivery = _Delivery(consumer, tuple(event.event_id for event in events))
+            token = _current_delivery.set(delivery)
+            try:
+                await handler(events)
+                break
+            except EventAlreadyProcessedError:
+                if not delivery.conflicts:
+                    raise
+            finally:
+                _current_delivery.reset(token)
+
+            # Processed concurrently by another worker, the transaction was rolled
+            # back and the events nobody has processed yet are handled again.
+            for event_id in delivery.conflicts:
+                seen.add(event_id)
+            events = [event for event in events if event.event_id not in delivery.conflicts]
+            if not events:
+                return
+
+        if not delivery.recorded:
+            async with self._new_session() as session, session.begin():
+                await session.execute(
+                    insert(InboxMessageModel)
+                    .values([
+                        {"consumer": consumer, "event_id": event_id}
+                        for event_id in delivery.event_ids
+                    ])
+                    .on_conflict_do_nothing()
+                )
+
+        for event_id in delivery.event_ids:
+            seen.add(event_id)
+
+    async def _get_processed_ids(
+            self,
+            consumer: str,
+            event_ids: list[uuid.UUID]
+        ) -> set[uuid.UUID]:
+        async with self._new_session() as session:
+            result = await session.execute(
+                select(InboxMessageModel.event_id).where(
+                    InboxMessageModel.consumer == consumer,
+                    InboxMessageModel.event_id.in_(event_ids),
+                )
+            )
+            return set(result.scalars())
+
+
+async def record_current_delivery(session: AsyncSession) -> None:
+    """
+    Inserts the delivery handled in the current task into the inbox table within
+    the session transaction. Raises EventAlreadyProcessedError when another worker
+    has recorded some of its events first, so the handler transaction is rolled
+    back. Only those events are marked as conflicting on the delivery.
+    """
+    delivery = _current_delivery.get()
+    if delivery is None or delivery.recorded:
+        return
+
+    result = await session.execute(
+        insert(InboxMessageModel)
+        .values([
+            {"consumer": delivery.consumer, "event_id": event_id}
+            for event_id in delivery.event_ids
+        ])
+        .on_conflict_do_nothing()
+        .returning(InboxMessageModel.event_id)
+    )
+    conflicts = frozenset(delivery.event_ids) - set(result.scalars())
+    if conflicts:
+        delivery.conflicts = conflicts
+        raise EventAlreadyProcessedError(
+            f"Events {sorted(map(str, conflicts))} were already processed by "
+            f"{delivery.consumer}."
+        )
+    delivery.recorded = True
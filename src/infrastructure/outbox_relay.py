@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from contextlib import suppress
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.event_bus import EventBus
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.event_codecs import EventCodecRegistry
+from src.infrastructure.sqlalchemy.models import OutboxMessageModel
+from src.shared.exceptions import ApplicationException
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Publishes events saved to the outbox by SQLAlchemyUnitOfWork.
+
+    Each iteration locks a batch of the oldest rows with `FOR UPDATE SKIP LOCKED`,
+    publishes them with `EventBus.publish_many` and deletes them in the same
+    transaction. Locked rows are skipped, so several workers can drain the outbox
+    concurrently. Delivery is at-least-once: if publishing fails, the transaction
+    is rolled back and the batch is retried on the next iteration.
+
+    Rows are decoded one by one. A row that cannot be decoded, e.g. because its
+    event class is not imported in this process, is dead-lettered by setting
+    `failed_at` and `error`, so it does not block the rows behind it.
+    """
+
+    def __init__(
+            self,
+            new_session: async_sessionmaker[AsyncSession],
+            event_bus: EventBus,
+            event_codecs: EventCodecRegistry,
+            batch_size: int,
+            poll_interval: float
+        ) -> None:
+        self._new_session = new_session
+        self._event_bus = event_bus
+        self._event_codecs = event_codecs
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def relay_batch(self) -> int:
+        """
+        Publishes one batch of events and returns its size, dead-lettered rows
+        included.
+        """
+        outbox = OutboxMessageModel
+        async with self._new_session() as session, session.begin():
+            result = await session.execute(
+                select(outbox.id, outbox.event_name, outbox.payload)
+                .where(outbox.failed_at.is_(None))
+                .order_by(outbox.id)
+                .limit(self._batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            rows = result.all()
+            if not rows:
+                return 0
+
+            ids: list[int] = []
+            events: list[DomainEvent] = []
+            for row in rows:
+                try:
+                    event = self._event_codecs.get_by_name(row.event_name).from_dict(row.payload)
+                except (Exception, ApplicationException) as exc:
+                    logger.exception("Outbox message %s cannot be decoded", row.id)
+                    await session.execute(
+                        update(outbox)
+                        .where(outbox.id == row.id)
+                        .values(failed_at=func.now(), error=repr(exc))
+                    )
+                    continue
+                ids.append(row.id)
+                events.append(event)
+
+            if events:
+                await self._event_bus.publish_many(events)
+                await session.execute(delete(outbox).where(outbox.id.in_(ids)))
+
+        return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                relayed = await self.relay_batch()
+            except (Exception, ApplicationException):
+                logger.exception("Outbox relay iteration failed")
+                relayed = 0
+
+            # A full batch means there are probably more rows waiting.
+            if relayed < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
@@ -0,0 +1,27 @@
+import zlib
+
+
+def partition_bucket(partition_key: str | None, buckets: int) -> int:
+    """
+    Maps a partition key to one of `buckets` stable buckets. crc32 is used
+    instead of hash(), which is randomized per process. Events without a key
+    all go to the first bucket.
+    """
+    if partition_key is None:
+        return 0
+    return zlib.crc32(partition_key.encode()) % buckets
+
+
+def bucket_partition(bucket: int, partitions: int) -> int:
+    """
+    Jump consistent hash (Lamping, Veach) of a bucket over `partitions`
+    partitions. When the number of partitions changes from n to n + 1, only
+    about 1/(n + 1) of the buckets move to another partition.
+    """
+    key = bucket
+    result, candidate = -1, 0
+    while candidate < partitions:
+        result = candidate
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        candidate = int((result + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return result
@@ -1,33 +1,202 @@
+import asyncio
 import logging
-from collections.abc import Awaitable, Callable
-from dataclasses import asdict, fields
-from typing import cast
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager, suppress
+from typing import Any
 
-from faststream import FastStream
-from faststream.rabbit import ExchangeType, RabbitBroker, RabbitExchange, RabbitQueue
-from faststream.types import SendableMessage
-from pydantic import BaseModel, create_model
+from faststream import AckPolicy, FastStream
+from faststream.message import StreamMessage
+from faststream.rabbit import Channel, ExchangeType, RabbitBroker, RabbitExchange, RabbitQueue
 
-from src.application.event_bus import EventBus
+from src.application.event_bus import EventBus, SubscriptionOptions, SubscriptionStats
 from src.application.exceptions.event_bus_exceptions import (
     EventBusAlreadyClosedError,
     EventBusAlreadyStartedError,
     EventBusNotStartedError,
+    TooManyPartitionsError,
 )
 from src.application.ports.container import Container
 from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.event_codecs import EventCodec, EventCodecRegistry
+from src.infrastructure.inbox import Inbox
+from src.infrastructure.partitioning import bucket_partition, partition_bucket
+from src.shared.exceptions import ApplicationException
 
 logger = logging.getLogger(__name__)
 
 
+class _EventBatcher[T: DomainEvent]:
+    """
+    Coalesces single events into batches.
+
+    A batch is flushed when it reaches `max_size` events or when `linger`
+    seconds passed since the first event of the batch was submitted,
+    whichever comes first. Each `submit` call waits until its own batch is
+    flushed, so errors of the flush are still propagated to every caller.
+    `flush` may instead return the outcome of each event, None or the error
+    raised to the caller that submitted it.
+
+    Used on the publishing side to coalesce publications into one confirmed
+    batch, and on the consuming side to deliver lists of events to handlers.
+    """
+
+    def __init__(
+            self,
+            flush: Callable[[list[T]], Awaitable[list[BaseException | None] | None]],
+            max_size: int,
+            linger: float
+        ) -> None:
+        self._flush = flush
+        self._max_size = max_size
+        self._linger = linger
+        self._pending: list[tuple[T, asyncio.Future[None]]] = []
+        self._has_pending = asyncio.Event()
+        self._is_full = asyncio.Event()
+        self._is_stopping = False
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flushes everything submitted so far and stops the background task."""
+        if self._task is None:
+            return
+
+        self._is_stopping = True
+        self._has_pending.set()
+        await self._task
+        self._task = None
+        self._is_stopping = False
+
+    async def submit(self, event: T) -> None:
+        if self._task is None:
+            # Nothing would flush the batch, so the event is flushed right away.
+            outcomes = await self._flush([event])
+            if outcomes is not None and outcomes[0] is not None:
+                raise outcomes[0]
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((event, future))
+        self._has_pending.set()
+
+        if len(self._pending) >= self._max_size:
+            self._is_full.set()
+
+        await future
+
+    async def _run(self) -> None:
+        while True:
+            await self._has_pending.wait()
+
+            if not self._is_stopping and len(self._pending) < self._max_size:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._is_full.wait(), self._linger)
+
+            if self._pending:
+                await self._flush_batch()
+
+            if self._is_stopping and not self._pending:
+                return
+
+    async def _flush_batch(self) -> None:
+        batch = self._pending[:self._max_size]
+        self._pending = self._pending[self._max_size:]
+
+        if len(self._pending) < self._max_size:
+            self._is_full.clear()
+        if not self._pending:
+            self._has_pending.clear()
+
+        try:
+            outcomes = await self._flush([event for event, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except (Exception, ApplicationException) as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for index, (_, future) in enumerate(batch):
+                if future.done():
+                    continue
+                error = outcomes[index] if outcomes is not None else None
+                if error is None:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+
+class _ConcurrencyLimiter:
+    """
+    Limits the number of concurrently running handlers of a subscription and
+    keeps its SubscriptionStats up to date.
+    """
+
+    def __init__(self, stats: SubscriptionStats, max_in_flight: int | None) -> None:
+        self.stats = stats
+        self._semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncGenerator[None, None]:
+        stats = self.stats
+
+        stats.queued += 1
+        try:
+            if self._semaphore is not None:
+                await self._semaphore.acquire()
+        finally:
+            stats.queued -= 1
+
+        stats.in_flight += 1
+        try:
+            yield
+        except BaseException:
+            stats.failed += 1
+            raise
+        else:
+            stats.processed += 1
+        finally:
+            stats.in_flight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+
 class RabbitMQEventBus(EventBus):
+    """
+    EventBus publishing events to a RabbitMQ topic exchange.
+
+    Events are published with the routing key `{event_name}.{bucket}`, where the
+    bucket is derived from DomainEvent.partition_key and is one of
+    `partition_buckets`. A subscription has one queue bound to `{event_name}.*`,
+    or with SubscriptionOptions.partitions, one queue per partition bound to the
+    buckets assigned to it by consistent hashing. `partition_buckets` must be
+    the same in every publishing and consuming process.
+
+    Partition queues are declared with `x-single-active-consumer`, so when every
+    worker subscribes, only one consumer of each partition receives messages and
+    the others take over if it goes away. This keeps the order per partition
+    across processes, not only within one.
+
+    Subscriptions are made before the bus is started, since their queues are
+    declared and bound and their consumers started by `start`.
+    """
+
     def __init__(
             self, 
             container: Container, 
             rabbitmq_user: str,
             rabbitmq_password: str,
             rabbitmq_host: str,
-            rabbitmq_port: int    
+            rabbitmq_port: int,
+            publish_batch_size: int = 1,
+            publish_linger: float = 0.0,
+            inbox: Inbox | None = None,
+            partition_buckets: int = 64,
+            event_codecs: EventCodecRegistry | None = None
         ) -> None:
         self._url = f"amqp://{rabbitmq_user}:{rabbitmq_password}@{rabbitmq_host}:{rabbitmq_port}"
         self._broker = RabbitBroker(self._url)
@@ -37,6 +206,20 @@ class RabbitMQEventBus(EventBus):
         )
         self._is_started = False
         self._container = container
+        self._inbox = inbox
+        self._partition_buckets = partition_buckets
+        # Shared with the outbox, so codecs are built once per event type.
+        self._codecs = event_codecs if event_codecs is not None else EventCodecRegistry()
+        self._limiters: list[_ConcurrencyLimiter] = []
+        # Batching is disabled when a batch can hold only one event.
+        self._batcher: _EventBatcher[DomainEvent] | None = None
+        if publish_batch_size > 1:
+            self._batcher = _EventBatcher(
+                self._publish_each, publish_batch_size, publish_linger
+            )
+        self._consumer_batchers: list[_EventBatcher[Any]] = []
+        # RabbitQueue has a single routing key, the rest are bound on start.
+        self._extra_bindings: list[tuple[RabbitQueue, list[str]]] = []
 
     async def start(self):
         if self._is_started:
@@ -46,65 +229,243 @@ class RabbitMQEventBus(EventBus):
         self._is_started = True
 
         await self._app.start()
-        await self._broker.declare_exchange(self._exchange)
+        exchange = await self._broker.declare_exchange(self._exchange)
+
+        for queue, routing_keys in self._extra_bindings:
+            if not routing_keys:
+                continue
+            declared_queue = await self._broker.declare_queue(queue)
+            for routing_key in routing_keys:
+                await declared_queue.bind(exchange, routing_key=routing_key)
+
+        if self._batcher is not None:
+            self._batcher.start()
+
+        for batcher in self._consumer_batchers:
+            batcher.start()
 
     async def stop(self):
         if not self._is_started:
             raise EventBusAlreadyClosedError(
                 "Attempt to call .close method second time without starting."
             )
+
+        if self._batcher is not None:
+            await self._batcher.stop()
+
         self._is_started = False
         await self._app.stop()
 
+        for batcher in self._consumer_batchers:
+            await batcher.stop()
+
     async def publish(self, event: DomainEvent) -> None:
+        self._check_started()
+
+        if self._batcher is not None:
+            await self._batcher.submit(event)
+            return
+
+        await self._publish(event)
+
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        """
+        Publishes all events, raising the first error once every publication
+        is either confirmed or failed.
+        """
+        self._check_started()
+
+        for error in await self._publish_each(events):
+            if error is not None:
+                raise error
+
+    async def _publish_each(self, events: Sequence[DomainEvent]) -> list[BaseException | None]:
+        # All messages are written to the same channel without waiting for
+        # each other, so publisher confirms are awaited as a single batch.
+        # One failed publication does not fail the confirmed ones.
+        return await asyncio.gather(
+            *(self._publish(event) for event in events), return_exceptions=True
+        )
+
+    async def _publish(self, event: DomainEvent) -> None:
+        await self._broker.publish(
+            message=self._codecs.encode(event), 
+            routing_key=(
+                f"{event.event_name}."
+                f"{partition_bucket(event.partition_key, self._partition_buckets)}"
+            ),
+            exchange=self._exchange,
+            content_type="application/json"
+        )
+
+    def _check_started(self) -> None:
         if not self._is_started:
             raise EventBusNotStartedError(
                 "Attempt to use event bus before starting it."
             )
-        
-        event_data = cast(SendableMessage, asdict(event))
-        await self._broker.publish(
-            message=event_data, 
-            routing_key=event.event_name,
-            exchange=self._exchange
-        )
+
+    def _check_not_started(self) -> None:
+        # Consumers added to a running broker are never started, and neither
+        # would the extra routing keys of their queues be bound.
+        if self._is_started:
+            raise EventBusAlreadyStartedError(
+                "Attempt to subscribe after starting event bus."
+            )
 
     def subscribe[T: DomainEvent](
             self, 
             event: type[T], 
             handler: Callable[[T, Container], Awaitable[None]],
+            options: SubscriptionOptions | None = None
+        ) -> None:
+        self._check_not_started()
+        options = options or SubscriptionOptions()
+        queue_name = f"{handler.__module__}.{handler.__qualname__}.queue"
+
+        async def handle(events: list[T]) -> None:
+            async with self._container.scope() as container:
+                if self._inbox is None:
+                    await handler(events[0], container)
+                else:
+                    await self._inbox.handle(
+                        queue_name, events, lambda events: handler(events[0], container)
+                    )
+
+        codec = self._codecs.get(event)
+        for name, queue in self._queues(queue_name, codec.event_name, options.partitions):
+            self._consume(name, queue, codec, handle, options)
+
+    def subscribe_batch[T: DomainEvent](
+            self,
+            event: type[T],
+            handler: Callable[[list[T], Container], Awaitable[None]],
+            max_size: int,
+            max_wait: float,
+            options: SubscriptionOptions | None = None
         ) -> None:
+        """
+        Delivers events to the handler in lists of up to `max_size` events,
+        waiting at most `max_wait` seconds to fill a batch. All messages of a
+        batch are acknowledged when the handler succeeds and nacked (requeued)
+        together when it raises. Stats of the subscription count batches.
+        """
+        self._check_not_started()
+        options = options or SubscriptionOptions()
+        queue_name = f"{handler.__module__}.{handler.__qualname__}.queue"
+
+        async def handle(events: list[T]) -> None:
+            async with self._container.scope() as container:
+                if self._inbox is None:
+                    await handler(events, container)
+                else:
+                    await self._inbox.handle(
+                        queue_name, events, lambda events: handler(events, container)
+                    )
+
+        codec = self._codecs.get(event)
+        for name, queue in self._queues(queue_name, codec.event_name, options.partitions):
+            self._consume_batches(name, queue, codec, handle, max_size, max_wait, options)
+
+    def _consume[T: DomainEvent](
+            self,
+            name: str,
+            queue: RabbitQueue,
+            codec: EventCodec[T],
+            handle: Callable[[list[T]], Awaitable[None]],
+            options: SubscriptionOptions
+        ) -> None:
+        limiter = self._limiter(name, options)
 
-        EventModel = self._pydantic_model_from_dataclass(event)
         @self._broker.subscriber(
-            queue=RabbitQueue(
-                name=f"{handler.__module__}.{handler.__qualname__}.queue",
-                routing_key=self._get_event_name(event),
-                durable=True,  
-            ),
-            exchange=self._exchange
+            queue=queue,
+            exchange=self._exchange,
+            decoder=self._raw_body,
+            # Every subscription gets its own channel, so prefetch is per queue.
+            channel=Channel(prefetch_count=options.prefetch_count)
         )
-        async def _(data: EventModel) -> None:  # type: ignore
-            domain_event = event(**data.model_dump())  # type: ignore
-            await handler(domain_event, self._container)
+        async def _(body: bytes) -> None:
+            event = codec.decode(body)
+            async with limiter.slot():
+                await handle([event])
 
-    @staticmethod
-    def _pydantic_model_from_dataclass(event_type: type[DomainEvent]) -> type[BaseModel]:
-        fields: dict[str, type[object]] = {}
-        for name, annotation in event_type.__annotations__.items():
-            fields[name] = annotation
-
-        pydantic_model = create_model(event_type.__name__ + "Model", **fields)  # type: ignore
-        return pydantic_model
-    
-    @staticmethod
-    def _get_event_name(event_type: type[DomainEvent]) -> str:
-        event_name = "undefined"
+    def _consume_batches[T: DomainEvent](
+            self,
+            name: str,
+            queue: RabbitQueue,
+            codec: EventCodec[T],
+            handle: Callable[[list[T]], Awaitable[None]],
+            max_size: int,
+            max_wait: float,
+            options: SubscriptionOptions
+        ) -> None:
+        limiter = self._limiter(name, options)
+
+        async def flush(events: list[T]) -> None:
+            async with limiter.slot():
+                await handle(events)
+
+        batcher = _EventBatcher(flush, max_size, max_wait)
+        self._consumer_batchers.append(batcher)
+
+        @self._broker.subscriber(
+            queue=queue,
+            exchange=self._exchange,
+            decoder=self._raw_body,
+            ack_policy=AckPolicy.NACK_ON_ERROR,
+            # The next batch is collected while the current one is handled.
+            channel=Channel(prefetch_count=options.prefetch_count or 2 * max_size)
+        )
+        async def _(body: bytes) -> None:
+            await batcher.submit(codec.decode(body))
 
-        for f in fields(event_type):
-            if f.name == "event_name":
-                event_name = cast(str, f.default)
-                break
+    def _limiter(self, name: str, options: SubscriptionOptions) -> _ConcurrencyLimiter:
+        # Partitions are consumed one event (or batch) at a time to keep the order.
+        limiter = _ConcurrencyLimiter(
+            SubscriptionStats(name), 1 if options.partitions else options.max_in_flight
+        )
+        self._limiters.append(limiter)
+        return limiter
+
+    def stats(self) -> tuple[SubscriptionStats, ...]:
+        return tuple(limiter.stats for limiter in self._limiters)
+
+    def _queues(
+            self,
+            queue_name: str,
+            event_name: str,
+            partitions: int | None
+        ) -> list[tuple[str, RabbitQueue]]:
+        """Names and queues of a subscription, one per partition."""
+        if not partitions:
+            return [(queue_name, self._queue(queue_name, [f"{event_name}.*"], False))]
+
+        routing_keys: list[list[str]] = [[] for _ in range(partitions)]
+        for bucket in range(self._partition_buckets):
+            routing_keys[bucket_partition(bucket, partitions)].append(f"{event_name}.{bucket}")
+
+        if not all(routing_keys):
+            raise TooManyPartitionsError(
+                f"Some of {partitions} partitions get none of {self._partition_buckets} "
+                "partition buckets, increase the number of buckets."
+            )
+
+        return [
+            (f"{queue_name}.{partition}", self._queue(f"{queue_name}.{partition}", keys, True))
+            for partition, keys in enumerate(routing_keys)
+        ]
 
-        return event_name        
-    
\ No newline at end of file
+    def _queue(self, name: str, routing_keys: list[str], single_consumer: bool) -> RabbitQueue:
+        queue = RabbitQueue(
+            name=name,
+            routing_key=routing_keys[0],
+            durable=True,
+            # Consumers of other processes stand by instead of sharing the queue.
+            arguments={"x-single-active-consumer": True} if single_consumer else None,
+        )
+        self._extra_bindings.append((queue, routing_keys[1:]))
+        return queue
+
+    @staticmethod
+    async def _raw_body(message: StreamMessage[object]) -> bytes:
+        # Skips broker side JSON decoding, the event codec decodes the body itself.
+        return message.body
@@ -0,0 +1,16 @@
+from typing import Any, Protocol
+
+from sqlalchemy import RowMapping
+
+from src.domain.aggregates.aggregate import Aggregate
+
+
+class AggregateMapper[T: Aggregate](Protocol):
+    """
+    Converts aggregates to table rows and back for SQLAlchemyRepository.
+    Rows are keyed by column name and must contain `id` and `version`.
+    """
+
+    def to_row(self, aggregate: T) -> dict[str, Any]: ...
+
+    def from_row(self, row: RowMapping) -> T: ...
@@ -0,0 +1,173 @@
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from src.application.exceptions.repository_exceptions import VersionMismatchError
+from src.application.ports.cache import Cache
+from src.application.repositories.repository import Repository
+from src.domain.aggregates.aggregate import Aggregate
+from src.infrastructure.identity_map import IdentityMap
+from src.infrastructure.repositories.sqlalchemy_repository import SQLAlchemyRepository
+
+# Version deleted aggregates are invalidated with, newer than any stored one.
+_DELETED_VERSION = 2**53 - 1
+
+
+class AggregateSerializer[T: Aggregate](Protocol):
+    """
+    Converts aggregates to cache values and back. The value must include the
+    aggregate version.
+    """
+
+    def dumps(self, aggregate: T) -> bytes: ...
+
+    def loads(self, data: bytes) -> T: ...
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters of aggregates read from the cache and from the database."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class CachedRepository[T: Aggregate](Repository[T]):
+    """
+    Read-through cache in front of a SQLAlchemyRepository.
+
+    get_by_id and get_many return aggregates from the identity map first, then
+    from the cache, and select only the rest, caching them afterwards. Cached
+    values hold the aggregate version, so a stale aggregate read from the cache
+    cannot be written: the version-guarded update fails with
+    VersionMismatchError, which also removes the stale entries right away.
+
+    Entries are versioned by the aggregate version. Entries of written and
+    deleted aggregates are invalidated with their new version only after the
+    unit of work commits, through `after_commit`
+    (SQLAlchemyUnitOfWork.after_commit), so a rolled back transaction never
+    touches the cache. Selected aggregates are cached only if no newer version
+    was invalidated, so a read racing with a write cannot cache the old version.
+    Entries expire after `ttl` seconds, which bounds the staleness when the
+    cache misses an invalidation, e.g. when a process dies right after commit.
+
+    `stats` is shared by all repositories of the same cache, since repositories
+    live only as long as their unit of work.
+    """
+
+    def __init__(
+            self,
+            repository: SQLAlchemyRepository[T],
+            identity_map: IdentityMap,
+            aggregate_type: type[T],
+            cache: Cache,
+            serializer: AggregateSerializer[T],
+            after_commit: Callable[[Callable[[], Awaitable[None]]], None],
+            stats: CacheStats,
+            ttl: float = 300.0
+        ) -> None:
+        self._repository = repository
+        self._identity_map = identity_map
+        self._aggregate_type = aggregate_type
+        self._cache = cache
+        self._serializer = serializer
+        self._after_commit = after_commit
+        self._stats = stats
+        self._ttl = ttl
+
+    async def get_by_id(self, id: uuid.UUID) -> T | None:
+        aggregates = await self.get_many([id])
+        return aggregates[0] if aggregates else None
+
+    async def get_many(self, ids: Sequence[uuid.UUID]) -> list[T]:
+        missing = [id for id in ids if self._identity_map.get(self._aggregate_type, id) is None]
+
+        if missing:
+            cached = await self._cache.get_many([self._key(id) for id in missing])
+            for data in cached.values():
+                self._identity_map.add(self._serializer.loads(data), self)
+            self._stats.hits += len(cached)
+
+            missing = [id for id in missing if self._key(id) not in cached]
+
+        if missing:
+            self._stats.misses += len(missing)
+            loaded = await self._repository.get_many(missing)
+            self._track(loaded)
+            await self._cache.set_many_if_newer(
+                {
+                    self._key(item.id): (item.version, self._serializer.dumps(item))
+                    for item in loaded
+                },
+                self._ttl,
+            )
+
+        aggregates: list[T] = []
+        for id in ids:
+            aggregate = self._identity_map.get(self._aggregate_type, id)
+            if aggregate is not None:
+                aggregates.append(aggregate)
+        return aggregates
+
+    async def get_version(self, id: uuid.UUID) -> int | None:
+        # Cached entries may be stale, versions are always read from the database.
+        return await self._repository.get_version(id)
+
+    async def exists(self, id: uuid.UUID) -> bool:
+        return await self._repository.exists(id)
+
+    async def exists_many(self, ids: Sequence[uuid.UUID]) -> set[uuid.UUID]:
+        return await self._repository.exists_many(ids)
+
+    async def add(self, aggregate_root: T) -> None:
+        await self.add_many([aggregate_root])
+
+    async def add_many(self, aggregate_roots: Sequence[T]) -> None:
+        await self._repository.add_many(aggregate_roots)
+        self._track(aggregate_roots)
+
+    async def edit(self, aggregate_root: T) -> None:
+        await self.edit_many([aggregate_root])
+
+    async def edit_many(self, aggregate_roots: Sequence[T]) -> None:
+        await self._write(aggregate_roots, lambda: self._repository.edit_many(aggregate_roots))
+        self._track(aggregate_roots)
+
+    async def delete(self, id: uuid.UUID) -> None:
+        await self._repository.delete(id)
+        self._invalidate_after_commit({id: _DELETED_VERSION})
+
+    def snapshot(self, aggregate: T) -> object:
+        return self._repository.snapshot(aggregate)
+
+    async def save_changes(self, changes: list[tuple[T, int]]) -> None:
+        await self._write(
+            [aggregate for aggregate, _ in changes], lambda: self._repository.save_changes(changes)
+        )
+
+    async def _write(self, aggregates: Sequence[T], write: Callable[[], Awaitable[None]]) -> None:
+        try:
+            await write()
+        except VersionMismatchError:
+            # Some entries are stale, the retry of the caller must not read them.
+            await self._cache.delete(*(self._key(aggregate.id) for aggregate in aggregates))
+            raise
+        # Versions are taken now, the aggregates may change again before commit.
+        self._invalidate_after_commit({aggregate.id: aggregate.version for aggregate in aggregates})
+
+    def _invalidate_after_commit(self, versions: dict[uuid.UUID, int]) -> None:
+        keys = {self._key(id): version for id, version in versions.items()}
+
+        async def invalidate() -> None:
+            await self._cache.invalidate_versions(keys, self._ttl)
+
+        self._after_commit(invalidate)
+
+    def _track(self, aggregates: Sequence[T]) -> None:
+        # Changed aggregates are saved through this repository, not the wrapped one.
+        for aggregate in aggregates:
+            self._identity_map.add(aggregate, self)
+
+    def _key(self, id: uuid.UUID) -> str:
+        return f"aggregate:{self._aggregate_type.__qualname__}:{id}"
@@ -0,0 +1,49 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+
+from src.application.exceptions.repository_exceptions import InvalidCursorError
+
+
+@dataclass(frozen=True, slots=True)
+class Page[T]:
+    """
+    Items of one page and the cursor of the next one, which is None on the
+    last page.
+    """
+
+    items: list[T]
+    next_cursor: str | None
+
+
+def encode_cursor(ordering: str, key: tuple[Any, ...]) -> str:
+    """
+    Encodes the sort key of the last item of a page into an opaque cursor,
+    bound to the ordering it was produced with.
+    """
+    payload = json.dumps([ordering, to_jsonable_python(key)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, ordering: str, key_types: tuple[type, ...]) -> tuple[Any, ...]:
+    """
+    Returns the sort key encoded by encode_cursor, converted to `key_types`.
+    Raises InvalidCursorError if the cursor is malformed or was produced for
+    another ordering.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_ordering, key = json.loads(payload)
+        if cursor_ordering != ordering or len(key) != len(key_types):
+            raise InvalidCursorError(f"Cursor {cursor!r} is not for ordering {ordering!r}.")
+        return tuple(
+            TypeAdapter[Any](key_type).validate_python(value)
+            for key_type, value in zip(key_types, key, strict=True)
+        )
+    except (binascii.Error, ValueError, TypeError, ValidationError) as exc:
+        raise InvalidCursorError(f"Cursor {cursor!r} is malformed.") from exc
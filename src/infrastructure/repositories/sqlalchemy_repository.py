@@ -0,0 +1,318 @@
+import uuid
+from collections.abc import AsyncGenerator, AsyncIterable, Collection, Iterable, Sequence
+from typing import Any, cast
+
+from psycopg.errors import UniqueViolation
+from sqlalchemy import (
+    BindParameter,
+    ColumnElement,
+    RowMapping,
+    Table,
+    any_,
+    bindparam,
+    delete,
+    insert,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.exceptions.repository_exceptions import (
+    AggregateAlreadyExistsError,
+    AggregateNotFoundError,
+    InvalidOrderingError,
+)
+from src.application.repositories.repository import Repository
+from src.domain.aggregates.aggregate import Aggregate
+from src.infrastructure.identity_map import IdentityMap
+from src.infrastructure.repositories.aggregate_mapper import AggregateMapper
+from src.infrastructure.repositories.pagination import Page, decode_cursor, encode_cursor
+from src.infrastructure.sqlalchemy.bulk_copy import copy_rows, upsert_rows
+from src.infrastructure.sqlalchemy.versioning import update_versioned
+
+
+class SQLAlchemyRepository[T: Aggregate](Repository[T]):
+    """
+    Repository of aggregates stored in a single table with `id` and `version`
+    columns, converted to rows and back by an AggregateMapper.
+
+    Loaded and added aggregates are kept in the identity map of the unit of
+    work, so each aggregate is selected at most once, and changed aggregates
+    are written on commit. Bulk methods use one statement for all ids: reads
+    filter with `id = ANY(:ids)`, inserts are multi-row `INSERT ... RETURNING`
+    and updates are a single version-guarded executemany.
+
+    Large result sets are read with `iterate`, which streams them through a
+    server-side cursor, or `page`, which uses keyset pagination, so neither
+    holds the whole result in memory nor scans skipped rows like OFFSET.
+    Imports of many aggregates go through `ingest` and `upsert`, which stream
+    them with binary COPY.
+
+    Pages can be ordered by id and by the `sortable_columns`, which should be
+    indexed together with id.
+
+    Subclasses bind the table, aggregate type and mapper, e.g.
+
+    class SQLAlchemyUserRepository(SQLAlchemyRepository[User]):
+        def __init__(self, session: AsyncSession, identity_map: IdentityMap) -> None:
+            super().__init__(session, identity_map, UserModel.__table__, User, UserMapper())
+    """
+
+    def __init__(
+            self,
+            session: AsyncSession,
+            identity_map: IdentityMap,
+            table: Table,
+            aggregate_type: type[T],
+            mapper: AggregateMapper[T],
+            sortable_columns: Collection[str] = ()
+        ) -> None:
+        self._session = session
+        self._identity_map = identity_map
+        self._table = table
+        self._aggregate_type = aggregate_type
+        self._mapper = mapper
+        self._sortable_columns = {"id", *sortable_columns}
+
+    async def get_by_id(self, id: uuid.UUID) -> T | None:
+        aggregates = await self.get_many([id])
+        return aggregates[0] if aggregates else None
+
+    async def get_many(self, ids: Sequence[uuid.UUID]) -> list[T]:
+        """
+        Returns the existing aggregates in the order of `ids`. Only aggregates
+        missing from the identity map are selected.
+        """
+        missing = [id for id in ids if self._identity_map.get(self._aggregate_type, id) is None]
+        if missing:
+            result = await self._session.execute(
+                select(self._table).where(self._table.c.id == any_(self._ids_parameter(missing)))
+            )
+            for row in result.mappings():
+                self._load(row)
+
+        aggregates: list[T] = []
+        for id in ids:
+            aggregate = self._identity_map.get(self._aggregate_type, id)
+            if aggregate is not None:
+                aggregates.append(aggregate)
+        return aggregates
+
+    async def get_version(self, id: uuid.UUID) -> int | None:
+        """
+        Returns the stored version, selecting only the version column, e.g. to
+        check an ETag. A mapped aggregate answers with its persisted version.
+        """
+        aggregate = self._identity_map.get(self._aggregate_type, id)
+        if aggregate is not None:
+            return self._identity_map.persisted_version(aggregate)
+
+        result = await self._session.execute(
+            select(self._table.c.version).where(self._table.c.id == id)
+        )
+        return result.scalar_one_or_none()
+
+    async def iterate(
+            self,
+            where: ColumnElement[bool] | None = None,
+            batch_size: int = 1000
+        ) -> AsyncGenerator[list[T], None]:
+        """
+        Yields the aggregates matching `where` in batches of `batch_size`,
+        fetched through a server-side cursor, in no particular order.
+
+        Yielded aggregates are not kept in the identity map, so memory stays
+        flat, and their changes are not written on commit: write them with
+        edit_many. Aggregates already in the map are yielded as mapped.
+        """
+        statement = select(self._table).execution_options(yield_per=batch_size)
+        if where is not None:
+            statement = statement.where(where)
+
+        result = await self._session.stream(statement)
+        try:
+            async for rows in result.mappings().partitions():
+                yield [
+                    self._identity_map.get(self._aggregate_type, row["id"])
+                    or self._mapper.from_row(row)
+                    for row in rows
+                ]
+        finally:
+            await result.close()
+
+    async def page(
+            self,
+            limit: int,
+            cursor: str | None = None,
+            where: ColumnElement[bool] | None = None,
+            order_by: str = "id",
+            descending: bool = False
+        ) -> Page[T]:
+        """
+        Returns up to `limit` aggregates matching `where`, ordered by the
+        `order_by` column and then by id, following the item `cursor` points to.
+
+        The page starts right after the sort key encoded in the cursor, so
+        every page costs the same index range scan however deep it is. Raises
+        InvalidOrderingError if `order_by` is not a sortable column, and
+        InvalidCursorError if the cursor was produced for another ordering.
+        """
+        if order_by not in self._sortable_columns:
+            raise InvalidOrderingError(
+                f"Aggregates in '{self._table.name}' cannot be ordered by {order_by!r}."
+            )
+        columns = [self._table.c[order_by]]
+        if order_by != "id":
+            columns.append(self._table.c.id)
+        ordering = f"{order_by}:{'desc' if descending else 'asc'}"
+
+        statement = select(self._table)
+        if where is not None:
+            statement = statement.where(where)
+        if cursor is not None:
+            key = decode_cursor(
+                cursor, ordering, tuple(column.type.python_type for column in columns)
+            )
+            position = tuple_(*columns)
+            statement = statement.where(
+                position < tuple_(*key) if descending else position > tuple_(*key)
+            )
+        statement = statement.order_by(
+            *(column.desc() if descending else column.asc() for column in columns)
+        ).limit(limit + 1)
+
+        rows = (await self._session.execute(statement)).mappings().all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(
+                ordering, tuple(rows[-1][column.name] for column in columns)
+            )
+        return Page([self._load(row) for row in rows], next_cursor)
+
+    async def exists(self, id: uuid.UUID) -> bool:
+        return id in await self.exists_many([id])
+
+    async def exists_many(self, ids: Sequence[uuid.UUID]) -> set[uuid.UUID]:
+        result = await self._session.execute(
+            select(self._table.c.id).where(self._table.c.id == any_(self._ids_parameter(ids)))
+        )
+        return set(result.scalars())
+
+    async def add(self, aggregate_root: T) -> None:
+        await self.add_many([aggregate_root])
+
+    async def add_many(self, aggregate_roots: Sequence[T]) -> None:
+        if not aggregate_roots:
+            return
+
+        try:
+            # Rows are passed as executemany parameters, which SQLAlchemy pages into
+            # multi-row INSERT ... RETURNING statements within the bind parameter limit.
+            result = await self._session.execute(
+                insert(self._table).returning(self._table.c.id),
+                [self._mapper.to_row(aggregate) for aggregate in aggregate_roots],
+            )
+        except IntegrityError as exc:
+            # Other unique and foreign key violations are not about the ids.
+            if not self._is_primary_key_violation(exc):
+                raise
+            raise AggregateAlreadyExistsError(
+                f"Some of {[aggregate.id for aggregate in aggregate_roots]} already exist "
+                f"in '{self._table.name}'."
+            ) from exc
+
+        inserted = set(result.scalars())
+        for aggregate in aggregate_roots:
+            if aggregate.id in inserted:
+                self._identity_map.add(aggregate, self)
+
+    async def ingest(self, aggregate_roots: Iterable[T] | AsyncIterable[T]) -> int:
+        """
+        Inserts aggregates with binary COPY within the current transaction and
+        returns their number. Aggregates are streamed, not kept in the identity
+        map, so their events are not saved to the outbox.
+        """
+        return await copy_rows(self._session, self._table, self._rows(aggregate_roots))
+
+    async def upsert(self, aggregate_roots: Iterable[T] | AsyncIterable[T]) -> int:
+        """
+        Inserts aggregates or overwrites the stored ones with the same id,
+        through a staging table filled with binary COPY, and returns their
+        number. Stored versions are not checked, the last import wins.
+        """
+        return await upsert_rows(self._session, self._table, self._rows(aggregate_roots))
+
+    async def edit(self, aggregate_root: T) -> None:
+        await self.edit_many([aggregate_root])
+
+    async def edit_many(self, aggregate_roots: Sequence[T]) -> None:
+        """
+        Writes the aggregates right away instead of on commit. Aggregates that
+        are not in the identity map are expected to be stored with their
+        current version.
+        """
+        changes: list[tuple[T, int]] = []
+        for aggregate in aggregate_roots:
+            version = self._identity_map.persisted_version(aggregate)
+            if version is None:
+                version = aggregate.version
+            if aggregate.version == version:
+                aggregate.increment_version()
+            changes.append((aggregate, version))
+
+        await self.save_changes(changes)
+        for aggregate in aggregate_roots:
+            self._identity_map.add(aggregate, self)
+
+    async def delete(self, id: uuid.UUID) -> None:
+        result = cast(
+            CursorResult[Any],
+            await self._session.execute(delete(self._table).where(self._table.c.id == id))
+        )
+        self._identity_map.remove(self._aggregate_type, id)
+        if result.rowcount == 0:
+            raise AggregateNotFoundError(
+                f"{self._aggregate_type.__name__} {id} does not exist."
+            )
+
+    def snapshot(self, aggregate: T) -> object:
+        return self._mapper.to_row(aggregate)
+
+    async def save_changes(self, changes: list[tuple[T, int]]) -> None:
+        await update_versioned(
+            self._session,
+            self._table,
+            [(self._mapper.to_row(aggregate), version) for aggregate, version in changes],
+        )
+
+    def _is_primary_key_violation(self, exc: IntegrityError) -> bool:
+        # Named by PostgreSQL after the table unless the table names it.
+        name = self._table.primary_key.name or f"{self._table.name}_pkey"
+        return isinstance(exc.orig, UniqueViolation) and exc.orig.diag.constraint_name == name
+
+    async def _rows(
+            self,
+            aggregate_roots: Iterable[T] | AsyncIterable[T]
+        ) -> AsyncGenerator[dict[str, Any], None]:
+        if isinstance(aggregate_roots, AsyncIterable):
+            async for aggregate in aggregate_roots:
+                yield self._mapper.to_row(aggregate)
+        else:
+            for aggregate in aggregate_roots:
+                yield self._mapper.to_row(aggregate)
+
+    def _load(self, row: RowMapping) -> T:
+        # The mapped instance may hold changes that are not written yet.
+        aggregate = self._identity_map.get(self._aggregate_type, row["id"])
+        if aggregate is None:
+            aggregate = self._mapper.from_row(row)
+            self._identity_map.add(aggregate, self)
+        return aggregate
+
+    def _ids_parameter(self, ids: Sequence[uuid.UUID]) -> BindParameter[Sequence[Any]]:
+        # One array parameter keeps the statement the same for any number of ids.
+        return bindparam("ids", list(ids), type_=ARRAY(self._table.c.id.type))
@@ -0,0 +1,170 @@
+import uuid
+from collections.abc import AsyncIterable, Callable, Iterable, Mapping, Sequence
+from typing import Any, cast
+
+from psycopg import AsyncConnection, sql
+from sqlalchemy import Enum, Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+type Rows = Iterable[Mapping[str, Any]] | AsyncIterable[Mapping[str, Any]]
+
+# Enum labels are sent in the binary format of text, which enum_recv accepts
+# as well, domains in the binary format of their base type.
+_COLUMN_TYPES = sql.SQL("""
+    SELECT a.attname, CASE t.typtype
+        WHEN 'e' THEN 'text'::regtype::oid
+        WHEN 'd' THEN t.typbasetype
+        ELSE a.atttypid
+    END
+    FROM pg_attribute a
+    JOIN pg_class c ON c.oid = a.attrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_type t ON t.oid = a.atttypid
+    WHERE c.relname = %s AND n.nspname = coalesce(%s, current_schema())
+        AND a.attnum > 0 AND NOT a.attisdropped
+""")
+
+
+async def copy_rows(
+        session: AsyncSession,
+        table: Table,
+        rows: Rows,
+        columns: Sequence[str] | None = None
+    ) -> int:
+    """
+    Inserts rows with binary `COPY ... FROM STDIN` within the transaction of
+    the session, streaming them without building a statement, and returns
+    their number.
+
+    Rows are keyed by column name and must contain all `columns`, which
+    default to all columns of the table. Unlike INSERT, a row violating a
+    constraint fails the whole COPY.
+    """
+    if columns is None:
+        columns = [column.name for column in table.columns]
+
+    connection = await _driver_connection(session)
+    return await _copy(connection, table, sql.Identifier(table.name), rows, columns)
+
+
+async def upsert_rows(
+        session: AsyncSession,
+        table: Table,
+        rows: Rows,
+        columns: Sequence[str] | None = None,
+        conflict_columns: Sequence[str] = ("id",)
+    ) -> int:
+    """
+    Inserts rows or updates the existing ones with the same `conflict_columns`,
+    within the transaction of the session, and returns their number.
+
+    Rows are copied with binary COPY into a temporary staging table first and
+    then merged with one `INSERT ... SELECT ... ON CONFLICT DO UPDATE`. Updated
+    rows are overwritten as they are, versions are not checked.
+    """
+    if columns is None:
+        columns = [column.name for column in table.columns]
+
+    connection = await _driver_connection(session)
+    staging = sql.Identifier(f"{table.name}_staging_{uuid.uuid4().hex[:12]}")
+    target = sql.Identifier(table.name)
+    column_list = sql.SQL(", ").join(map(sql.Identifier, columns))
+    updates = [
+        sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(name))
+        for name in columns
+        if name not in conflict_columns
+    ]
+
+    async with connection.cursor() as cursor:
+        await cursor.execute(
+            sql.SQL(
+                "CREATE TEMPORARY TABLE {} (LIKE {} INCLUDING DEFAULTS) ON COMMIT DROP"
+            ).format(staging, target)
+        )
+        count = await _copy(connection, table, staging, rows, columns)
+        await cursor.execute(
+            sql.SQL("INSERT INTO {} ({}) SELECT {} FROM {} ON CONFLICT ({}) {}").format(
+                target,
+                column_list,
+                column_list,
+                staging,
+                sql.SQL(", ").join(map(sql.Identifier, conflict_columns)),
+                sql.SQL("DO UPDATE SET {}").format(sql.SQL(", ").join(updates))
+                if updates else sql.SQL("DO NOTHING"),
+            )
+        )
+        # Several upserts may run within one transaction.
+        await cursor.execute(sql.SQL("DROP TABLE {}").format(staging))
+    return count
+
+
+async def _copy(
+        connection: AsyncConnection[Any],
+        table: Table,
+        target: sql.Identifier,
+        rows: Rows,
+        columns: Sequence[str]
+    ) -> int:
+    statement = sql.SQL("COPY {} ({}) FROM STDIN (FORMAT BINARY)").format(
+        target, sql.SQL(", ").join(map(sql.Identifier, columns))
+    )
+    count = 0
+    # Binary COPY does not describe the columns, their types must be given.
+    types = await _column_types(connection, table, columns)
+    processors = _processors(table, columns)
+    async with connection.cursor() as cursor, cursor.copy(statement) as copy:
+        copy.set_types(types)
+        if isinstance(rows, AsyncIterable):
+            async for row in rows:
+                await copy.write_row(_values(row, columns, processors))
+                count += 1
+        else:
+            for row in rows:
+                await copy.write_row(_values(row, columns, processors))
+                count += 1
+    return count
+
+
+async def _column_types(
+        connection: AsyncConnection[Any],
+        table: Table,
+        columns: Sequence[str]
+    ) -> list[int]:
+    # Looked up in the database, as the names SQLAlchemy compiles types to
+    # (e.g. "FLOAT" or the name of an enum) are not all known to psycopg.
+    async with connection.cursor() as cursor:
+        await cursor.execute(_COLUMN_TYPES, (table.name, table.schema))
+        oids: dict[str, int] = dict(await cursor.fetchall())
+    return [oids[name] for name in columns]
+
+
+def _processors(
+        table: Table,
+        columns: Sequence[str]
+    ) -> list[Callable[[Any], Any] | None]:
+    # Enum members are stored the way SQLAlchemy binds them, by name unless
+    # the type is configured otherwise.
+    dialect = postgresql.psycopg.dialect()
+    return [
+        column.type.bind_processor(dialect) if isinstance(column.type, Enum) else None
+        for column in (table.c[name] for name in columns)
+    ]
+
+
+def _values(
+        row: Mapping[str, Any],
+        columns: Sequence[str],
+        processors: Sequence[Callable[[Any], Any] | None]
+    ) -> list[Any]:
+    return [
+        row[name] if process is None else process(row[name])
+        for name, process in zip(columns, processors, strict=True)
+    ]
+
+
+async def _driver_connection(session: AsyncSession) -> AsyncConnection[Any]:
+    # The connection the session runs its transaction on, so COPY joins it.
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return cast(AsyncConnection[Any], raw_connection.driver_connection)
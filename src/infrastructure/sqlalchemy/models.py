@@ -1,8 +1,47 @@
-from sqlalchemy.orm import DeclarativeBase
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, Identity, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 from src.infrastructure.sqlalchemy.setup import metadata
 
 
 class BaseModel(DeclarativeBase):
     metadata = metadata
-    
\ No newline at end of file
+
+
+class OutboxMessageModel(BaseModel):
+    """
+    Domain events saved in the same transaction as the aggregates that recorded
+    them. Rows are published and deleted by the OutboxRelay. Rows it cannot
+    decode are dead-lettered instead: `failed_at` and `error` are set and the
+    relay skips them from then on.
+    """
+
+    __tablename__ = "outbox_messages"
+
+    # Sequential key keeps relay order equal to the insertion order.
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    event_id: Mapped[uuid.UUID] = mapped_column(unique=True)
+    event_name: Mapped[str] = mapped_column(String(255))
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    occured_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    failed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    error: Mapped[str | None] = mapped_column(Text)
+
+
+class InboxMessageModel(BaseModel):
+    """
+    Ids of events already processed by a consumer, used to skip redeliveries.
+    """
+
+    __tablename__ = "inbox_messages"
+
+    consumer: Mapped[str] = mapped_column(String(255), primary_key=True)
+    event_id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    processed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
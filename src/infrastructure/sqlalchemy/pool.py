@@ -0,0 +1,81 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import PoolProxiedConnection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class MeasuredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that measures how long checkouts take, which includes waiting
+    for a free connection when the pool is exhausted and opening new ones.
+    """
+
+    def __init__(self, creator: Any, **kwargs: Any) -> None:
+        super().__init__(creator, **kwargs)
+        self.checkouts = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_time += waited
+            self.max_wait_time = max(self.max_wait_time, waited)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    """Point-in-time state of a connection pool, wait times are in seconds."""
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    wait_time: float
+    max_wait_time: float
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.wait_time / self.checkouts if self.checkouts else 0.0
+
+
+def pool_stats(engine: AsyncEngine) -> PoolStats:
+    pool = engine.pool
+    if not isinstance(pool, MeasuredQueuePool):
+        raise TypeError(f"Engine pool is {type(pool).__name__}, not MeasuredQueuePool.")
+
+    return PoolStats(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        # Starts at -size and grows as connections are opened.
+        overflow=max(0, pool.overflow()),
+        checkouts=pool.checkouts,
+        wait_time=pool.wait_time,
+        max_wait_time=pool.max_wait_time,
+    )
+
+
+async def prewarm(engine: AsyncEngine, connections: int) -> None:
+    """
+    Opens `connections` connections concurrently and returns them to the pool,
+    so the first requests do not pay for connection setup. Connections above
+    the pool size would be closed on return, so at most that many are opened.
+    """
+    pool = engine.pool
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        connections = min(connections, pool.size())
+    if connections <= 0:
+        return
+
+    opened = await asyncio.gather(*(engine.connect().start() for _ in range(connections)))
+    await asyncio.gather(*(connection.close() for connection in opened))
@@ -1,24 +1,58 @@
 from sqlalchemy import MetaData
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from src.config import settings
+from src.infrastructure.sqlalchemy.pool import MeasuredQueuePool
 
-DATABASE_URL = (
-    f"postgresql+psycopg://{settings.POSTGRES_USER}@{settings.POSTGRES_PASSWORD}"
-    f"@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
-)
 
-engine = create_async_engine(
-    url=DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_size=10,
-    max_overflow=40,
-    pool_timeout=30,
-    pool_recycle=1800,
-)
+def _database_url(host: str, port: int) -> str:
+    return (
+        f"postgresql+psycopg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}"
+        f"@{host}:{port}/{settings.POSTGRES_DB}"
+    )
+
+
+def _pool_share(connections: int) -> int:
+    if settings.POSTGRES_POOL_SIZING == "per_process":
+        return connections
+    # Every worker has its own pool, together they stay within the configured total.
+    return connections // max(1, settings.WEB_CONCURRENCY)
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url=url,
+        echo=settings.DEBUG,
+        poolclass=MeasuredQueuePool,
+        pool_size=max(1, _pool_share(settings.POSTGRES_POOL_SIZE)),
+        max_overflow=_pool_share(settings.POSTGRES_MAX_OVERFLOW),
+        pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+    )
+
+
+DATABASE_URL = _database_url(settings.POSTGRES_HOST, settings.POSTGRES_PORT)
+
+engine = _create_engine(DATABASE_URL)
 
 new_session = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Read-only traffic goes to the replica when one is configured.
+replica_engine = engine
+if settings.POSTGRES_REPLICA_HOST:
+    replica_engine = _create_engine(
+        _database_url(settings.POSTGRES_REPLICA_HOST, settings.POSTGRES_REPLICA_PORT)
+    )
+
+new_replica_session = async_sessionmaker(
+    bind=replica_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 metadata = MetaData()
@@ -0,0 +1,51 @@
+from collections.abc import Mapping
+from typing import Any, cast
+
+from sqlalchemy import Table, bindparam, update
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.exceptions.repository_exceptions import VersionMismatchError
+
+
+async def update_versioned(
+        session: AsyncSession,
+        table: Table,
+        rows: list[tuple[Mapping[str, Any], int]]
+    ) -> None:
+    """
+    Updates rows by their `id` with optimistic concurrency control.
+
+    Each row is paired with the version it was loaded with, and is updated only
+    while the stored `version` still equals it. All rows are sent as one
+    executemany of a single statement, and the version checks are verified at
+    once by the total number of updated rows. Raises VersionMismatchError if
+    any row was changed or deleted concurrently.
+    """
+    if not rows:
+        return
+
+    columns = [name for name in rows[0][0] if name != "id"]
+    statement = (
+        update(table)
+        .where(
+            table.c.id == bindparam("_id"),
+            table.c.version == bindparam("_expected_version"),
+        )
+        .values({name: bindparam(f"_{name}") for name in columns})
+    )
+    parameters = [
+        {
+            "_id": row["id"],
+            "_expected_version": expected_version,
+            **{f"_{name}": row[name] for name in columns},
+        }
+        for row, expected_version in rows
+    ]
+
+    result = cast(CursorResult[Any], await session.execute(statement, parameters))
+    if result.rowcount != len(rows):
+        raise VersionMismatchError(
+            f"{len(rows) - result.rowcount} of {len(rows)} rows of '{table.name}' were "
+            f"changed or deleted concurrently: {[row['id'] for row, _ in rows]}."
+        )
@@ -1,6 +1,9 @@
+import logging
+from collections.abc import Awaitable, Callable
 from types import TracebackType
-from typing import Self, cast
+from typing import Any, Self, cast
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.application.exceptions.unit_of_work_exceptions import (
@@ -8,18 +11,38 @@ from src.application.exceptions.unit_of_work_exceptions import (
     UnitOfWorkAlreadyInitializedError,
     UnitOfWorkNotInitializedError,
 )
-from src.application.unit_of_work import UnitOfWork
+from src.application.unit_of_work import ReadOnlyUnitOfWork, UnitOfWork
+from src.domain.aggregates.aggregate import Aggregate
+from src.infrastructure.event_codecs import EventCodecRegistry
+from src.infrastructure.identity_map import IdentityMap
+from src.infrastructure.inbox import record_current_delivery
+from src.infrastructure.sqlalchemy.models import OutboxMessageModel
+from src.shared.exceptions import ApplicationException
+
+logger = logging.getLogger(__name__)
 
 
 class SQLAlchemyUnitOfWork(UnitOfWork):
 
-    def __init__(self, new_session: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+            self, 
+            new_session: async_sessionmaker[AsyncSession],
+            event_codecs: EventCodecRegistry
+        ) -> None:
         self._new_session = new_session
+        self._event_codecs = event_codecs
         self._session: AsyncSession | None = None
         self._discarded = False
         self._transaction_completed = False
+        self._aggregates: dict[int, Aggregate] = {}
+        self._identity_map = IdentityMap()
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
 
     def _register_repositories(self, session: AsyncSession) -> None:
+        """
+        Creates the repositories sharing the session and the identity map, e.g.
+        self.users = SQLAlchemyUserRepository(session, self._identity_map)
+        """
         pass
 
     async def __aenter__(self) -> Self:
@@ -39,14 +62,40 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
 
         await cast(AsyncSession, self._session).close()
         self._session = None
+        self._aggregates.clear()
+        self._identity_map.clear()
+        self._after_commit.clear()
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Registers a callback run after the transaction is committed, e.g. to
+        invalidate caches. Callbacks are dropped if the transaction is rolled back.
+        """
+        self._check_initialized()
+        self._after_commit.append(callback)
+
+    def track(self, aggregate: Aggregate) -> None:
+        self._check_initialized()
+        self._aggregates[aggregate.instance_id] = aggregate
 
     async def commit(self) -> None:
         self._check_initialized()
         self._check_transaction_not_completed()
         # _check_initialized checks if the session is not None
-        await cast(AsyncSession, self._session).commit()
+        session = cast(AsyncSession, self._session)
+        await self._save_changes()
+        await self._save_events(session)
+        await record_current_delivery(session)
+        await session.commit()
         self._mark_transaction_completed()
 
+        # The transaction is committed, failing callbacks must not fail the commit.
+        for callback in self._after_commit:
+            try:
+                await callback()
+            except (Exception, ApplicationException):
+                logger.exception("After commit callback failed")
+
     async def rollback(self) -> None:
         self._check_initialized()
         self._check_transaction_not_completed()
@@ -54,6 +103,41 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
         await cast(AsyncSession, self._session).rollback()
         self._mark_transaction_completed()
 
+    async def _save_changes(self) -> None:
+        """
+        Writes the aggregates of the identity map changed since they were loaded,
+        with one save_changes call per repository. The version of a changed
+        aggregate is incremented, unless the domain has already done it.
+        """
+        for repository, changes in self._identity_map.changes().items():
+            for aggregate, version in changes:
+                if aggregate.version == version:
+                    aggregate.increment_version()
+            await repository.save_changes(changes)
+            for aggregate, _ in changes:
+                self._identity_map.add(aggregate, repository)
+
+    async def _save_events(self, session: AsyncSession) -> None:
+        """
+        Inserts events of tracked aggregates into the outbox with one executemany
+        insert, batched by the driver, so they are committed atomically with the
+        aggregates.
+        """
+        rows: list[dict[str, Any]] = []
+        aggregates = {aggregate.instance_id: aggregate for aggregate in self._identity_map}
+        aggregates.update(self._aggregates)
+        for aggregate in aggregates.values():
+            for event in aggregate.pull_events():
+                rows.append({
+                    "event_id": event.event_id,
+                    "event_name": event.event_name,
+                    "payload": self._event_codecs.get(type(event)).to_dict(event),
+                    "occured_at": event.occured_at,
+                })
+
+        if rows:
+            await session.execute(insert(OutboxMessageModel), rows)
+
     def _check_initialized(self) -> None:
         if self._session is None:
             raise UnitOfWorkNotInitializedError(
@@ -74,4 +158,46 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
 
     def _mark_transaction_completed(self) -> None:
         self._transaction_completed = True
-        
\ No newline at end of file
+        
+
+class SQLAlchemyReadOnlyUnitOfWork(ReadOnlyUnitOfWork):
+    """
+    Unit of work for queries, bound to the read replica when one is configured.
+
+    The transaction is started as READ ONLY, so the database may skip write
+    bookkeeping, and it is never committed or rolled back explicitly: the
+    session is closed on exit, which ends the transaction.
+    """
+
+    def __init__(self, new_session: async_sessionmaker[AsyncSession]) -> None:
+        self._new_session = new_session
+        self._session: AsyncSession | None = None
+        self._identity_map = IdentityMap()
+
+    def _register_repositories(self, session: AsyncSession) -> None:
+        """
+        Creates the repositories sharing the session and the identity map, e.g.
+        self.users = SQLAlchemyUserRepository(session, self._identity_map)
+        """
+        pass
+
+    async def __aenter__(self) -> Self:
+        if self._session is not None:
+            raise UnitOfWorkAlreadyInitializedError(
+                "Attempt to initialize already initialized unit of work."
+            )
+        self._session = self._new_session()
+        # psycopg starts the transaction with BEGIN READ ONLY, no extra round trip.
+        await self._session.connection(execution_options={"postgresql_readonly": True})
+        self._register_repositories(self._session)
+        return self
+
+    async def __aexit__(
+            self, 
+            exc_type: type[BaseException] | None, 
+            exc_val: BaseException | None, 
+            exc_tb: TracebackType | None
+        ) -> bool | None:
+        await cast(AsyncSession, self._session).close()
+        self._session = None
+        self._identity_map.clear()
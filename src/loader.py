@@ -1,19 +1,38 @@
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 
 from fastapi import FastAPI
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.application.event_bus import EventBus
+from src.application.ports.cache import Cache
 from src.application.ports.clock import Clock
 from src.application.ports.container import Container
-from src.application.unit_of_work import UnitOfWork
+from src.application.unit_of_work import ReadOnlyUnitOfWork, UnitOfWork
+from src.application.use_cases.single_flight import SingleFlight
 from src.config import settings
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.adapters.coarse_clock import CoarseClock
 from src.infrastructure.adapters.dict_container import DictContainer
+from src.infrastructure.adapters.redis_cache import RedisCache
 from src.infrastructure.adapters.utc_clock import UTCClock
+from src.infrastructure.event_codecs import EventCodecRegistry
+from src.infrastructure.in_memory_event_bus import InMemoryEventBus
+from src.infrastructure.inbox import Inbox
+from src.infrastructure.outbox_relay import OutboxRelay
 from src.infrastructure.rabbitmq_event_bus import RabbitMQEventBus
-from src.infrastructure.sqlalchemy.setup import new_session
-from src.infrastructure.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.sqlalchemy.pool import pool_stats, prewarm
+from src.infrastructure.sqlalchemy.setup import (
+    engine,
+    new_replica_session,
+    new_session,
+    replica_engine,
+)
+from src.infrastructure.unit_of_work import SQLAlchemyReadOnlyUnitOfWork, SQLAlchemyUnitOfWork
 from src.presentation import api
 
 logger = logging.getLogger(__name__)
@@ -23,6 +42,9 @@ class Loader:
     def __init__(self):
         self.container: Container = DictContainer()
         logger.debug("Container created")
+        self.event_codecs = EventCodecRegistry()
+        # The replica engine is the primary one when no replica is configured.
+        self.engines = [engine] if replica_engine is engine else [engine, replica_engine]
 
     @asynccontextmanager
     async def lifespan(self, app: FastAPI) -> AsyncGenerator[None, None]:
@@ -35,14 +57,26 @@ class Loader:
 
     async def startup(self):
         logger.info("Application startup initialized")
+        await self.setup_event_codecs()
         await self.setup_event_bus()
+        await self.setup_database_session()
+        await self.setup_database_pool()
         await self.setup_unit_of_work()
+        await self.setup_outbox_relay()
         await self.setup_clock()
+        await self.setup_cache()
+        await self.setup_single_flight()
+        self.container.freeze()
+        logger.debug("Container frozen")
         logger.info("Application startup completed")
 
     async def shutdown(self):
         logger.info("Application cleanup initialized")
+        await self.cleanup_outbox_relay()
         await self.cleanup_event_bus()
+        await self.container.dispose()
+        logger.debug("Container disposed")
+        await self.cleanup_database_pool()
         logger.info("Application cleanup completed")
 
     async def setup_fastapi(self, app: FastAPI) -> None:
@@ -56,20 +90,40 @@ class Loader:
         self.container.register_singleton(FastAPI, app)
         logger.debug("FastAPI registered")
 
+    async def setup_event_codecs(self) -> None:
+        self.container.register_singleton(EventCodecRegistry, self.event_codecs)
+        logger.debug("EventCodecRegistry registered")
+
     async def setup_event_bus(self) -> None:
-        self.container.register_singleton(
-            EventBus, 
-            RabbitMQEventBus(
+        event_bus: EventBus
+        if settings.EVENT_BUS == "in_memory":
+            event_bus = InMemoryEventBus(
+                self.container,
+                capacity=settings.IN_MEMORY_EVENT_BUS_CAPACITY,
+                event_codecs=self.event_codecs
+            )
+        else:
+            event_bus = RabbitMQEventBus(
                 self.container, 
                 settings.RABBITMQ_USER, 
                 settings.RABBITMQ_PASSWORD,
                 settings.RABBITMQ_HOST,
-                settings.RABBITMQ_PORT
+                settings.RABBITMQ_PORT,
+                publish_batch_size=settings.RABBITMQ_PUBLISH_BATCH_SIZE,
+                publish_linger=settings.RABBITMQ_PUBLISH_LINGER,
+                inbox=Inbox(
+                    new_session,
+                    cache_size=settings.INBOX_CACHE_SIZE,
+                    cache_ttl=settings.INBOX_CACHE_TTL
+                ) if settings.INBOX_ENABLED else None,
+                partition_buckets=settings.RABBITMQ_PARTITION_BUCKETS,
+                event_codecs=self.event_codecs
             )
-        )
+
+        self.container.register_singleton(EventBus, event_bus)
         logger.debug(
             "EventBus registered",
-            extra={"implementation": RabbitMQEventBus.__name__}
+            extra={"implementation": type(event_bus).__name__}
         )
         event_bus = await self.container.resolve(EventBus)
         await event_bus.start()
@@ -81,22 +135,117 @@ class Loader:
         logger.debug("EventBus stopped")
 
     async def setup_clock(self) -> None:
-        self.container.register_singleton(Clock, UTCClock())
+        clock = UTCClock()
+        self.container.register_singleton(Clock, clock)
         logger.debug(
             "Clock registered",
             extra={"implementation": UTCClock.__name__}
         )
 
-    async def setup_unit_of_work(self) -> None:
-        self.container.register_sync_factory(
-            UnitOfWork, 
-            lambda: SQLAlchemyUnitOfWork(new_session)
+        # Events are created on hot paths, their timestamps need not be precise.
+        DomainEvent.use_clock(CoarseClock(clock, settings.EVENT_CLOCK_RESOLUTION).now)
+        logger.debug(
+            "DomainEvent clock set",
+            extra={"implementation": CoarseClock.__name__}
+        )
+
+    async def setup_database_session(self) -> None:
+        async def scoped_session() -> AsyncGenerator[AsyncSession, None]:
+            async with new_session() as session:
+                yield session
+
+        # Shared by everything resolved within a request or event handler.
+        self.container.register_scoped(AsyncSession, scoped_session)
+        logger.debug("AsyncSession registered")
+
+        self.container.register_singleton(async_sessionmaker, new_session)
+        logger.debug("async_sessionmaker registered")
+
+    async def setup_database_pool(self) -> None:
+        # Connections are opened now instead of by the first requests after a deploy.
+        await asyncio.gather(
+            *(prewarm(engine, settings.POSTGRES_POOL_PREWARM) for engine in self.engines)
         )
+        logger.debug(
+            "Database pool prewarmed",
+            extra={"stats": [asdict(pool_stats(engine)) for engine in self.engines]}
+        )
+
+    async def cleanup_database_pool(self) -> None:
+        logger.info(
+            "Database pool stats",
+            extra={"stats": [asdict(pool_stats(engine)) for engine in self.engines]}
+        )
+        await asyncio.gather(*(engine.dispose() for engine in self.engines))
+        logger.debug("Database pool disposed")
+
+    async def setup_cache(self) -> None:
+        async def redis_cache() -> AsyncGenerator[Cache, None]:
+            redis = Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                password=settings.REDIS_PASSWORD,
+                db=settings.REDIS_DB,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+            )
+            yield RedisCache(
+                redis,
+                local_max_size=settings.CACHE_LOCAL_MAX_SIZE,
+                local_ttl=settings.CACHE_LOCAL_TTL
+            )
+            await redis.aclose()
+
+        # Connected on first use and closed on shutdown by the container.
+        self.container.register_lazy_singleton(Cache, redis_cache)
+        logger.debug(
+            "Cache registered",
+            extra={"implementation": RedisCache.__name__}
+        )
+
+    async def setup_single_flight(self) -> None:
+        # Shared by all coalescing use cases of the worker.
+        self.container.register_singleton(SingleFlight, SingleFlight())
+        logger.debug("SingleFlight registered")
+
+    async def setup_unit_of_work(self) -> None:
+        self.container.register_class(UnitOfWork, SQLAlchemyUnitOfWork)
         logger.debug(
             "UnitOfWork registered",
             extra={"implementation": SQLAlchemyUnitOfWork.__name__}
         )
 
-    async def get_container(self) -> Container:
-        return self.container
+        self.container.register_sync_factory(
+            ReadOnlyUnitOfWork,
+            lambda: SQLAlchemyReadOnlyUnitOfWork(new_replica_session)
+        )
+        logger.debug(
+            "ReadOnlyUnitOfWork registered",
+            extra={"implementation": SQLAlchemyReadOnlyUnitOfWork.__name__}
+        )
+
+    async def setup_outbox_relay(self) -> None:
+        self.container.register_singleton(
+            OutboxRelay,
+            OutboxRelay(
+                new_session,
+                await self.container.resolve(EventBus),
+                self.event_codecs,
+                batch_size=settings.OUTBOX_BATCH_SIZE,
+                poll_interval=settings.OUTBOX_POLL_INTERVAL
+            )
+        )
+        logger.debug("OutboxRelay registered")
+        outbox_relay = await self.container.resolve(OutboxRelay)
+        await outbox_relay.start()
+        logger.debug("OutboxRelay started")
+
+    async def cleanup_outbox_relay(self) -> None:
+        outbox_relay = await self.container.resolve(OutboxRelay)
+        await outbox_relay.stop()
+        logger.debug("OutboxRelay stopped")
+
+    async def get_container(self) -> AsyncGenerator[Container, None]:
+        # Every request gets its own scope, disposed after the response is sent.
+        async with self.container.scope() as container:
+            yield container
     
\ No newline at end of file
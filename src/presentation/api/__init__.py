@@ -1,6 +1,8 @@
-from . import dependency_injection, routers
+from . import conditional, dependency_injection, responses, routers
 
 __all__ = [
+    "conditional",
     "dependency_injection",
+    "responses",
     "routers",
 ]
@@ -0,0 +1,74 @@
+import uuid
+from collections.abc import Awaitable, Callable
+
+from fastapi import HTTPException, Request, Response
+
+from src.application.ports import container
+from src.presentation.api.dependency_injection import Container
+
+type VersionLookup = Callable[[container.Container, uuid.UUID], Awaitable[int | None]]
+
+
+def entity_etag(id: uuid.UUID, version: int) -> str:
+    """Strong ETag of an entity, which changes with every new version."""
+    return f'"{id.hex}-{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Checks an If-None-Match header against the ETag with the weak comparison
+    RFC 9110 requires for it, so `W/` prefixes are ignored.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_get(
+        version_of: VersionLookup,
+        cache_control: str | None = None,
+        id_parameter: str = "id"
+    ) -> Callable[..., Awaitable[None]]:
+    """
+    Returns a dependency for routes of a single entity, identified by the
+    `id_parameter` path parameter, that answers conditional GETs.
+
+    `version_of` looks the version up without loading the entity, e.g. with
+    Repository.get_version. When the ETag derived from the id and version
+    matches If-None-Match, the request is answered with 304 before the
+    endpoint runs. Otherwise the ETag is added to the response. `cache_control`
+    is sent with both, e.g. "private, no-cache" to make clients revalidate
+    every time.
+
+    @router.get("/users/{id}", dependencies=[Depends(conditional_get(user_version))])
+    """
+
+    async def dependency(request: Request, response: Response, container: Container) -> None:
+        headers: dict[str, str] = {}
+        if cache_control is not None:
+            headers["Cache-Control"] = cache_control
+
+        id = _parse_id(request.path_params[id_parameter])
+        if id is not None:
+            version = await version_of(container, id)
+            if version is not None:
+                headers["ETag"] = entity_etag(id, version)
+                if etag_matches(request.headers.get("If-None-Match"), headers["ETag"]):
+                    raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+
+    return dependency
+
+
+def _parse_id(value: object) -> uuid.UUID | None:
+    # Invalid ids are left to the endpoint to reject.
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
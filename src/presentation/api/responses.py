@@ -0,0 +1,165 @@
+import functools
+import inspect
+from collections.abc import Callable, Sequence
+from typing import Any, cast, get_args, get_origin
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from src.presentation.api.schemas.base_schema import BaseSchema
+
+# Name of the parameter the response FastAPI injects into wrapped endpoints is passed as.
+_RESPONSE_PARAMETER = "_schema_route_response"
+
+
+@functools.cache
+def _list_serializer(schema: type[BaseSchema]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[schema])
+
+
+def render_json(
+        content: Any,
+        by_alias: bool = True,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False
+    ) -> bytes:
+    """
+    Serializes content to JSON bytes with the pydantic serializers of its
+    schemas, without building intermediate dictionaries. Lists of one schema
+    are serialized by a cached list serializer in a single call. Fields are
+    named by their aliases by default, like in FastAPI responses.
+    """
+    if isinstance(content, BaseSchema):
+        return content.__pydantic_serializer__.to_json(
+            content,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+    if _is_schema_list(content):
+        items = cast(Sequence[BaseSchema], content)
+        schema = type(items[0])
+        if all(type(item) is schema for item in items):
+            return _list_serializer(schema).dump_json(
+                list(items),
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
+    return to_json(content, by_alias=by_alias, exclude_none=exclude_none)
+
+
+class SchemaResponse(JSONResponse):
+    """
+    JSON response that renders BaseSchema models, lists of them and plain
+    values with render_json instead of jsonable_encoder and json.dumps.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
+class SchemaRoute(APIRoute):
+    """
+    Route that renders BaseSchema results straight to JSON bytes, so FastAPI
+    neither validates them against the response model again nor converts them
+    to dictionaries. The response model is still documented.
+
+    Only results of exactly the response model, or lists of it, are rendered
+    directly, with the by_alias and exclude_* options of the route. Anything
+    else goes through FastAPI's response model serialization, e.g. subclasses
+    with fields the response model leaves out, or routes with
+    response_model_include or response_model_exclude.
+
+    Status code, headers and cookies set on the response FastAPI injects into
+    endpoints and dependencies are applied to such results as well.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        # The route is read by the endpoint only once it is initialized.
+        super().__init__(path, _respond_with_schema(endpoint, self), **kwargs)
+
+
+def _respond_with_schema(endpoint: Callable[..., Any], route: APIRoute) -> Callable[..., Any]:
+    def respond(result: Any, response: Response) -> Any:
+        if not _renders_directly(route, result):
+            return result
+        content = render_json(
+            result,
+            by_alias=route.response_model_by_alias,
+            exclude_unset=route.response_model_exclude_unset,
+            exclude_defaults=route.response_model_exclude_defaults,
+            exclude_none=route.response_model_exclude_none,
+        )
+        schema_response = Response(
+            content,
+            status_code=response.status_code or route.status_code or 200,
+            media_type=SchemaResponse.media_type,
+        )
+        schema_response.headers.raw.extend(response.headers.raw)
+        return schema_response
+
+    # The wrapper takes the parameters of the endpoint and the injected response.
+    signature = inspect.signature(endpoint)
+    if _RESPONSE_PARAMETER in signature.parameters:
+        # Already wrapped, routes are created again when their router is included.
+        return endpoint
+    parameters = list(signature.parameters.values())
+    position = len(parameters)
+    if parameters and parameters[-1].kind is inspect.Parameter.VAR_KEYWORD:
+        position -= 1
+    parameters.insert(position, inspect.Parameter(
+        _RESPONSE_PARAMETER, inspect.Parameter.KEYWORD_ONLY, annotation=Response
+    ))
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_endpoint(*args: Any, **kwargs: Any) -> Any:
+            response = kwargs.pop(_RESPONSE_PARAMETER)
+            return respond(await endpoint(*args, **kwargs), response)
+        wrapper: Callable[..., Any] = async_endpoint
+    else:
+        @functools.wraps(endpoint)
+        def sync_endpoint(*args: Any, **kwargs: Any) -> Any:
+            response = kwargs.pop(_RESPONSE_PARAMETER)
+            return respond(endpoint(*args, **kwargs), response)
+        wrapper = sync_endpoint
+
+    wrapper.__signature__ = signature.replace(parameters=parameters)  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _renders_directly(route: APIRoute, result: object) -> bool:
+    """
+    Checks if serializing the result with the serializer of its own type gives
+    the same fields as the response model of the route.
+    """
+    if route.response_model_include is not None or route.response_model_exclude is not None:
+        return False
+
+    model: Any = route.response_model
+    if isinstance(result, BaseSchema):
+        return model is None or type(result) is model
+    if not _is_schema_list(result):
+        return False
+
+    items = cast(Sequence[BaseSchema], result)
+    schema = type(items[0])
+    if model is not None and (
+        get_origin(model) not in (list, Sequence) or get_args(model) != (schema,)
+    ):
+        return False
+    return all(type(item) is schema for item in items)
+
+
+def _is_schema_list(content: object) -> bool:
+    if not isinstance(content, list | tuple):
+        return False
+    items = cast(Sequence[object], content)
+    return bool(items) and isinstance(items[0], BaseSchema)
@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
+from src.presentation.api.responses import SchemaResponse
+
 from . import system
 
-router = APIRouter()
+router = APIRouter(default_response_class=SchemaResponse)
 router.include_router(system.router)
@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
-router = APIRouter()
+from src.presentation.api.responses import SchemaRoute
+
+router = APIRouter(route_class=SchemaRoute)
 
 
 @router.get("/ping")
@@ -1,3 +1,27 @@
+import os
+
+# Settings are read from the environment on import. Unit tests do not talk to
+# real services, so placeholders are enough when no .env file is present.
+_TEST_ENVIRONMENT = {
+    "DEBUG": "false",
+    "LOG_LEVEL": "INFO",
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "postgres",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "postgres",
+    "RABBITMQ_USER": "guest",
+    "RABBITMQ_PASSWORD": "guest",
+    "RABBITMQ_HOST": "localhost",
+    "RABBITMQ_PORT": "5672",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_PASSWORD": "redis",
+    "REDIS_DB": "0",
+}
+
+for name, value in _TEST_ENVIRONMENT.items():
+    os.environ.setdefault(name, value)
 
 
 # @pytest.fixture
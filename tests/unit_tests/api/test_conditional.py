@@ -0,0 +1,59 @@
+import uuid
+from typing import Any
+
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.presentation.api.conditional import conditional_get, entity_etag
+from src.presentation.api.dependency_injection import get_container
+from src.presentation.api.responses import SchemaResponse, SchemaRoute
+from src.presentation.api.schemas.base_schema import BaseSchema
+
+
+class UserSchema(BaseSchema):
+    id: uuid.UUID
+    version: int
+
+
+def test_conditional_get_answers_not_modified_before_endpoint():
+    versions = {uuid.uuid4(): 3}
+    loaded: list[uuid.UUID] = []
+    containers: list[Any] = []
+
+    async def user_version(container: Any, id: uuid.UUID) -> int | None:
+        containers.append(container)
+        return versions.get(id)
+
+    router = APIRouter(route_class=SchemaRoute, default_response_class=SchemaResponse)
+
+    @router.get(
+        "/users/{id}",
+        dependencies=[Depends(conditional_get(user_version, cache_control="private, no-cache"))],
+    )
+    async def get_user(id: uuid.UUID) -> UserSchema:
+        loaded.append(id)
+        return UserSchema(id=id, version=versions[id])
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_container] = object
+    client = TestClient(app)
+    id = next(iter(versions))
+
+    response = client.get(f"/users/{id}")
+    assert response.status_code == 200
+    assert response.headers["ETag"] == entity_etag(id, 3)
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert loaded == [id]
+    assert len(containers) == 1
+
+    response = client.get(f"/users/{id}", headers={"If-None-Match": f'W/{entity_etag(id, 3)}'})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == entity_etag(id, 3)
+    assert loaded == [id]
+
+    versions[id] = 4
+    response = client.get(f"/users/{id}", headers={"If-None-Match": entity_etag(id, 3)})
+    assert response.status_code == 200
+    assert response.json() == {"id": str(id), "version": 4}
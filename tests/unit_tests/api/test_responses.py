@@ -0,0 +1,88 @@
+import uuid
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import Field
+
+from src.presentation.api.responses import SchemaResponse, SchemaRoute, render_json
+from src.presentation.api.schemas.base_schema import BaseSchema
+
+
+class ItemSchema(BaseSchema):
+    id: uuid.UUID
+    name: str
+
+
+class PublicUserSchema(BaseSchema):
+    user_id: int = Field(serialization_alias="userId")
+
+
+class PrivateUserSchema(PublicUserSchema):
+    email: str
+
+
+def test_schema_route_renders_schemas_directly():
+    items = [ItemSchema(id=uuid.uuid4(), name=f"item {i}") for i in range(3)]
+    router = APIRouter(route_class=SchemaRoute, default_response_class=SchemaResponse)
+
+    @router.get("/items")
+    async def list_items() -> list[ItemSchema]:
+        return items
+
+    @router.post("/items", status_code=201)
+    def create_item() -> ItemSchema:
+        return items[0]
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    response = client.get("/items")
+    assert response.status_code == 200
+    assert response.content == render_json(items)
+    assert response.json() == [{"id": str(item.id), "name": item.name} for item in items]
+
+    response = client.post("/items")
+    assert response.status_code == 201
+    assert response.json() == {"id": str(items[0].id), "name": "item 0"}
+
+    # The response model is still documented.
+    schema = app.openapi()["paths"]["/items"]["get"]["responses"]["200"]
+    assert schema["content"]["application/json"]["schema"]["items"] == {
+        "$ref": "#/components/schemas/ItemSchema"
+    }
+
+
+def test_schema_route_keeps_response_model_contract():
+    """
+    Checks if results are serialized like FastAPI does it: fields missing from
+    the response model are left out, aliases are used and the response model
+    options of the route are applied.
+    """
+    router = APIRouter(route_class=SchemaRoute, default_response_class=SchemaResponse)
+    user = PrivateUserSchema(user_id=1, email="user@example.com")
+
+    @router.get("/subclass", response_model=PublicUserSchema)
+    async def subclass() -> BaseSchema:
+        return user
+
+    @router.get("/subclasses", response_model=list[PublicUserSchema])
+    async def subclasses() -> list[BaseSchema]:
+        return [user]
+
+    @router.get("/alias")
+    async def alias() -> PublicUserSchema:
+        return PublicUserSchema(user_id=1)
+
+    @router.get("/exclude", response_model_exclude={"user_id"})
+    async def exclude() -> PublicUserSchema:
+        return PublicUserSchema(user_id=1)
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    assert client.get("/subclass").json() == {"userId": 1}
+    assert client.get("/subclasses").json() == [{"userId": 1}]
+    assert client.get("/alias").content == b'{"userId":1}'
+    assert client.get("/exclude").json() == {}
@@ -0,0 +1,211 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any, Self
+
+from src.infrastructure.adapters.redis_cache import (
+    _RELEASE_LOCK_SCRIPT,  # type: ignore
+    _SET_IF_NEWER_SCRIPT,  # type: ignore
+    RedisCache,
+)
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._commands: list[Callable[[], Any]] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        pass
+
+    def set(self, key: str, value: bytes, px: int | None = None) -> None:
+        def set() -> bool:
+            self._redis.data[key] = value
+            self._redis.expirations[key] = px
+            return True
+        self._commands.append(set)
+
+    def queue(self, command: Callable[[], Any]) -> None:
+        self._commands.append(command)
+
+    async def execute(self) -> list[Any]:
+        self._redis.round_trips += 1
+        return [command() for command in self._commands]
+
+
+class FakeRedis:
+    """Keeps data in dicts and counts round trips, keys never expire."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes | str] = {}
+        self.expirations: dict[str, int | None] = {}
+        self.round_trips = 0
+        self.transactions: list[bool] = []
+
+    async def get(self, key: str) -> bytes | str | None:
+        self.round_trips += 1
+        return self.data.get(key)
+
+    async def mget(self, keys: list[str]) -> list[bytes | str | None]:
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+
+    async def set(
+            self, key: str, value: bytes | str, px: int | None = None, nx: bool = False
+        ) -> bool:
+        self.round_trips += 1
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        self.expirations[key] = px
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        self.round_trips += 1
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def register_script(self, script: str) -> "FakeScript":
+        return FakeScript(self, script)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        self.transactions.append(transaction)
+        return FakePipeline(self)
+
+
+class FakeScript:
+    """Emulates the scripts of the cache with the same semantics."""
+
+    def __init__(self, redis: FakeRedis, script: str) -> None:
+        self._redis = redis
+        self._script = script
+
+    async def __call__(
+            self, keys: list[str], args: list[Any], client: FakePipeline | None = None
+        ) -> Any:
+        def run() -> int:
+            if self._script == _RELEASE_LOCK_SCRIPT:
+                return self._release_lock(*keys, *args)
+            if self._script == _SET_IF_NEWER_SCRIPT:
+                return self._set_if_newer(*keys, *args)
+            return self._invalidate_version(*keys, *args)
+
+        if client is not None:
+            client.queue(run)
+            return client
+        self._redis.round_trips += 1
+        return run()
+
+    def _release_lock(self, key: str, token: str) -> int:
+        if self._redis.data.get(key) == token:
+            del self._redis.data[key]
+            return 1
+        return 0
+
+    def _set_if_newer(self, key: str, version_key: str, version: int, value: bytes, px: int) -> int:
+        current = self._redis.data.get(version_key)
+        if current is not None and int(current) > version:
+            return 0
+        self._redis.data[key] = value
+        self._redis.data[version_key] = str(version)
+        self._redis.expirations[key] = px
+        return 1
+
+    def _invalidate_version(self, key: str, version_key: str, version: int, _: int) -> int:
+        self._redis.data.pop(key, None)
+        current = self._redis.data.get(version_key)
+        if current is None or int(current) < version:
+            self._redis.data[version_key] = str(version)
+        return 1
+
+
+def new_cache(redis: FakeRedis, **kwargs: Any) -> RedisCache:
+    return RedisCache(redis, **kwargs)
+
+
+async def test_local_layer_serves_repeated_reads():
+    redis = FakeRedis()
+    cache = new_cache(redis)
+    await cache.set("user:1", b"alice")
+    redis.round_trips = 0
+
+    assert await cache.get("user:1") == b"alice"
+    assert redis.round_trips == 0
+
+
+async def test_bulk_operations_take_one_round_trip():
+    redis = FakeRedis()
+    cache = new_cache(redis, local_max_size=0)
+
+    await cache.set_many({f"user:{i}": f"{i}".encode() for i in range(10)}, ttl=60)
+    assert redis.round_trips == 1
+    assert redis.transactions == [False]
+    assert set(redis.expirations.values()) == {60_000}
+
+    values = await cache.get_many([f"user:{i}" for i in range(12)])
+    assert redis.round_trips == 2
+    assert values == {f"user:{i}": f"{i}".encode() for i in range(10)}
+
+
+async def test_local_layer_evicts_least_recently_used():
+    redis = FakeRedis()
+    cache = new_cache(redis, local_max_size=2)
+    await cache.set_many({"a": b"1", "b": b"2"})
+    await cache.get("a")
+    await cache.set("c", b"3")
+    redis.round_trips = 0
+
+    await cache.get_many(["a", "b", "c"])
+
+    # Only "b" was evicted and read from Redis.
+    assert redis.round_trips == 1
+
+
+async def test_concurrent_misses_call_factory_once():
+    redis = FakeRedis()
+    cache = new_cache(redis)
+    calls = 0
+
+    async def load() -> bytes:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return b"report"
+
+    values = await asyncio.gather(*(cache.get_or_set("report", load) for _ in range(100)))
+
+    assert calls == 1
+    assert values == [b"report"] * 100
+    assert "report:lock" not in redis.data
+
+
+async def test_miss_waits_for_lock_held_by_other_process():
+    redis = FakeRedis()
+    redis.data["report:lock"] = "other-process"
+    cache = new_cache(redis, lock_poll_interval=0.001)
+
+    async def load() -> bytes:
+        raise AssertionError("The factory must not be called while another process loads.")
+
+    async def other_process() -> None:
+        await asyncio.sleep(0.01)
+        redis.data["report"] = b"report"
+
+    value, _ = await asyncio.gather(cache.get_or_set("report", load), other_process())
+
+    assert value == b"report"
+
+
+async def test_older_version_is_not_set_after_invalidation():
+    redis = FakeRedis()
+    cache = new_cache(redis)
+    await cache.set_many_if_newer({"user:1": (1, b"v1")}, ttl=60)
+
+    await cache.invalidate_versions({"user:1": 2}, ttl=60)
+    await cache.set_many_if_newer({"user:1": (1, b"v1")}, ttl=60)
+    assert await cache.get("user:1") is None
+
+    await cache.set_many_if_newer({"user:1": (2, b"v2")}, ttl=60)
+    assert await cache.get("user:1") == b"v2"
+    assert redis.data["user:1:version"] == "2"
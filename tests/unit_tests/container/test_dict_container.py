@@ -0,0 +1,176 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from src.application.exceptions.container_exceptions import (
+    AsyncResolutionRequiredError,
+    CircularDependencyError,
+    ContainerFrozenError,
+    InterfaceNotRegisteredError,
+    ScopeNotEnteredError,
+)
+from src.infrastructure.adapters.dict_container import DictContainer
+
+
+class Connection:
+    def __init__(self) -> None:
+        self.closed = False
+
+
+class Settings:
+    pass
+
+
+class Repository:
+    def __init__(self, connection: Connection, settings: Settings | None = None) -> None:
+        self.connection = connection
+        self.settings = settings
+
+
+class Service:
+    def __init__(self, repository: Repository, settings: Settings) -> None:
+        self.repository = repository
+        self.settings = settings
+
+
+class Ping:
+    def __init__(self, pong: "Pong") -> None:
+        self.pong = pong
+
+
+class Pong:
+    def __init__(self, ping: Ping) -> None:
+        self.ping = ping
+
+
+async def test_scoped_instance_is_shared_within_scope_and_disposed():
+    connections: list[Connection] = []
+
+    async def new_connection() -> AsyncGenerator[Connection, None]:
+        connection = Connection()
+        connections.append(connection)
+        yield connection
+        connection.closed = True
+
+    container = DictContainer()
+    container.register_scoped(Connection, new_connection)
+
+    async with container.scope() as scope:
+        first = await scope.resolve(Connection)
+        assert await scope.resolve(Connection) is first
+        assert not first.closed
+
+    async with container.scope() as scope:
+        second = await scope.resolve(Connection)
+
+    assert first is not second
+    assert [connection.closed for connection in connections] == [True, True]
+
+
+async def test_scoped_instance_outside_scope_raises_error():
+    async def new_connection() -> AsyncGenerator[Connection, None]:
+        yield Connection()
+
+    container = DictContainer()
+    container.register_scoped(Connection, new_connection)
+
+    with pytest.raises(ScopeNotEnteredError):
+        await container.resolve(Connection)
+
+
+async def test_frozen_container_resolves_registrations():
+    async def new_connection() -> AsyncGenerator[Connection, None]:
+        yield Connection()
+
+    container = DictContainer()
+    settings = Settings()
+    container.register_singleton(Settings, settings)
+    container.register_sync_factory(list, list)
+    container.register_scoped(Connection, new_connection)
+    container.freeze()
+
+    assert await container.resolve(Settings) is settings
+    assert container.resolve_sync(Settings) is settings
+    assert container.resolve_sync(list) == []
+    async with container.scope() as scope:
+        assert await scope.resolve(Connection) is await scope.resolve(Connection)
+    with pytest.raises(AsyncResolutionRequiredError):
+        container.resolve_sync(Connection)
+
+
+async def test_frozen_container_rejects_registrations():
+    container = DictContainer()
+    container.freeze()
+
+    with pytest.raises(ContainerFrozenError):
+        container.register_singleton(Settings, Settings())
+
+
+async def test_registered_class_is_autowired():
+    container = DictContainer()
+    settings = Settings()
+    container.register_singleton(Settings, settings)
+    container.register_sync_factory(Connection, Connection)
+    container.register_class(Repository, Repository)
+    container.register_class(Service, Service)
+
+    service = await container.resolve(Service)
+    container.freeze()
+    frozen_service = container.resolve_sync(Service)
+
+    for resolved in (service, frozen_service):
+        assert resolved.settings is settings
+        assert isinstance(resolved.repository.connection, Connection)
+        assert resolved.repository.settings is settings
+
+
+async def test_optional_dependency_defaults_when_not_registered():
+    container = DictContainer()
+    container.register_sync_factory(Connection, Connection)
+    container.register_class(Repository, Repository)
+    container.freeze()
+
+    assert container.resolve_sync(Repository).settings is None
+
+
+async def test_freeze_detects_missing_dependency():
+    container = DictContainer()
+    container.register_class(Repository, Repository)
+
+    with pytest.raises(InterfaceNotRegisteredError):
+        container.freeze()
+
+
+async def test_freeze_detects_circular_dependency():
+    container = DictContainer()
+    container.register_class(Ping, Ping)
+    container.register_class(Pong, Pong)
+
+    with pytest.raises(CircularDependencyError):
+        container.freeze()
+
+
+async def test_lazy_singleton_is_created_once_and_disposed():
+    connections: list[Connection] = []
+
+    async def new_connection() -> AsyncGenerator[Connection, None]:
+        await asyncio.sleep(0.01)
+        connection = Connection()
+        connections.append(connection)
+        yield connection
+        connection.closed = True
+
+    container = DictContainer()
+    container.register_lazy_singleton(Connection, new_connection)
+    container.freeze()
+
+    resolved = await asyncio.gather(*(container.resolve(Connection) for _ in range(500)))
+    async with container.scope() as scope:
+        resolved.append(await scope.resolve(Connection))
+
+    assert len(connections) == 1
+    assert all(connection is connections[0] for connection in resolved)
+
+    await container.dispose()
+    assert connections[0].closed
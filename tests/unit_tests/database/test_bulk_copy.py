@@ -0,0 +1,125 @@
+import enum
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+from psycopg import sql
+from psycopg.postgres import types
+from sqlalchemy import Column, Enum, Float, MetaData, Table, Uuid
+
+from src.infrastructure.sqlalchemy.bulk_copy import copy_rows, upsert_rows
+from tests.unit_tests.users import users
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+readings = Table(
+    "readings",
+    MetaData(),
+    Column("id", Uuid, primary_key=True),
+    Column("value", Float),
+    Column("color", Enum(Color, name="color")),
+)
+
+
+class FakeCopy:
+    def __init__(self) -> None:
+        self.types: list[int] = []
+        self.rows: list[list[Any]] = []
+
+    async def __aenter__(self) -> "FakeCopy":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        pass
+
+    def set_types(self, types: list[int]) -> None:
+        self.types = types
+
+    async def write_row(self, row: list[Any]) -> None:
+        self.rows.append(row)
+
+
+class FakeCursor:
+    def __init__(self, connection: "FakeDriverConnection") -> None:
+        self._connection = connection
+
+    async def __aenter__(self) -> "FakeCursor":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        pass
+
+    async def execute(self, statement: sql.Composable, params: Any = None) -> None:
+        self._connection.statements.append(statement.as_string())
+        self._connection.params.append(params)
+
+    async def fetchall(self) -> list[tuple[str, int]]:
+        return list(self._connection.column_types.items())
+
+    def copy(self, statement: sql.Composable) -> FakeCopy:
+        self._connection.statements.append(statement.as_string())
+        return self._connection.copy
+
+
+class FakeDriverConnection:
+    def __init__(self, column_types: dict[str, int]) -> None:
+        self.column_types = column_types
+        self.statements: list[str] = []
+        self.params: list[Any] = []
+        self.copy = FakeCopy()
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor(self)
+
+
+class FakeSession:
+    def __init__(self, driver_connection: FakeDriverConnection) -> None:
+        self._driver_connection = driver_connection
+
+    async def connection(self) -> "FakeSession":
+        return self
+
+    async def get_raw_connection(self) -> SimpleNamespace:
+        return SimpleNamespace(driver_connection=self._driver_connection)
+
+
+async def test_upsert_copies_into_staging_table_and_merges():
+    rows = [{"id": uuid.uuid4(), "version": 1, "email": f"{i}@example.com"} for i in range(3)]
+    oids = [types["uuid"].oid, types["int4"].oid, types["varchar"].oid]
+    connection = FakeDriverConnection(dict(zip(["id", "version", "email"], oids, strict=True)))
+
+    count = await upsert_rows(FakeSession(connection), users, iter(rows))
+
+    assert count == 3
+    assert connection.copy.types == oids
+    assert connection.copy.rows == [[row["id"], row["version"], row["email"]] for row in rows]
+
+    create, lookup, copy, merge, drop = connection.statements
+    assert "FROM pg_attribute" in lookup
+    assert connection.params[1] == ("users", None)
+    staging = create.split()[3]
+    assert create.startswith(f'CREATE TEMPORARY TABLE {staging} (LIKE "users"')
+    assert copy == f'COPY {staging} ("id", "version", "email") FROM STDIN (FORMAT BINARY)'
+    assert merge.replace(staging, "staging") == (
+        'INSERT INTO "users" ("id", "version", "email") SELECT "id", "version", "email" '
+        'FROM staging ON CONFLICT ("id") '
+        'DO UPDATE SET "version" = EXCLUDED."version", "email" = EXCLUDED."email"'
+    )
+    assert drop == f"DROP TABLE {staging}"
+
+
+async def test_copy_uses_column_types_of_database_and_binds_enums():
+    # As looked up for a float8 and an enum column, sent as text.
+    oids = {"id": types["uuid"].oid, "value": types["float8"].oid, "color": types["text"].oid}
+    rows = [{"id": uuid.uuid4(), "value": 1.5, "color": Color.GREEN}]
+    connection = FakeDriverConnection(oids)
+
+    count = await copy_rows(FakeSession(connection), readings, rows, ["color", "value"])
+
+    assert count == 1
+    assert connection.copy.types == [oids["color"], oids["value"]]
+    assert connection.copy.rows == [["GREEN", 1.5]]
@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+from src.infrastructure.sqlalchemy.pool import MeasuredQueuePool, pool_stats
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_pool_measures_checkouts():
+    pool = MeasuredQueuePool(FakeConnection, pool_size=2, max_overflow=1)
+    engine = SimpleNamespace(pool=pool)
+
+    connections = [pool.connect() for _ in range(3)]
+    stats = pool_stats(engine)
+
+    assert (stats.size, stats.checked_out, stats.overflow, stats.checkouts) == (2, 3, 1, 3)
+    assert stats.max_wait_time <= stats.wait_time
+
+    connections[0].close()
+    assert pool_stats(engine).checked_out == 2
+
+    for connection in connections[1:]:
+        connection.close()
+    assert pool_stats(engine).checked_out == 0
@@ -0,0 +1,62 @@
+import pickle
+import uuid
+from dataclasses import dataclass
+
+from src.domain.aggregates.aggregate import Aggregate
+from src.domain.value_objects.value_object import ValueObject
+
+
+@dataclass(frozen=True, slots=True)
+class Money(ValueObject):
+    amount: int
+    currency: str
+
+
+@dataclass(frozen=True, slots=True)
+class Price(ValueObject):
+    amount: int
+    currency: str
+
+
+@dataclass(frozen=True)
+class Address(ValueObject):
+    city: str
+
+
+class Order(Aggregate):
+    __slots__ = ("total",)
+
+    def __init__(self, id: uuid.UUID, version: int, total: Money) -> None:
+        super().__init__(id, version)
+        self.total = total
+
+
+def test_value_objects_compare_fields_and_cache_hash():
+    money = Money(100, "USD")
+
+    assert money == Money(100, "USD")
+    assert money != Money(100, "EUR")
+    # Values of different types are different even with the same fields.
+    assert money != Price(100, "USD")
+    assert hash(money) == hash(Money(100, "USD"))
+    assert money._hash == hash(money)
+    assert len({money, Money(100, "USD"), Money(200, "USD")}) == 2
+
+
+def test_hashed_value_objects_pickle_without_cached_hash():
+    for value in (Money(100, "USD"), Address("Berlin")):
+        hash(value)
+
+        loaded = pickle.loads(pickle.dumps(value))  # noqa: S301
+
+        assert loaded == value
+        assert not hasattr(loaded, "_hash")
+        assert hash(loaded) == hash(value)
+
+
+def test_aggregates_hash_by_id_and_opt_in_to_slots():
+    id = uuid.uuid4()
+    order = Order(id, 1, Money(100, "USD"))
+
+    assert len({order, Order(id, 2, Money(200, "USD"))}) == 1
+    assert not hasattr(order, "__dict__")
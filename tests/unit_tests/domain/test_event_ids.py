@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.adapters.coarse_clock import CoarseClock
+from src.infrastructure.adapters.utc_clock import UTCClock
+from src.shared.uuid7 import uuid7
+
+
+@dataclass(frozen=True, slots=True)
+class OrderPlaced(DomainEvent):
+    event_name: str = field(init=False, default="order.placed")
+
+
+def test_uuid7_is_time_ordered():
+    ids = [uuid7() for _ in range(10_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert {id.version for id in ids} == {7}
+
+
+def test_events_take_time_from_clock():
+    fixed = datetime(2026, 1, 1, tzinfo=UTC)
+    DomainEvent.use_clock(lambda: fixed)
+    try:
+        first, second = OrderPlaced(), OrderPlaced()
+    finally:
+        DomainEvent.use_clock(UTCClock().now)
+
+    assert first.occured_at == second.occured_at == fixed
+    assert first.event_id < second.event_id
+
+
+def test_coarse_clock_caches_time():
+    clock = CoarseClock(UTCClock(), resolution=60)
+
+    assert clock.now() is clock.now()
@@ -0,0 +1,44 @@
+import asyncio
+
+from src.application.event_bus import SubscriptionStats
+from src.infrastructure.rabbitmq_event_bus import _ConcurrencyLimiter  # type: ignore
+
+
+async def test_in_flight_handlers_are_limited():
+    """
+    Checks if no more than max_in_flight handlers run at once and others wait.
+    """
+    limiter = _ConcurrencyLimiter(SubscriptionStats("queue"), max_in_flight=2)
+    release = asyncio.Event()
+    observed: list[tuple[int, int]] = []
+
+    async def handle() -> None:
+        async with limiter.slot():
+            observed.append((limiter.stats.in_flight, limiter.stats.queued))
+            await release.wait()
+
+    tasks = [asyncio.create_task(handle()) for _ in range(5)]
+    await asyncio.sleep(0)
+
+    assert limiter.stats.in_flight == 2
+    assert limiter.stats.queued == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert max(in_flight for in_flight, _ in observed) == 2
+    assert limiter.stats.processed == 5
+    assert limiter.stats.in_flight == limiter.stats.queued == 0
+
+
+async def test_failed_handlers_are_counted():
+    limiter = _ConcurrencyLimiter(SubscriptionStats("queue"), max_in_flight=None)
+
+    try:
+        async with limiter.slot():
+            raise ValueError("Handler failed")
+    except ValueError:
+        pass
+
+    assert limiter.stats.failed == 1
+    assert limiter.stats.in_flight == 0
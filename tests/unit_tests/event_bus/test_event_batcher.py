@@ -0,0 +1,118 @@
+import asyncio
+from collections.abc import Sequence
+from types import NoneType
+
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.rabbitmq_event_bus import _EventBatcher  # type: ignore
+from src.shared.exceptions import ConflictError
+
+
+async def test_concurrent_publications_are_coalesced():
+    """
+    Checks if events submitted concurrently are flushed in one batch.
+    """
+    batches: list[Sequence[DomainEvent]] = []
+
+    async def flush(events: Sequence[DomainEvent]) -> None:
+        batches.append(events)
+
+    batcher = _EventBatcher(flush, max_size=100, linger=0.01)
+    batcher.start()
+    await asyncio.gather(*(batcher.submit(DomainEvent()) for _ in range(10)))
+    await batcher.stop()
+
+    assert len(batches) == 1
+    assert len(batches[0]) == 10
+
+
+async def test_batch_is_flushed_when_full():
+    """
+    Checks if a full batch is flushed without waiting for linger to pass.
+    """
+    batches: list[Sequence[DomainEvent]] = []
+
+    async def flush(events: Sequence[DomainEvent]) -> None:
+        batches.append(events)
+
+    batcher = _EventBatcher(flush, max_size=5, linger=60)
+    batcher.start()
+    await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(DomainEvent()) for _ in range(10))), 
+        timeout=1
+    )
+    await batcher.stop()
+
+    assert [len(batch) for batch in batches] == [5, 5]
+
+
+async def test_flush_error_is_propagated_to_publishers():
+    """
+    Checks if a broker error is raised in every publisher of the batch.
+    """
+    async def flush(_: Sequence[DomainEvent]) -> None:
+        raise ConnectionError("Broker is unavailable")
+
+    batcher = _EventBatcher(flush, max_size=100, linger=0.01)
+    batcher.start()
+    results = await asyncio.gather(
+        *(batcher.submit(DomainEvent()) for _ in range(3)), return_exceptions=True
+    )
+    await batcher.stop()
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+async def test_stop_flushes_pending_events():
+    """
+    Checks if events waiting for linger are flushed when the batcher stops.
+    """
+    batches: list[Sequence[DomainEvent]] = []
+
+    async def flush(events: Sequence[DomainEvent]) -> None:
+        batches.append(events)
+
+    batcher = _EventBatcher(flush, max_size=100, linger=60)
+    batcher.start()
+    submitted = asyncio.gather(*(batcher.submit(DomainEvent()) for _ in range(3)))
+    await asyncio.sleep(0)
+    await batcher.stop()
+    await submitted
+
+    assert [len(batch) for batch in batches] == [3]
+
+
+async def test_application_exception_is_propagated_to_submitters():
+    """
+    Checks if application exceptions (derived from BaseException) fail the batch
+    without stopping the batcher.
+    """
+    async def flush(events: Sequence[DomainEvent]) -> None:
+        if len(events) == 2:
+            raise ConflictError("Batch handler failed")
+
+    batcher = _EventBatcher(flush, max_size=2, linger=0.01)
+    batcher.start()
+    results = await asyncio.gather(
+        *(batcher.submit(DomainEvent()) for _ in range(3)), return_exceptions=True
+    )
+    await batcher.stop()
+
+    assert [type(result) for result in results] == [ConflictError, ConflictError, NoneType]
+
+
+async def test_outcomes_are_propagated_to_their_submitters():
+    """
+    Checks if a flush returning the outcome of each event fails only the
+    submitters of the failed events.
+    """
+    async def flush(events: Sequence[DomainEvent]) -> list[BaseException | None]:
+        return [ConnectionError("Not confirmed") if i == 1 else None for i in range(len(events))]
+
+    batcher = _EventBatcher(flush, max_size=100, linger=0.01)
+    batcher.start()
+    results = await asyncio.gather(
+        *(batcher.submit(DomainEvent()) for _ in range(3)), return_exceptions=True
+    )
+    await batcher.stop()
+
+    assert [type(result) for result in results] == [NoneType, ConnectionError, NoneType]
@@ -0,0 +1,79 @@
+import json
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+
+from pydantic_core import to_json
+
+from src.domain.events.domain_event import DomainEvent
+from src.domain.value_objects.value_object import ValueObject
+from src.infrastructure.event_codecs import EventCodecRegistry
+
+
+@dataclass(frozen=True, slots=True)
+class Money(ValueObject):
+    amount: int
+    currency: str
+
+
+@dataclass(frozen=True, slots=True)
+class OrderPlaced(DomainEvent):
+    event_name: str = field(init=False, default="order.placed")
+    order_id: uuid.UUID
+    placed_at: datetime
+    total: Money
+    coupon_id: uuid.UUID | None = None
+    item_ids: tuple[uuid.UUID, ...] = ()
+
+
+def make_event() -> OrderPlaced:
+    return OrderPlaced(
+        order_id=uuid.uuid4(),
+        placed_at=datetime.now(UTC),
+        total=Money(amount=100, currency="USD"),
+        item_ids=(uuid.uuid4(), uuid.uuid4()),
+    )
+
+
+def test_event_round_trip():
+    """
+    Checks if decoded event equals to the encoded one, including init=False fields.
+    """
+    codecs = EventCodecRegistry()
+    event = make_event()
+
+    decoded = codecs.decode(OrderPlaced, codecs.encode(event))
+
+    assert decoded == event
+    assert decoded.event_id == event.event_id
+    assert decoded.occured_at == event.occured_at
+    assert isinstance(decoded.item_ids, tuple)
+
+
+def test_encoded_event_matches_asdict_document():
+    """
+    Checks if the wire format stays compatible with `asdict` based serialization.
+    """
+    codecs = EventCodecRegistry()
+    event = make_event()
+
+    assert json.loads(codecs.encode(event)) == json.loads(to_json(asdict(event)))
+
+
+def test_codec_is_compiled_once_per_event_type():
+    codecs = EventCodecRegistry()
+
+    assert codecs.get(OrderPlaced) is codecs.get(OrderPlaced)
+
+
+def test_codec_is_found_by_event_name():
+    """
+    Checks if events saved as dicts (e.g. in the outbox) can be restored by name.
+    """
+    codecs = EventCodecRegistry()
+    event = make_event()
+
+    codec = codecs.get_by_name("order.placed")
+
+    assert codec.event_type is OrderPlaced
+    assert codec.from_dict(codec.to_dict(event)) == event
@@ -0,0 +1,179 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from src.application.event_bus import SubscriptionOptions
+from src.application.exceptions.event_bus_exceptions import EventBusNotStartedError
+from src.application.ports.container import Container
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.adapters.dict_container import DictContainer
+from src.infrastructure.event_codecs import EventCodecRegistry
+from src.infrastructure.in_memory_event_bus import InMemoryEventBus
+
+
+@dataclass(frozen=True, slots=True)
+class UserRegistered(DomainEvent):
+    event_name: str = field(init=False, default="user.registered")
+    email: str
+
+
+@dataclass(frozen=True, slots=True)
+class UserDeleted(DomainEvent):
+    event_name: str = field(init=False, default="user.deleted")
+
+
+@dataclass(frozen=True, slots=True)
+class EmailChanged(DomainEvent):
+    event_name: str = field(init=False, default="user.email_changed")
+    partition_by = "user_id"
+    user_id: int
+    email: str
+
+
+async def test_events_are_routed_by_event_name():
+    received: list[DomainEvent] = []
+
+    async def on_registered(event: UserRegistered, _: Container) -> None:
+        received.append(event)
+
+    event_bus = InMemoryEventBus(DictContainer())
+    event_bus.subscribe(UserRegistered, on_registered)
+    await event_bus.start()
+
+    event = UserRegistered(email="user@example.com")
+    await event_bus.publish_many([event, UserDeleted()])
+    await event_bus.stop()
+
+    assert received == [event]
+    assert received[0] is event
+
+
+async def test_events_are_copied_without_zero_copy():
+    received: list[UserRegistered] = []
+
+    async def on_registered(event: UserRegistered, _: Container) -> None:
+        received.append(event)
+
+    event_bus = InMemoryEventBus(DictContainer(), zero_copy=False)
+    event_bus.subscribe(UserRegistered, on_registered)
+    await event_bus.start()
+
+    event = UserRegistered(email="user@example.com")
+    await event_bus.publish(event)
+    await event_bus.stop()
+
+    assert received[0] is not event
+    assert received[0].event_id == event.event_id
+
+
+async def test_codecs_are_shared_through_given_registry():
+    async def on_registered(_: UserRegistered, __: Container) -> None:
+        pass
+
+    registry = EventCodecRegistry()
+    event_bus = InMemoryEventBus(DictContainer(), event_codecs=registry)
+    event_bus.subscribe(UserRegistered, on_registered)
+
+    assert list(registry._codecs) == [UserRegistered]  # type: ignore
+
+
+async def test_full_queue_applies_backpressure():
+    """
+    Checks if publishing waits while the handler queue is full.
+    """
+    release = asyncio.Event()
+
+    async def on_registered(_: UserRegistered, __: Container) -> None:
+        await release.wait()
+
+    event_bus = InMemoryEventBus(DictContainer())
+    event_bus.subscribe(
+        UserRegistered, on_registered, SubscriptionOptions(prefetch_count=1)
+    )
+    await event_bus.start()
+
+    await event_bus.publish(UserRegistered(email="first@example.com"))
+    await event_bus.publish(UserRegistered(email="second@example.com"))
+    blocked = asyncio.create_task(event_bus.publish(UserRegistered(email="third@example.com")))
+    await asyncio.sleep(0.01)
+
+    assert not blocked.done()
+    assert event_bus.stats()[0].queued == 1
+
+    release.set()
+    await blocked
+    await event_bus.stop()
+
+    assert event_bus.stats()[0].processed == 3
+
+
+async def test_batch_handler_receives_lists():
+    batches: list[list[UserRegistered]] = []
+
+    async def on_registered(events: list[UserRegistered], _: Container) -> None:
+        batches.append(events)
+
+    event_bus = InMemoryEventBus(DictContainer())
+    event_bus.subscribe_batch(UserRegistered, on_registered, max_size=3, max_wait=0.01)
+    await event_bus.start()
+
+    await event_bus.publish_many([UserRegistered(email=f"{i}@example.com") for i in range(7)])
+    await event_bus.stop()
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+
+
+async def test_partitioned_events_keep_order_per_key():
+    received: dict[int, list[str]] = {}
+
+    async def on_email_changed(event: EmailChanged, _: Container) -> None:
+        # Yields to other partitions between the events of the same user.
+        await asyncio.sleep(0)
+        received.setdefault(event.user_id, []).append(event.email)
+
+    event_bus = InMemoryEventBus(DictContainer())
+    event_bus.subscribe(EmailChanged, on_email_changed, SubscriptionOptions(partitions=4))
+    await event_bus.start()
+
+    await event_bus.publish_many([
+        EmailChanged(user_id=user_id, email=f"{i}@example.com")
+        for i in range(10)
+        for user_id in range(8)
+    ])
+    await event_bus.stop()
+
+    assert received == {
+        user_id: [f"{i}@example.com" for i in range(10)] for user_id in range(8)
+    }
+    assert len(event_bus.stats()) == 4
+    assert sum(stats.processed for stats in event_bus.stats()) == 80
+
+
+async def test_publish_before_start_raises_error():
+    event_bus = InMemoryEventBus(DictContainer())
+
+    with pytest.raises(EventBusNotStartedError):
+        await event_bus.publish(UserDeleted())
+
+
+async def test_follow_up_events_published_while_stopping_are_handled():
+    received: list[DomainEvent] = []
+
+    async def on_registered(event: UserRegistered, _: Container) -> None:
+        received.append(event)
+
+    async def on_deleted(_: UserDeleted, __: Container) -> None:
+        await event_bus.publish(UserRegistered(email="follow-up@example.com"))
+
+    event_bus = InMemoryEventBus(DictContainer())
+    event_bus.subscribe(UserRegistered, on_registered)
+    event_bus.subscribe(UserDeleted, on_deleted)
+    await event_bus.start()
+
+    await event_bus.publish(UserDeleted())
+    await event_bus.stop()
+
+    assert [event.email for event in received if isinstance(event, UserRegistered)] == [
+        "follow-up@example.com"
+    ]
@@ -0,0 +1,95 @@
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any, cast
+
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.inbox import Inbox, _SeenEvents, record_current_delivery  # type: ignore
+
+
+class FakeResult:
+    def __init__(self, ids: list[uuid.UUID]) -> None:
+        self._ids = ids
+
+    def scalars(self) -> list[uuid.UUID]:
+        return self._ids
+
+
+class FakeSession:
+    """
+    Session of an inbox table, where `processed` ids were recorded by another
+    worker after they were checked.
+    """
+
+    def __init__(self, processed: set[uuid.UUID]) -> None:
+        self.processed = processed
+        self.inserts: list[list[uuid.UUID]] = []
+
+    async def execute(self, statement: Any) -> FakeResult:
+        if not statement.is_insert:
+            return FakeResult([])
+        ids = [
+            value for value in statement.compile().params.values()
+            if isinstance(value, uuid.UUID)
+        ]
+        self.inserts.append(ids)
+        return FakeResult([id for id in ids if id not in self.processed])
+
+    @asynccontextmanager
+    async def begin(self):
+        yield
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+
+def test_seen_events_are_bounded():
+    """
+    Checks if the least recently added event ids are evicted first.
+    """
+    seen = _SeenEvents(max_size=2, ttl=60)
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    seen.add(first)
+    seen.add(second)
+    seen.add(third)
+
+    assert first not in seen
+    assert second in seen
+    assert third in seen
+
+
+def test_seen_events_expire():
+    seen = _SeenEvents(max_size=10, ttl=0.01)
+    event_id = uuid.uuid4()
+
+    seen.add(event_id)
+    assert event_id in seen
+
+    time.sleep(0.02)
+    assert event_id not in seen
+
+
+async def test_batch_is_handled_again_without_conflicting_events():
+    """
+    Checks if events recorded concurrently by another worker are dropped from
+    the batch while the others are handled again and recorded.
+    """
+    events = [DomainEvent() for _ in range(3)]
+    session = FakeSession({events[1].event_id})
+    inbox = Inbox(cast(Any, lambda: session))
+    handled: list[list[uuid.UUID]] = []
+
+    async def handler(batch: list[DomainEvent]) -> None:
+        handled.append([event.event_id for event in batch])
+        await record_current_delivery(cast(Any, session))
+
+    await inbox.handle("consumer", events, handler)
+
+    ids = [event.event_id for event in events]
+    assert handled == [ids, [ids[0], ids[2]]]
+    # The first insert was rolled back with the handler transaction.
+    assert session.inserts == [ids, [ids[0], ids[2]]]
@@ -0,0 +1,75 @@
+from collections.abc import Sequence
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, cast
+
+from sqlalchemy.dialects import postgresql
+
+from src.application.event_bus import EventBus
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.event_codecs import EventCodecRegistry
+from src.infrastructure.outbox_relay import OutboxRelay
+
+
+class FakeResult:
+    def __init__(self, rows: list[SimpleNamespace]) -> None:
+        self._rows = rows
+
+    def all(self) -> list[SimpleNamespace]:
+        return self._rows
+
+
+class FakeSession:
+    def __init__(self, rows: list[SimpleNamespace]) -> None:
+        self.rows = rows
+        self.statements: list[str] = []
+
+    async def execute(self, statement: Any) -> FakeResult:
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return FakeResult(self.rows)
+
+    @asynccontextmanager
+    async def begin(self):
+        yield
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        return None
+
+
+class FakeEventBus:
+    def __init__(self) -> None:
+        self.published: list[DomainEvent] = []
+
+    async def publish_many(self, events: Sequence[DomainEvent]) -> None:
+        self.published.extend(events)
+
+
+async def test_undecodable_rows_are_dead_lettered():
+    """
+    Checks if a row of an unknown event is set aside while the rest of the
+    batch is published and deleted.
+    """
+    codecs = EventCodecRegistry()
+    event = DomainEvent()
+    payload = codecs.get(DomainEvent).to_dict(event)
+    rows = [
+        SimpleNamespace(id=1, event_name="unknown.event", payload={}),
+        SimpleNamespace(id=2, event_name=event.event_name, payload=payload),
+    ]
+    session = FakeSession(rows)
+    event_bus = FakeEventBus()
+    relay = OutboxRelay(
+        cast(Any, lambda: session), cast(EventBus, event_bus), codecs,
+        batch_size=10, poll_interval=1,
+    )
+
+    assert await relay.relay_batch() == 2
+
+    select, dead_letter, delete = session.statements
+    assert "failed_at IS NULL" in select
+    assert dead_letter.startswith("UPDATE outbox_messages SET failed_at=now()")
+    assert delete.startswith("DELETE FROM outbox_messages")
+    assert event_bus.published == [event]
@@ -0,0 +1,19 @@
+from src.infrastructure.partitioning import bucket_partition, partition_bucket
+
+
+def test_partition_bucket_is_stable():
+    assert partition_bucket("order-1", 64) == partition_bucket("order-1", 64)
+    assert partition_bucket(None, 64) == 0
+
+
+def test_adding_partition_moves_only_part_of_buckets():
+    before = [bucket_partition(bucket, 4) for bucket in range(1024)]
+    after = [bucket_partition(bucket, 5) for bucket in range(1024)]
+
+    moved = [b for b, a in zip(before, after, strict=True) if b != a]
+
+    assert set(before) == {0, 1, 2, 3}
+    assert set(after) == {0, 1, 2, 3, 4}
+    # About 1/5 of the buckets move, all of them to the new partition.
+    assert len(moved) < 1024 / 4
+    assert all(after[bucket] == 4 for bucket in range(1024) if before[bucket] != after[bucket])
@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+
+import pytest
+
+from src.application.event_bus import SubscriptionOptions
+from src.application.exceptions.event_bus_exceptions import EventBusAlreadyStartedError
+from src.application.ports.container import Container
+from src.domain.events.domain_event import DomainEvent
+from src.infrastructure.adapters.dict_container import DictContainer
+from src.infrastructure.rabbitmq_event_bus import RabbitMQEventBus
+
+
+@dataclass(frozen=True, slots=True)
+class EmailChanged(DomainEvent):
+    event_name: str = field(init=False, default="user.email_changed")
+    partition_by = "user_id"
+    user_id: int
+
+
+async def on_email_changed(_: EmailChanged, __: Container) -> None:
+    pass
+
+
+def new_event_bus() -> RabbitMQEventBus:
+    return RabbitMQEventBus(DictContainer(), "guest", "guest", "localhost", 5672)
+
+
+def test_partition_queues_have_single_active_consumer():
+    """
+    Checks if only one consumer across processes receives the messages of a
+    partition, while queues of unpartitioned subscriptions are shared.
+    """
+    event_bus = new_event_bus()
+
+    partitions = event_bus._queues("queue", "user.email_changed", 4)  # type: ignore
+    shared = event_bus._queues("queue", "user.email_changed", None)  # type: ignore
+
+    assert all(queue.arguments["x-single-active-consumer"] for _, queue in partitions)
+    assert "x-single-active-consumer" not in shared[0][1].arguments
+
+
+async def test_subscribe_after_start_raises_error():
+    event_bus = new_event_bus()
+    event_bus._is_started = True  # type: ignore
+
+    with pytest.raises(EventBusAlreadyStartedError):
+        event_bus.subscribe(EmailChanged, on_email_changed, SubscriptionOptions(partitions=4))
@@ -0,0 +1,148 @@
+import json
+import uuid
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+
+from src.application.ports.cache import Cache
+from src.infrastructure.identity_map import IdentityMap
+from src.infrastructure.repositories.cached_repository import CachedRepository, CacheStats
+from src.infrastructure.repositories.sqlalchemy_repository import SQLAlchemyRepository
+from tests.unit_tests.users import FakeSession, User, UserMapper, users
+
+
+class UserSerializer:
+    def dumps(self, aggregate: User) -> bytes:
+        return json.dumps([str(aggregate.id), aggregate.version, aggregate.email]).encode()
+
+    def loads(self, data: bytes) -> User:
+        id, version, email = json.loads(data)
+        return User(uuid.UUID(id), version, email)
+
+
+class FakeCache(Cache):
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.versions: dict[str, int] = {}
+        self.ttls: list[float | None] = []
+
+    async def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        return {key: self.values[key] for key in keys if key in self.values}
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        self.values[key] = value
+        self.ttls.append(ttl)
+
+    async def set_many(self, items: Mapping[str, bytes], ttl: float | None = None) -> None:
+        self.values.update(items)
+        self.ttls.append(ttl)
+
+    async def set_many_if_newer(
+            self,
+            items: Mapping[str, tuple[int, bytes]],
+            ttl: float
+        ) -> None:
+        for key, (version, value) in items.items():
+            if self.versions.get(key, version) <= version:
+                self.values[key] = value
+                self.versions[key] = version
+        self.ttls.append(ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def invalidate_versions(self, versions: Mapping[str, int], ttl: float) -> None:
+        for key, version in versions.items():
+            self.values.pop(key, None)
+            self.versions[key] = max(self.versions.get(key, version), version)
+        self.ttls.append(ttl)
+
+    async def get_or_set(
+            self,
+            key: str,
+            factory: Callable[[], Awaitable[bytes]],
+            ttl: float | None = None
+        ) -> bytes:
+        value = self.values.get(key)
+        if value is None:
+            await self.set(key, await factory(), ttl)
+            value = self.values[key]
+        return value
+
+
+def make_repository(
+        session: FakeSession,
+        cache: FakeCache,
+        stats: CacheStats,
+        callbacks: list[Callable[[], Awaitable[None]]]
+    ) -> CachedRepository[User]:
+    identity_map = IdentityMap()
+    return CachedRepository(
+        SQLAlchemyRepository(session, identity_map, users, User, UserMapper()),
+        identity_map,
+        User,
+        cache,
+        UserSerializer(),
+        callbacks.append,
+        stats,
+        ttl=60,
+    )
+
+
+async def test_reads_through_cache_and_invalidates_after_commit():
+    row = {"id": uuid.uuid4(), "version": 1, "email": "user@example.com"}
+    session = FakeSession([row])
+    cache = FakeCache()
+    stats = CacheStats()
+    callbacks: list[Callable[[], Awaitable[None]]] = []
+
+    user = await make_repository(session, cache, stats, callbacks).get_by_id(row["id"])
+    assert user is not None
+    assert (stats.hits, stats.misses, len(session.statements)) == (0, 1, 1)
+    assert cache.ttls == [60]
+
+    # Another unit of work reads the aggregate, with its version, from the cache.
+    repository = make_repository(session, cache, stats, callbacks)
+    cached = await repository.get_by_id(row["id"])
+    assert cached is not None
+    assert (cached.version, cached.email) == (1, "user@example.com")
+    assert (stats.hits, stats.misses, len(session.statements)) == (1, 1, 1)
+
+    session.rows = []
+    await repository.delete(row["id"])
+
+    # Until the unit of work commits, the entry stays in the cache.
+    assert len(cache.values) == 1
+    for callback in callbacks:
+        await callback()
+    assert cache.values == {}
+
+
+
+async def test_read_racing_with_write_does_not_cache_old_version():
+    """
+    Checks if an aggregate selected before a concurrent write was committed is
+    not cached after the write has invalidated its entry.
+    """
+    row = {"id": uuid.uuid4(), "version": 1, "email": "old@example.com"}
+    # The session keeps returning the row selected before the write.
+    session = FakeSession([row])
+    cache = FakeCache()
+    stats = CacheStats()
+    callbacks: list[Callable[[], Awaitable[None]]] = []
+
+    writer = make_repository(session, cache, stats, callbacks)
+    user = await writer.get_by_id(row["id"])
+    assert user is not None
+    user.email = "new@example.com"
+    await writer.edit(user)
+    for callback in callbacks:
+        await callback()
+
+    stale = await make_repository(session, cache, stats, callbacks).get_by_id(row["id"])
+
+    assert stale is not None
+    assert cache.values == {}
+    assert cache.versions == {f"aggregate:User:{row['id']}": 2}
@@ -0,0 +1,134 @@
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from psycopg.errors import UniqueViolation
+from sqlalchemy.exc import IntegrityError
+
+from src.application.exceptions.repository_exceptions import (
+    AggregateAlreadyExistsError,
+    InvalidCursorError,
+    InvalidOrderingError,
+)
+from src.infrastructure.identity_map import IdentityMap
+from src.infrastructure.repositories.sqlalchemy_repository import SQLAlchemyRepository
+from tests.unit_tests.users import FakeResult, FakeSession, User, UserMapper, users
+
+
+class FakeUniqueViolation(UniqueViolation):
+    def __init__(self, constraint_name: str) -> None:
+        super().__init__(f"duplicate key value violates unique constraint {constraint_name}")
+        self.constraint_name = constraint_name
+
+    @property
+    def diag(self) -> Any:
+        return SimpleNamespace(constraint_name=self.constraint_name)
+
+
+class ViolatingSession(FakeSession):
+    def __init__(self, constraint_name: str) -> None:
+        super().__init__([])
+        self.constraint_name = constraint_name
+
+    async def execute(self, statement: Any, parameters: Any = None) -> FakeResult:
+        await super().execute(statement, parameters)
+        raise IntegrityError("INSERT", parameters, FakeUniqueViolation(self.constraint_name))
+
+
+async def test_get_many_selects_only_unloaded_aggregates_at_once():
+    loaded = User(uuid.uuid4(), 1, "loaded@example.com")
+    rows = [{"id": uuid.uuid4(), "version": 1, "email": f"{i}@example.com"} for i in range(2)]
+    session = FakeSession(rows)
+    identity_map = IdentityMap()
+    repository = SQLAlchemyRepository(session, identity_map, users, User, UserMapper())
+    identity_map.add(loaded, repository)
+
+    aggregates = await repository.get_many([rows[1]["id"], loaded.id, rows[0]["id"]])
+
+    assert [aggregate.id for aggregate in aggregates] == [rows[1]["id"], loaded.id, rows[0]["id"]]
+    assert aggregates[1] is loaded
+    assert len(session.statements) == 1
+    assert "users.id = ANY (%(ids)s::UUID[])" in session.statements[0]
+
+    # Aggregates are now in the identity map and are not selected again.
+    assert await repository.get_by_id(rows[0]["id"]) is aggregates[2]
+    assert len(session.statements) == 1
+
+
+async def test_iterate_yields_untracked_batches():
+    rows = [{"id": uuid.uuid4(), "version": 1, "email": f"{i}@example.com"} for i in range(5)]
+    identity_map = IdentityMap()
+    repository = SQLAlchemyRepository(FakeSession(rows), identity_map, users, User, UserMapper())
+
+    batches = [batch async for batch in repository.iterate(users.c.version == 1, batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [aggregate.id for batch in batches for aggregate in batch] == [row["id"] for row in rows]
+    assert list(identity_map) == []
+
+
+async def test_page_continues_after_cursor():
+    rows = [{"id": uuid.uuid4(), "version": i, "email": f"{i}@example.com"} for i in range(3)]
+    session = FakeSession(rows)
+    repository = SQLAlchemyRepository(
+        session, IdentityMap(), users, User, UserMapper(), sortable_columns=["email"]
+    )
+
+    page = await repository.page(2, order_by="email", descending=True)
+
+    assert [aggregate.id for aggregate in page.items] == [rows[0]["id"], rows[1]["id"]]
+    assert page.next_cursor is not None
+    assert "ORDER BY users.email DESC, users.id DESC" in session.statements[0]
+
+    session.rows = rows[2:]
+    last_page = await repository.page(2, page.next_cursor, order_by="email", descending=True)
+
+    assert [aggregate.id for aggregate in last_page.items] == [rows[2]["id"]]
+    assert last_page.next_cursor is None
+    assert "(users.email, users.id) < (%(param_1)s, %(param_2)s::UUID)" in session.statements[1]
+
+    with pytest.raises(InvalidCursorError):
+        await repository.page(2, page.next_cursor, order_by="email")
+    with pytest.raises(InvalidCursorError):
+        await repository.page(2, "not-a-cursor")
+    with pytest.raises(InvalidOrderingError):
+        await repository.page(2, order_by="version")
+    with pytest.raises(InvalidOrderingError):
+        await repository.page(2, order_by="missing")
+
+
+async def test_add_many_passes_rows_as_executemany_parameters():
+    """
+    Checks if rows are not inlined into one statement, which would hit the
+    bind parameter limit of PostgreSQL for large batches.
+    """
+    aggregates = [User(uuid.uuid4(), 1, f"{i}@example.com") for i in range(3)]
+    session = FakeSession([{"id": user.id} for user in aggregates])
+    identity_map = IdentityMap()
+    repository = SQLAlchemyRepository(session, identity_map, users, User, UserMapper())
+
+    await repository.add_many(aggregates)
+
+    assert session.statements == [
+        "INSERT INTO users (id, version, email) VALUES "
+        "(%(id)s::UUID, %(version)s, %(email)s) RETURNING users.id"
+    ]
+    assert session.parameters == [[UserMapper().to_row(user) for user in aggregates]]
+    assert all(identity_map.get(User, user.id) is user for user in aggregates)
+
+
+async def test_add_many_maps_only_primary_key_violations():
+    aggregates = [User(uuid.uuid4(), 1, "duplicate@example.com")]
+
+    repository = SQLAlchemyRepository(
+        ViolatingSession("users_pkey"), IdentityMap(), users, User, UserMapper()
+    )
+    with pytest.raises(AggregateAlreadyExistsError):
+        await repository.add_many(aggregates)
+
+    repository = SQLAlchemyRepository(
+        ViolatingSession("users_email_key"), IdentityMap(), users, User, UserMapper()
+    )
+    with pytest.raises(IntegrityError):
+        await repository.add_many(aggregates)
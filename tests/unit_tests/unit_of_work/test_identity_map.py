@@ -0,0 +1,36 @@
+import uuid
+
+from src.infrastructure.identity_map import IdentityMap
+from tests.unit_tests.users import User
+
+
+class UserRepository:
+    def snapshot(self, aggregate: User) -> object:
+        return aggregate.email
+
+    async def save_changes(self, changes: list[tuple[User, int]]) -> None:
+        pass
+
+
+def test_loaded_aggregate_is_returned_by_type_and_id():
+    identity_map = IdentityMap()
+    user = User(uuid.uuid4(), 1, "user@example.com")
+    identity_map.add(user, UserRepository())
+
+    assert identity_map.get(User, user.id) is user
+    assert identity_map.get(User, uuid.uuid4()) is None
+
+
+def test_only_changed_aggregates_are_returned_as_changes():
+    identity_map = IdentityMap()
+    repository = UserRepository()
+    unchanged = User(uuid.uuid4(), 1, "unchanged@example.com")
+    edited = User(uuid.uuid4(), 3, "old@example.com")
+    incremented = User(uuid.uuid4(), 5, "incremented@example.com")
+    for user in (unchanged, edited, incremented):
+        identity_map.add(user, repository)
+
+    edited.email = "new@example.com"
+    incremented.increment_version()
+
+    assert identity_map.changes() == {repository: [(edited, 3), (incremented, 5)]}
@@ -0,0 +1,94 @@
+import asyncio
+import uuid
+from dataclasses import dataclass
+
+import pytest
+
+from src.application.use_cases.single_flight import CoalescingUseCase, SingleFlight
+from src.shared.exceptions import NotFoundError
+
+
+@dataclass(frozen=True, slots=True)
+class GetUserInput:
+    user_id: uuid.UUID
+
+
+@dataclass(frozen=True, slots=True)
+class UserOutput:
+    user_id: uuid.UUID
+
+
+class GetUser:
+    def __init__(self, fail_times: int = 0) -> None:
+        self.executions = 0
+        self.fail_times = fail_times
+
+    async def execute(self, data: GetUserInput) -> UserOutput:
+        self.executions += 1
+        await asyncio.sleep(0.01)
+        if self.executions <= self.fail_times:
+            raise NotFoundError(f"User {data.user_id} does not exist.")
+        return UserOutput(data.user_id)
+
+
+class Admin:
+    class GetUser(GetUser):
+        pass
+
+
+async def test_concurrent_equal_calls_share_one_execution():
+    use_case = GetUser()
+    single_flight = SingleFlight()
+    get_user = CoalescingUseCase(use_case, single_flight)
+    first, second = GetUserInput(uuid.uuid4()), GetUserInput(uuid.uuid4())
+
+    outputs = await asyncio.gather(
+        *(get_user.execute(first) for _ in range(100)), get_user.execute(second)
+    )
+
+    assert use_case.executions == 2
+    assert all(output is outputs[0] for output in outputs[:100])
+    assert outputs[100] == UserOutput(second.user_id)
+    stats = single_flight.stats(f"{__name__}.GetUser")
+    assert (stats.executions, stats.coalesced) == (2, 99)
+
+    # Nothing is kept after the execution, later calls execute again.
+    await get_user.execute(first)
+    assert use_case.executions == 3
+
+
+async def test_errors_are_shared_unless_disabled():
+    data = GetUserInput(uuid.uuid4())
+
+    shared = CoalescingUseCase(GetUser(fail_times=1), SingleFlight())
+    results = await asyncio.gather(
+        *(shared.execute(data) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, NotFoundError) for result in results)
+
+    use_case = GetUser(fail_times=1)
+    retrying = CoalescingUseCase(
+        use_case, SingleFlight(), key=lambda data: data.user_id, share_errors=False
+    )
+    results = await asyncio.gather(
+        *(retrying.execute(data) for _ in range(3)), return_exceptions=True
+    )
+    assert isinstance(results[0], NotFoundError)
+    assert results[1:] == [UserOutput(data.user_id)] * 2
+    assert use_case.executions == 3
+
+    with pytest.raises(NotFoundError):
+        await CoalescingUseCase(GetUser(fail_times=1), SingleFlight()).execute(data)
+
+
+async def test_use_cases_with_the_same_class_name_do_not_share_executions():
+    single_flight = SingleFlight()
+    data = GetUserInput(uuid.uuid4())
+    users, admins = GetUser(), Admin.GetUser()
+
+    await asyncio.gather(
+        CoalescingUseCase(users, single_flight).execute(data),
+        CoalescingUseCase(admins, single_flight).execute(data),
+    )
+
+    assert (users.executions, admins.executions) == (1, 1)
@@ -0,0 +1,81 @@
+"""
+Users table, aggregate and mapper, and a fake session returning fixed rows,
+shared by the repository tests.
+"""
+
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, Uuid
+from sqlalchemy.dialects import postgresql
+
+from src.domain.aggregates.aggregate import Aggregate
+
+users = Table(
+    "users",
+    MetaData(),
+    Column("id", Uuid, primary_key=True),
+    Column("version", Integer),
+    Column("email", String(255)),
+)
+
+
+class User(Aggregate):
+    def __init__(self, id: uuid.UUID, version: int, email: str) -> None:
+        super().__init__(id, version)
+        self.email = email
+
+
+class UserMapper:
+    def to_row(self, aggregate: User) -> dict[str, Any]:
+        return {"id": aggregate.id, "version": aggregate.version, "email": aggregate.email}
+
+    def from_row(self, row: Any) -> User:
+        return User(row["id"], row["version"], row["email"])
+
+
+class FakeMappings(list[dict[str, Any]]):
+    def all(self) -> list[dict[str, Any]]:
+        return list(self)
+
+    async def partitions(self) -> AsyncIterator[list[dict[str, Any]]]:
+        for start in range(0, len(self), 2):
+            yield self[start:start + 2]
+
+
+class FakeResult:
+    def __init__(self, rows: list[dict[str, Any]], rowcount: int) -> None:
+        self._rows = rows
+        self.rowcount = rowcount
+        self.closed = False
+
+    def mappings(self) -> FakeMappings:
+        return FakeMappings(self._rows)
+
+    def scalars(self) -> list[Any]:
+        return [row["id"] for row in self._rows]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeSession:
+    """
+    Returns `rows` for every statement, and records the statements compiled
+    for PostgreSQL together with their parameters.
+    """
+
+    def __init__(self, rows: list[dict[str, Any]], rowcount: int = 1) -> None:
+        self.rows = rows
+        self.rowcount = rowcount
+        self.statements: list[str] = []
+        self.parameters: list[Any] = []
+
+    async def execute(self, statement: Any, parameters: Any = None) -> FakeResult:
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        self.parameters.append(parameters)
+        return FakeResult(self.rows, self.rowcount)
+
+    async def stream(self, statement: Any) -> FakeResult:
+        return await self.execute(statement)